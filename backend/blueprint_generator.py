@@ -7,9 +7,13 @@ Integrates with YantraGeometryEngine for accurate hour lines and shadow calculat
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import Circle, Rectangle, Polygon, Arc
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.ticker import MaxNLocator
+import matplotlib.colors as mcolors
 import numpy as np
 from reportlab.lib.pagesizes import A4, A3, A2
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm, inch
 from reportlab.lib import colors
@@ -17,13 +21,33 @@ from reportlab.graphics.shapes import Drawing, Circle as RLCircle, Line, String
 from reportlab.graphics import renderPDF
 import ezdxf
 from ezdxf import units
+from PIL import Image as PILImage
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing as mp
+import atexit
+import itertools
+import logging
+import pickle
 import io
 import base64
 from pathlib import Path
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
 import math
 
+logger = logging.getLogger(__name__)
+
+# Optional rasterizer for pages with dense line work
+try:
+    import datashader as ds
+    import pandas as pd
+    DATASHADER_AVAILABLE = True
+except ImportError:
+    DATASHADER_AVAILABLE = False
+    logger.info("datashader not installed; the 'datashader' renderer falls back to matplotlib")
+
 # Import our comprehensive geometry engine
 try:
     from yantra_geometry import YantraGeometryEngine, Vector3D, YantraPoint
@@ -39,14 +63,234 @@ class DrawingDimension:
     unit: str
     label: str
 
-@dataclass
+# Data window (xmin, xmax, ymin, ymax) for pages without measurable geometry
+DRAWING_WINDOW = (-10, 10, -8, 8)
+
+# Per-primitive drawing style, stored alongside the geometry arrays
+PRIMITIVE_STYLE_DTYPE = np.dtype([
+    ('edgecolor', 'f8', 4),
+    ('facecolor', 'f8', 4),
+    ('linewidth', 'f8'),
+    ('linestyle', 'U8')
+])
+
+@dataclass(slots=True)
 class BlueprintPage:
-    """Represents a single page of the blueprint"""
+    """
+    Represents a single page of the blueprint
+    
+    Circles, rectangles and straight line segments found in elements are also
+    stored as contiguous arrays so renderers can draw them without walking
+    the artist objects:
+        circle_params: (N, 3) centre x, centre y, radius
+        rect_params:   (M, 4) corner x, corner y, width, height
+        line_params:   (K, 4) x0, y0, x1, y1 per segment
+    bbox is the padded (xmin, xmax, ymin, ymax) extent of all drawn geometry
+    and dimension lines, used as the drawing window.
+    """
     title: str
     scale: str
     elements: List
     dimensions: List[DrawingDimension]
     notes: List[str]
+    circle_params: np.ndarray = field(init=False, repr=False)
+    rect_params: np.ndarray = field(init=False, repr=False)
+    line_params: np.ndarray = field(init=False, repr=False)
+    circle_styles: np.ndarray = field(init=False, repr=False)
+    rect_styles: np.ndarray = field(init=False, repr=False)
+    line_styles: np.ndarray = field(init=False, repr=False)
+    bbox: Tuple[float, float, float, float] = field(init=False)
+    
+    def __post_init__(self):
+        circles, rects, lines = [], [], []
+        circle_styles, rect_styles, line_styles = [], [], []
+        other_points = []
+        
+        for element in self.elements:
+            if type(element) is Circle:
+                circles.append((*element.center, element.radius))
+                circle_styles.append(_patch_style(element))
+            elif type(element) is Rectangle:
+                rects.append((element.get_x(), element.get_y(), element.get_width(), element.get_height()))
+                rect_styles.append(_patch_style(element))
+            elif type(element) is Line2D:
+                xs = np.asarray(element.get_xdata(), dtype=float)
+                ys = np.asarray(element.get_ydata(), dtype=float)
+                style = (
+                    mcolors.to_rgba(element.get_color(), element.get_alpha()),
+                    (0.0, 0.0, 0.0, 0.0),
+                    element.get_linewidth(),
+                    element.get_linestyle()
+                )
+                for i in range(len(xs) - 1):
+                    lines.append((xs[i], ys[i], xs[i + 1], ys[i + 1]))
+                    line_styles.append(style)
+            elif isinstance(element, patches.Patch):
+                # Arcs, polygons, arrows: only their extent is needed here
+                other_points.append(element.get_patch_transform().transform(element.get_path().vertices))
+        
+        self.circle_params = np.array(circles, dtype=float).reshape(-1, 3)
+        self.rect_params = np.array(rects, dtype=float).reshape(-1, 4)
+        self.line_params = np.array(lines, dtype=float).reshape(-1, 4)
+        self.circle_styles = np.array(circle_styles, dtype=PRIMITIVE_STYLE_DTYPE)
+        self.rect_styles = np.array(rect_styles, dtype=PRIMITIVE_STYLE_DTYPE)
+        self.line_styles = np.array(line_styles, dtype=PRIMITIVE_STYLE_DTYPE)
+        
+        centers, radii = self.circle_params[:, :2], self.circle_params[:, 2:]
+        corners = self.rect_params[:, :2]
+        points = np.vstack([
+            centers - radii,
+            centers + radii,
+            corners,
+            corners + self.rect_params[:, 2:],
+            self.line_params.reshape(-1, 2),
+            np.array([dim.start_point for dim in self.dimensions] +
+                     [dim.end_point for dim in self.dimensions], dtype=float).reshape(-1, 2),
+            *other_points
+        ])
+        
+        if len(points):
+            (xmin, ymin), (xmax, ymax) = points.min(axis=0), points.max(axis=0)
+            pad = max(0.05 * max(xmax - xmin, ymax - ymin), 0.5)
+            self.bbox = (xmin - pad, xmax + pad, ymin - pad, ymax + pad)
+        else:
+            self.bbox = DRAWING_WINDOW
+
+def _patch_style(patch) -> Tuple:
+    """Style record of a matplotlib patch in PRIMITIVE_STYLE_DTYPE layout"""
+    return (patch.get_edgecolor(), patch.get_facecolor(), patch.get_linewidth(), patch.get_linestyle())
+
+# Element types BlueprintPage stores as arrays; pages made only of these
+# can be drawn natively on the PDF canvas
+PRIMITIVE_ELEMENT_TYPES = (Circle, Rectangle, Line2D)
+
+# Matplotlib line styles as ReportLab dash patterns
+PDF_DASH_PATTERNS = {
+    '--': [4, 2],
+    'dashed': [4, 2],
+    ':': [1, 2],
+    'dotted': [1, 2],
+    '-.': [4, 2, 1, 2],
+    'dashdot': [4, 2, 1, 2]
+}
+
+def _render_page_task(generator: 'YantraBlueprintGenerator', page: 'BlueprintPage', render_dpi: float) -> bytes:
+    """Process pool task: render one page to JPEG bytes"""
+    return generator.render_page_image(page, render_dpi)
+
+# A render worker spends ~1.4 s importing matplotlib, reportlab and numba
+# before its first page, against ~0.2 s to render one, so documents are
+# rendered serially unless they have at least this many figure pages
+PARALLEL_RENDER_MIN_PAGES = 32
+
+# Page-rendering pool, created on first parallel render and reused by every
+# later one so the worker start-up cost (including re-importing the launching
+# script as __mp_main__) is paid once per process
+RENDER_POOL = None
+
+def get_render_pool(max_workers: int) -> ProcessPoolExecutor:
+    global RENDER_POOL
+    if RENDER_POOL is None:
+        # Workers start from a forkserver (or spawn) rather than forking
+        # this possibly threaded server process
+        method = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+        RENDER_POOL = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp.get_context(method))
+    return RENDER_POOL
+
+def _shutdown_render_pool():
+    global RENDER_POOL
+    if RENDER_POOL is not None:
+        RENDER_POOL.shutdown(wait=False, cancel_futures=True)
+        RENDER_POOL = None
+
+atexit.register(_shutdown_render_pool)
+
+# Margins (points) around a native drawing's plot box, left for the y tick
+# labels, bottom for the x tick labels and top for the title
+NATIVE_AXES_MARGINS = (32, 16, 18)
+NATIVE_TICK_SPACING = 28
+
+class NativeDrawing(Flowable):
+    """
+    Flowable that draws a blueprint page's primitives directly on the PDF canvas
+    
+    Lays the page out like render_page_image: title above an equal-aspect
+    plot box with tick-labelled axes (drawing units) and a light grid, so
+    the sheet keeps its metric reference.
+    """
+    
+    def __init__(self, generator, page: 'BlueprintPage', width: float, height: float,
+                 window: Tuple[float, float, float, float]):
+        super().__init__()
+        self.generator = generator
+        self.page = page
+        self.width = width
+        self.height = height
+        self.window = window
+    
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+    
+    def draw(self):
+        canvas = self.canv
+        xmin, xmax, ymin, ymax = self.window
+        left, bottom, top = NATIVE_AXES_MARGINS
+        plot_width = self.width - 2 * left
+        plot_height = self.height - bottom - top
+        
+        # Equal aspect: the plot box shrinks to the window's proportions
+        scale = min(plot_width / (xmax - xmin), plot_height / (ymax - ymin))
+        box_width = (xmax - xmin) * scale
+        box_height = (ymax - ymin) * scale
+        box_x = (self.width - box_width) / 2
+        box_y = bottom + (plot_height - box_height) / 2
+        origin = (box_x - xmin * scale, box_y - ymin * scale)
+        
+        # About one tick per NATIVE_TICK_SPACING points of axis, as matplotlib's 'auto'
+        x_ticks = [
+            t for t in MaxNLocator(nbins=max(1, int(box_width // NATIVE_TICK_SPACING))).tick_values(xmin, xmax)
+            if xmin <= t <= xmax
+        ]
+        y_ticks = [
+            t for t in MaxNLocator(nbins=max(1, int(box_height // NATIVE_TICK_SPACING))).tick_values(ymin, ymax)
+            if ymin <= t <= ymax
+        ]
+        
+        canvas.saveState()
+        
+        # Grid
+        canvas.setLineWidth(0.4)
+        canvas.setStrokeColorRGB(0, 0, 0, alpha=0.3)
+        for t in x_ticks:
+            x = origin[0] + t * scale
+            canvas.line(x, box_y, x, box_y + box_height)
+        for t in y_ticks:
+            y = origin[1] + t * scale
+            canvas.line(box_x, y, box_x + box_width, y)
+        
+        # Axes frame, tick marks and tick labels
+        canvas.setLineWidth(0.5)
+        canvas.setStrokeColor(colors.black)
+        canvas.setFillColor(colors.black)
+        canvas.rect(box_x, box_y, box_width, box_height, stroke=1, fill=0)
+        canvas.setFont('Helvetica', 6)
+        for t in x_ticks:
+            x = origin[0] + t * scale
+            canvas.line(x, box_y, x, box_y - 3)
+            canvas.drawCentredString(x, box_y - 10, f"{t:g}")
+        for t in y_ticks:
+            y = origin[1] + t * scale
+            canvas.line(box_x, y, box_x - 3, y)
+            canvas.drawRightString(box_x - 5, y - 2, f"{t:g}")
+        
+        canvas.setFont('Helvetica', 8)
+        canvas.drawCentredString(self.width / 2, box_y + box_height + 6, self.page.title)
+        
+        clip = canvas.beginPath()
+        clip.rect(box_x, box_y, box_width, box_height)
+        canvas.clipPath(clip, stroke=0, fill=0)
+        self.generator._draw_page_native(canvas, self.page, origin, scale)
+        canvas.restoreState()
 
 class YantraBlueprintGenerator:
     """
@@ -55,11 +299,31 @@ class YantraBlueprintGenerator:
     Generates construction-ready technical drawings with accurate hour lines
     """
     
-    def __init__(self):
+    def __init__(self, renderer: str = 'matplotlib'):
         self.drawing_scale = 1/100  # 1:100 scale default
+        
+        # Line work renderer for figure pages: 'matplotlib' draws vector
+        # collections, 'datashader' rasterizes solid segments per colour
+        if renderer not in ('matplotlib', 'datashader'):
+            raise ValueError(f"Unsupported renderer: {renderer}")
+        if renderer == 'datashader' and not DATASHADER_AVAILABLE:
+            renderer = 'matplotlib'
+        self.renderer = renderer
         self.paper_size = A3
         self.margin = 20 * mm
         
+        # Drawing figures are embedded at a fixed size, so they only need to be
+        # rasterized at the print resolution of that embed, not at 300 dpi of
+        # the full 12x8" figure
+        self.figure_size = (12, 8)  # inches
+        self.image_embed_size = (400, 300)  # points
+        self.print_resolution = 300  # pixels per inch on paper
+        
+        # Figure pages are independent, so documents with at least
+        # PARALLEL_RENDER_MIN_PAGES of them may be rendered in up to this many
+        # worker processes; 1 (the default) always renders serially
+        self.render_workers = 1
+        
         # Initialize the comprehensive geometry engine
         try:
             self.geometry_engine = YantraGeometryEngine()
@@ -89,23 +353,44 @@ class YantraBlueprintGenerator:
             'hour_lines': 'red',
             'seasonal_curves': 'orange'
         }
+        
+        # Blueprint dispatch table: every keyword in a key must appear in the
+        # normalized yantra name. Insertion order is the match priority.
+        self._yantra_dispatch = {
+            ('samrat',): self.create_samrat_yantra_blueprint,
+            ('rama',): self.create_rama_yantra_blueprint,
+            ('jai_prakash',): self.create_jai_prakash_blueprint,
+            ('digamsa',): self.create_digamsa_yantra_blueprint,
+            ('dhruva',): self.create_dhruva_protha_chakra_blueprint,
+            ('pole_circle',): self.create_dhruva_protha_chakra_blueprint,
+            ('kapala',): self.create_kapala_yantra_blueprint,
+            ('bowl_sundial',): self.create_kapala_yantra_blueprint,
+            ('chakra', 'ring'): self.create_chakra_yantra_blueprint,
+            ('unnatamsa',): self.create_unnatamsa_yantra_blueprint,
+            ('solar_altitude',): self.create_unnatamsa_yantra_blueprint,
+        }
+        
+        # Blueprint pages are a pure function of the specs geometry, so
+        # exporting the same yantra to several formats builds them only once
+        self._cached_pages = functools.lru_cache(maxsize=64)(self._build_pages)
+    
+    def __getstate__(self):
+        # The page cache is per process; it is rebuilt empty on unpickling
+        # (page-rendering workers get the generator as a task argument)
+        state = self.__dict__.copy()
+        del state['_cached_pages']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_pages = functools.lru_cache(maxsize=64)(self._build_pages)
     
     def create_samrat_yantra_blueprint(self, specs: Dict) -> List[BlueprintPage]:
         """Create detailed blueprint for Samrat Yantra using precise ray-intersection calculations"""
         
         dimensions = specs['dimensions']
         angles = specs['angles'] 
-        coordinates = specs['coordinates']
-        
-        # Handle both dict and Coordinates object
-        if hasattr(coordinates, 'latitude'):
-            lat = coordinates.latitude
-            lon = coordinates.longitude
-            elev = coordinates.elevation
-        else:
-            lat = coordinates['latitude']
-            lon = coordinates['longitude'] 
-            elev = coordinates['elevation']
+        lat, lon, elev = self._normalize_coords(specs['coordinates'])
         
         pages = []
         
@@ -1217,7 +1502,7 @@ class YantraBlueprintGenerator:
         return pages
     
     def generate_pdf_blueprint(self, pages: List[BlueprintPage], output_path: str, 
-                              specs: Dict) -> str:
+                              specs: Dict, coords_tuple: Tuple[float, float, float] = None) -> str:
         """Generate comprehensive PDF blueprint"""
         
         doc = SimpleDocTemplate(
@@ -1241,6 +1526,9 @@ class YantraBlueprintGenerator:
         
         story = []
         
+        embed_width, embed_height = self.image_embed_size
+        render_dpi = embed_width / 72 * self.print_resolution / self.figure_size[0]
+        
         # Title page
         story.append(Paragraph("DIGIYANTRA", title_style))
         story.append(Paragraph("Ancient Indian Astronomical Instrument", styles['Heading2']))
@@ -1248,12 +1536,10 @@ class YantraBlueprintGenerator:
         story.append(Spacer(1, 20))
         
         # Location info
-        coords = specs['coordinates']
-        if hasattr(coords, 'latitude'):
-            lat, lon, elev = coords.latitude, coords.longitude, coords.elevation
-        else:
-            lat, lon, elev = coords['latitude'], coords['longitude'], coords['elevation']
-            
+        if coords_tuple is None:
+            coords_tuple = self._normalize_coords(specs['coordinates'])
+        lat, lon, elev = coords_tuple
+        
         location_data = [
             ['Parameter', 'Value'],
             ['Latitude', f"{lat:.4f}°"],
@@ -1277,6 +1563,15 @@ class YantraBlueprintGenerator:
         story.append(location_table)
         story.append(Spacer(1, 30))
         
+        # Simple pages skip the matplotlib figure and are drawn as vectors;
+        # the remaining figure pages are rasterized up front
+        native_pages = [
+            all(type(element) in PRIMITIVE_ELEMENT_TYPES for element in page.elements)
+            for page in pages
+        ]
+        figure_indices = [i for i, native in enumerate(native_pages) if not native]
+        page_images = self._render_page_images(pages, figure_indices, render_dpi)
+        
         # Generate drawing pages
         for i, page in enumerate(pages):
             if i > 0:
@@ -1287,61 +1582,215 @@ class YantraBlueprintGenerator:
             story.append(Paragraph(f"Scale: {page.scale}", styles['Normal']))
             story.append(Spacer(1, 10))
             
-            # Create matplotlib figure for this page
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            
-            # Add drawing elements
-            import matplotlib.patches as mpatches
-            import matplotlib.lines as mlines
-            
-            for element in page.elements:
-                try:
-                    if hasattr(element, 'add_to_axes'):
-                        element.add_to_axes(ax)
-                    elif isinstance(element, mpatches.Patch):
-                        ax.add_patch(element)
-                    elif isinstance(element, mlines.Line2D):
-                        ax.add_line(element)
-                    elif hasattr(element, 'get_path'):  # Other patch objects
-                        ax.add_patch(element)
-                    else:
-                        # For text or other elements, try to add them directly
-                        ax.add_artist(element)
-                except Exception as e:
-                    # Skip elements that cause errors
-                    print(f"Warning: Could not add element {type(element)}: {e}")
-                    continue
-            
-            # Add dimensions
-            for dim in page.dimensions:
-                self.add_dimension_line(ax, dim)
-            
-            ax.set_xlim(-10, 10)
-            ax.set_ylim(-8, 8)
-            ax.set_aspect('equal')
-            ax.grid(True, alpha=0.3)
-            ax.set_title(page.title)
-            
-            # Save figure to bytes
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-            img_buffer.seek(0)
-            plt.close(fig)
-            
-            # Add image to PDF
-            story.append(Image(img_buffer, width=400, height=300))
+            if native_pages[i]:
+                story.append(NativeDrawing(self, page, embed_width, embed_height, page.bbox))
+            else:
+                story.append(Image(io.BytesIO(page_images[i]), width=embed_width, height=embed_height))
             story.append(Spacer(1, 10))
             
-            # Add notes
-            if page.notes:
-                story.append(Paragraph("Construction Notes:", styles['Heading4']))
-                for note in page.notes:
-                    story.append(Paragraph(f"• {note}", styles['Normal']))
+            self._append_page_notes(story, page, styles)
         
         # Build PDF
         doc.build(story)
         return output_path
     
+    def _render_page_images(self, pages: List[BlueprintPage], indices: List[int],
+                            render_dpi: float) -> Dict[int, bytes]:
+        """Render the figure pages at indices to JPEG bytes, in the shared render pool for large documents"""
+        
+        if self.render_workers > 1 and len(indices) >= PARALLEL_RENDER_MIN_PAGES:
+            # Each task carries its generator and page, and only the encoded
+            # image comes back
+            count = len(indices)
+            try:
+                executor = get_render_pool(self.render_workers)
+                images = executor.map(
+                    _render_page_task,
+                    itertools.repeat(self, count),
+                    [pages[i] for i in indices],
+                    itertools.repeat(render_dpi, count)
+                )
+                return dict(zip(indices, images))
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                logger.warning("Parallel page rendering failed (%s), rendering pages serially", e)
+                if isinstance(e, BrokenProcessPool):
+                    _shutdown_render_pool()
+        
+        return {i: self.render_page_image(pages[i], render_dpi) for i in indices}
+    
+    def render_page_image(self, page: BlueprintPage, render_dpi: float) -> bytes:
+        """Render a page's matplotlib drawing to JPEG bytes"""
+        
+        fig, ax = plt.subplots(1, 1, figsize=self.figure_size, dpi=render_dpi)
+        
+        # Add drawing elements
+        import matplotlib.patches as mpatches
+        import matplotlib.lines as mlines
+        
+        attached = []
+        for element in page.elements:
+            if type(element) in (Circle, Line2D):
+                # Drawn from the page arrays below
+                continue
+            try:
+                if hasattr(element, 'add_to_axes'):
+                    element.add_to_axes(ax)
+                elif isinstance(element, mpatches.Patch):
+                    # Set the data transform explicitly: pages may be cached
+                    # and drawn again on a fresh axes
+                    element.set_transform(ax.transData)
+                    attached.append(ax.add_patch(element))
+                elif isinstance(element, mlines.Line2D):
+                    element.set_transform(ax.transData)
+                    attached.append(ax.add_line(element))
+                elif hasattr(element, 'get_path'):  # Other patch objects
+                    ax.add_patch(element)
+                else:
+                    # For text or other elements, try to add them directly
+                    ax.add_artist(element)
+            except Exception as e:
+                # Skip elements that cause errors
+                logger.warning("Could not add element %s: %s", type(element), e)
+                continue
+        
+        self.add_primitive_collections(ax, page)
+        
+        # Add dimensions
+        for dim in page.dimensions:
+            self.add_dimension_line(ax, dim)
+        
+        ax.set_xlim(page.bbox[0], page.bbox[1])
+        ax.set_ylim(page.bbox[2], page.bbox[3])
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3)
+        ax.set_title(page.title)
+        
+        # Render once and encode the raw RGBA buffer as JPEG; savefig with
+        # bbox_inches='tight' would draw twice and zlib-encode a PNG
+        fig.tight_layout()
+        fig.canvas.draw()
+        rgba = np.asarray(fig.canvas.buffer_rgba())
+        img_buffer = io.BytesIO()
+        PILImage.fromarray(rgba).convert('RGB').save(img_buffer, 'JPEG', quality=85, optimize=True)
+        for artist in attached:
+            artist.remove()
+        plt.close(fig)
+        
+        return img_buffer.getvalue()
+    
+    def _append_page_notes(self, story: List, page: BlueprintPage, styles):
+        """Append a page's construction notes to the PDF story"""
+        
+        if page.notes:
+            story.append(Paragraph("Construction Notes:", styles['Heading4']))
+            for note in page.notes:
+                story.append(Paragraph(f"• {note}", styles['Normal']))
+    
+    def _draw_page_native(self, canvas, page: BlueprintPage, origin: Tuple[float, float], scale: float):
+        """Draw a page's primitive arrays and dimension lines straight onto a ReportLab canvas"""
+        
+        ox, oy = origin
+        
+        def apply_style(style, filled):
+            canvas.setStrokeColorRGB(*style['edgecolor'][:3], alpha=style['edgecolor'][3])
+            if filled:
+                canvas.setFillColorRGB(*style['facecolor'][:3], alpha=style['facecolor'][3])
+            canvas.setLineWidth(style['linewidth'])
+            canvas.setDash(PDF_DASH_PATTERNS.get(str(style['linestyle']), []))
+        
+        for (x, y, w, h), style in zip(page.rect_params, page.rect_styles):
+            filled = style['facecolor'][3] > 0
+            apply_style(style, filled)
+            canvas.rect(ox + x * scale, oy + y * scale, w * scale, h * scale, stroke=1, fill=int(filled))
+        
+        for (cx, cy, r), style in zip(page.circle_params, page.circle_styles):
+            filled = style['facecolor'][3] > 0
+            apply_style(style, filled)
+            canvas.circle(ox + cx * scale, oy + cy * scale, r * scale, stroke=1, fill=int(filled))
+        
+        for (x0, y0, x1, y1), style in zip(page.line_params, page.line_styles):
+            apply_style(style, False)
+            canvas.line(ox + x0 * scale, oy + y0 * scale, ox + x1 * scale, oy + y1 * scale)
+        
+        dimension_color = colors.toColor(self.colors['dimension'])
+        canvas.setDash([])
+        canvas.setLineWidth(self.line_weights['dimension'])
+        canvas.setStrokeColor(dimension_color)
+        canvas.setFillColor(colors.black)
+        canvas.setFont('Helvetica', 6)
+        for dim in page.dimensions:
+            (x0, y0), (x1, y1) = dim.start_point, dim.end_point
+            canvas.line(ox + x0 * scale, oy + y0 * scale, ox + x1 * scale, oy + y1 * scale)
+            canvas.drawCentredString(
+                ox + (x0 + x1) / 2 * scale,
+                oy + (y0 + y1) / 2 * scale + 2,
+                f"{dim.value:.2f}{dim.unit}"
+            )
+    
+    def add_primitive_collections(self, ax, page: BlueprintPage):
+        """Add a page's circles and line segments to the axes as one collection each"""
+        
+        if len(page.circle_params):
+            diameters = 2 * page.circle_params[:, 2]
+            ax.add_collection(EllipseCollection(
+                widths=diameters,
+                heights=diameters,
+                angles=0,
+                units='xy',
+                offsets=page.circle_params[:, :2],
+                offset_transform=ax.transData,
+                facecolors=page.circle_styles['facecolor'],
+                edgecolors=page.circle_styles['edgecolor'],
+                linewidths=page.circle_styles['linewidth'],
+                linestyles=list(page.circle_styles['linestyle'])
+            ))
+        
+        if len(page.line_params):
+            vector = np.ones(len(page.line_params), dtype=bool)
+            if self.renderer == 'datashader':
+                # Dash patterns don't survive rasterization, so only solid
+                # lines go through datashader
+                vector = page.line_styles['linestyle'] != '-'
+                raster = ~vector
+                self.add_rasterized_lines(ax, page.line_params[raster], page.line_styles[raster], page.bbox)
+            if vector.any():
+                ax.add_collection(LineCollection(
+                    page.line_params[vector].reshape(-1, 2, 2),
+                    colors=page.line_styles['edgecolor'][vector],
+                    linewidths=page.line_styles['linewidth'][vector],
+                    linestyles=list(page.line_styles['linestyle'][vector])
+                ))
+    
+    def add_rasterized_lines(self, ax, line_params: np.ndarray, line_styles: np.ndarray,
+                             window: Tuple[float, float, float, float],
+                             plot_size: Tuple[int, int] = (2400, 1800)):
+        """Rasterize line segments with datashader, overlaying one image per line colour"""
+        
+        if not len(line_params):
+            return
+        
+        xmin, xmax, ymin, ymax = window
+        canvas = ds.Canvas(
+            plot_width=plot_size[0],
+            plot_height=plot_size[1],
+            x_range=(xmin, xmax),
+            y_range=(ymin, ymax)
+        )
+        
+        line_colors, color_index = np.unique(line_styles['edgecolor'], axis=0, return_inverse=True)
+        for i, color in enumerate(line_colors):
+            segments = pd.DataFrame(line_params[color_index.ravel() == i], columns=['x0', 'y0', 'x1', 'y1'])
+            counts = canvas.line(segments, x=['x0', 'x1'], y=['y0', 'y1'], axis=1)
+            
+            ax.imshow(
+                np.ma.masked_equal(counts.values, 0),
+                extent=window,
+                origin='lower',
+                cmap=mcolors.ListedColormap([color]),
+                interpolation='nearest',
+                aspect='auto'
+            )
+    
     def add_dimension_line(self, ax, dimension: DrawingDimension):
         """Add dimension line to matplotlib axes"""
         
@@ -1375,6 +1824,13 @@ class YantraBlueprintGenerator:
         doc.layers.new('CENTERLINES', dxfattribs={'color': 3})  # Green
         doc.layers.new('CONSTRUCTION', dxfattribs={'color': 8})  # Gray
         
+        # Shared blocks for repeated markings: every circle and line segment
+        # becomes an INSERT scaled/rotated from one unit definition
+        unit_circle = doc.blocks.new(name='UNIT_CIRCLE')
+        unit_circle.add_circle((0, 0), 1)
+        tick = doc.blocks.new(name='TICK')
+        tick.add_line((0, 0), (1, 0))
+        
         for page in pages:
             # Add title block
             msp.add_text(
@@ -1384,25 +1840,30 @@ class YantraBlueprintGenerator:
                     'height': 0.5,
                     'style': 'STANDARD'
                 }
-            ).set_pos((0, 10))
+            ).set_placement((0, 10))
+            
+            for cx, cy, r in page.circle_params:
+                msp.add_blockref(
+                    'UNIT_CIRCLE',
+                    (cx, cy),
+                    dxfattribs={'layer': 'OUTLINE', 'xscale': r, 'yscale': r}
+                )
+            
+            for x, y, w, h in page.rect_params:
+                corners = [(x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y)]
+                msp.add_lwpolyline(corners, dxfattribs={'layer': 'OUTLINE'})
             
-            # Process elements (simplified for DXF)
-            for element in page.elements:
-                if isinstance(element, Circle):
-                    msp.add_circle(
-                        (element.center[0], element.center[1]),
-                        element.radius,
-                        dxfattribs={'layer': 'OUTLINE'}
+            dx = page.line_params[:, 2] - page.line_params[:, 0]
+            dy = page.line_params[:, 3] - page.line_params[:, 1]
+            lengths = np.hypot(dx, dy)
+            rotations = np.degrees(np.arctan2(dy, dx))
+            for (x0, y0, _, _), length, rotation in zip(page.line_params, lengths, rotations):
+                if length > 0:
+                    msp.add_blockref(
+                        'TICK',
+                        (x0, y0),
+                        dxfattribs={'layer': 'CONSTRUCTION', 'xscale': length, 'rotation': rotation}
                     )
-                elif isinstance(element, Rectangle):
-                    corners = [
-                        (element.get_x(), element.get_y()),
-                        (element.get_x() + element.get_width(), element.get_y()),
-                        (element.get_x() + element.get_width(), element.get_y() + element.get_height()),
-                        (element.get_x(), element.get_y() + element.get_height()),
-                        (element.get_x(), element.get_y())  # Close the rectangle
-                    ]
-                    msp.add_lwpolyline(corners, dxfattribs={'layer': 'OUTLINE'})
         
         doc.saveas(output_path)
         return output_path
@@ -2574,43 +3035,62 @@ class YantraBlueprintGenerator:
         
         return pages
     
+    @staticmethod
+    def _normalize_coords(coords) -> Tuple[float, float, float]:
+        """Resolve a Coordinates object or coordinates dict to (latitude, longitude, elevation)"""
+        if hasattr(coords, 'latitude'):
+            return coords.latitude, coords.longitude, coords.elevation
+        return coords['latitude'], coords['longitude'], coords.get('elevation', 0.0)
+    
+    def get_blueprint_pages(self, kind: str, specs: Dict,
+                            coords_tuple: Tuple[float, float, float] = None) -> List[BlueprintPage]:
+        """Return the pages built by the create_* method named kind, memoized on the specs geometry"""
+        
+        if coords_tuple is None:
+            coords_tuple = self._normalize_coords(specs['coordinates'])
+        
+        pages = self._cached_pages(
+            kind,
+            coords_tuple,
+            tuple(sorted(specs['dimensions'].items())),
+            tuple(sorted(specs['angles'].items()))
+        )
+        return list(pages)
+    
+    def _build_pages(self, kind: str, coords_tuple: Tuple[float, float, float], dimensions_key: Tuple,
+                     angles_key: Tuple) -> Tuple[BlueprintPage, ...]:
+        """Build blueprint pages from the hashable geometry key used by the page cache"""
+        
+        latitude, longitude, elevation = coords_tuple
+        specs = {
+            'coordinates': {'latitude': latitude, 'longitude': longitude, 'elevation': elevation},
+            'dimensions': dict(dimensions_key),
+            'angles': dict(angles_key)
+        }
+        return tuple(getattr(self, kind)(specs))
+    
     def export_blueprint(self, yantra_specs: Dict, format: str = 'pdf', 
                         output_dir: str = '.') -> str:
         """Main export function for blueprints"""
         
         # Generate blueprint pages based on yantra type
         yantra_name = yantra_specs['name'].lower().replace(' ', '_')
+        coords_tuple = self._normalize_coords(yantra_specs['coordinates'])
         
-        if 'samrat' in yantra_name:
-            pages = self.create_samrat_yantra_blueprint(yantra_specs)
-        elif 'rama' in yantra_name:
-            pages = self.create_rama_yantra_blueprint(yantra_specs)
-        elif 'jai_prakash' in yantra_name:
-            pages = self.create_jai_prakash_blueprint(yantra_specs)
-        elif 'digamsa' in yantra_name:
-            pages = self.create_digamsa_yantra_blueprint(yantra_specs)
-        elif 'dhruva' in yantra_name or 'pole_circle' in yantra_name:
-            pages = self.create_dhruva_protha_chakra_blueprint(yantra_specs)
-        elif 'kapala' in yantra_name or 'bowl_sundial' in yantra_name:
-            pages = self.create_kapala_yantra_blueprint(yantra_specs)
-        elif 'chakra' in yantra_name and 'ring' in yantra_name:
-            pages = self.create_chakra_yantra_blueprint(yantra_specs)
-        elif 'unnatamsa' in yantra_name or 'solar_altitude' in yantra_name:
-            pages = self.create_unnatamsa_yantra_blueprint(yantra_specs)
+        for keywords, create_pages in self._yantra_dispatch.items():
+            if all(keyword in yantra_name for keyword in keywords):
+                pages = self.get_blueprint_pages(create_pages.__name__, yantra_specs, coords_tuple)
+                break
         else:
             raise ValueError(f"Unknown yantra type: {yantra_name}")
         
         # Generate output filename
-        coords = yantra_specs['coordinates']
-        if hasattr(coords, 'latitude'):
-            lat, lon = coords.latitude, coords.longitude
-        else:
-            lat, lon = coords['latitude'], coords['longitude']
+        lat, lon, _ = coords_tuple
         filename = f"{yantra_name}_{lat:.2f}_{lon:.2f}".replace(' ', '_')
         
         if format.lower() == 'pdf':
             output_path = Path(output_dir) / f"{filename}_blueprint.pdf"
-            return self.generate_pdf_blueprint(pages, str(output_path), yantra_specs)
+            return self.generate_pdf_blueprint(pages, str(output_path), yantra_specs, coords_tuple)
         
         elif format.lower() == 'dxf':
             output_path = Path(output_dir) / f"{filename}_blueprint.dxf"
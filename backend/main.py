@@ -5,21 +5,104 @@ RESTful API for the parametric geometry engine
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+from typing_extensions import TypedDict
 from datetime import datetime
+from enum import Enum
 import uvicorn
+import numpy as np
+import orjson
+import asyncio
+import atexit
+import bisect
+import functools
+import inspect
+import logging
+import logging.handlers
+import multiprocessing as mp
 import os
+import queue
+import re
+import sys
 import tempfile
 
-from parametric_engine import ParametricGeometryEngine, Coordinates, YantraSpecs
+from parametric_engine import ParametricGeometryEngine, Coordinates, YantraSpecs, compute_specs_batch
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Logging: handlers only enqueue records, a listener thread does the I/O so
+# request handlers never block on stderr
+logger = logging.getLogger("yantra")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder"""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the engine, caches and worker pool before serving traffic"""
+    # Default Jaipur specs for every yantra: initializes NumPy's trig paths
+    # and fills the specs cache with the most common request
+    jaipur = engine.reference_locations["jaipur"]
+    for yantra_type in GEN:
+        generate_specs(yantra_type, jaipur.latitude, jaipur.longitude, jaipur.elevation, "jaipur")
+    engine.calculate_solar_position(jaipur, parse_datetime("2000-01-01T12:00:00Z"))
+    
+    # Start the worker pool now instead of on the first request
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        get_executor(), compute_specs_batch, "samrat_yantra",
+        np.array([[jaipur.latitude, jaipur.longitude, jaipur.elevation]]), ["jaipur"]
+    )
+    
+    # Build and cache the OpenAPI schema
+    app.openapi()
+    
+    health_refresher = asyncio.create_task(_refresh_health())
+    yield
+    
+    health_refresher.cancel()
+    _shutdown_executor()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="DIGIYANTRA API",
     description="Ancient Indian Astronomical Instruments Generator",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for React frontend
@@ -27,13 +110,58 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # React dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the API actually uses, so nothing is expanded per request
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight results for a day
 )
 
+# Compress JSON bodies; minimum_size stays above the /health payload so the
+# cheapest endpoint is never compressed
+COMPRESSION_MINIMUM_SIZE = 512
+if BROTLI_AVAILABLE:
+    # Brotli for clients that accept it, gzip for the rest
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=COMPRESSION_MINIMUM_SIZE, gzip_fallback=True)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE, compresslevel=4)
+
 # Initialize the parametric engine
 engine = ParametricGeometryEngine()
 
+# Single generator dispatch shared by every endpoint
+GEN: Dict[str, Callable[..., YantraSpecs]] = {
+    "samrat_yantra": engine.generate_samrat_yantra,
+    "rama_yantra": engine.generate_rama_yantra,
+    "jai_prakash_yantra": engine.generate_jai_prakash_yantra,
+    "digamsa_yantra": engine.generate_digamsa_yantra,
+    "dhruva_protha_chakra": engine.generate_dhruva_protha_chakra,
+    "kapala_yantra": engine.generate_kapala_yantra,
+    "chakra_yantra": engine.generate_chakra_yantra,
+    "unnatamsa_yantra": engine.generate_unnatamsa_yantra
+}
+# Generators that take a reference_location argument, probed once at import
+ACCEPTS_REF = {
+    yantra_type for yantra_type, generator in GEN.items()
+    if "reference_location" in inspect.signature(generator).parameters
+}
+
+def _dispatch(yantra_type: str, coords: Coordinates, reference_location: Optional[str]) -> YantraSpecs:
+    """Run the generator for yantra_type, passing the reference only if it accepts one"""
+    if yantra_type in ACCEPTS_REF:
+        return GEN[yantra_type](coords, reference_location)
+    return GEN[yantra_type](coords)
+
+class YantraType(str, Enum):
+    """Supported yantra types; values are the GEN keys"""
+    SAMRAT = "samrat_yantra"
+    RAMA = "rama_yantra"
+    JAI_PRAKASH = "jai_prakash_yantra"
+    DIGAMSA = "digamsa_yantra"
+    DHRUVA_PROTHA = "dhruva_protha_chakra"
+    KAPALA = "kapala_yantra"
+    CHAKRA = "chakra_yantra"
+    UNNATAMSA = "unnatamsa_yantra"
+
 # Pydantic models for API
 class CoordinatesInput(BaseModel):
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
@@ -42,7 +170,7 @@ class CoordinatesInput(BaseModel):
 
 class YantraRequest(BaseModel):
     coordinates: CoordinatesInput
-    yantra_type: str = Field(..., description="Type of yantra to generate")
+    yantra_type: YantraType = Field(..., description="Type of yantra to generate")
     reference_location: Optional[str] = Field(default="jaipur", description="Historical reference location")
     scale_factor: float = Field(default=1.0, gt=0, description="Scale factor for dimensions")
 
@@ -54,36 +182,303 @@ class ManuscriptDecodeRequest(BaseModel):
     text: str = Field(..., description="Sanskrit astronomical text to decode")
     context: Optional[str] = Field(default="", description="Additional context about the manuscript")
 
-class YantraResponse(BaseModel):
+# Response payloads are plain dicts; the TypedDicts only describe them for
+# the OpenAPI schema
+class CoordinatesPayload(TypedDict):
+    latitude: float
+    longitude: float
+    elevation: float
+
+class YantraResponse(TypedDict):
     name: str
-    coordinates: Dict[str, float]
+    coordinates: CoordinatesPayload
     dimensions: Dict[str, float]
     angles: Dict[str, float]
     construction_notes: List[str]
     accuracy_metrics: Dict[str, float]
 
-@app.get("/")
+# Coordinates are rounded to this many decimals (~0.1 m) before generation so
+# near-identical client inputs share a cache entry
+COORDINATE_DECIMALS = 6
+
+@functools.lru_cache(maxsize=8192)
+def _interned_coordinates(latitude: float, longitude: float, elevation: float) -> Coordinates:
+    return Coordinates(latitude=latitude, longitude=longitude, elevation=elevation)
+
+def make_coordinates(latitude: float, longitude: float, elevation: float) -> Coordinates:
+    """Shared (frozen) Coordinates for the rounded inputs"""
+    return _interned_coordinates(
+        round(latitude, COORDINATE_DECIMALS),
+        round(longitude, COORDINATE_DECIMALS),
+        round(elevation, COORDINATE_DECIMALS)
+    )
+
+# LRU cache of generated specs keyed by (yantra_type, lat, lon, elev, reference).
+# Cached specs are shared between requests and must not be mutated.
+SPECS_CACHE_SIZE = 4096
+_specs_cache: "OrderedDict[tuple, YantraSpecs]" = OrderedDict()
+
+def _specs_key(yantra_type: str, latitude: float, longitude: float,
+               elevation: float, reference_location: Optional[str]) -> tuple:
+    return (
+        yantra_type,
+        round(latitude, COORDINATE_DECIMALS),
+        round(longitude, COORDINATE_DECIMALS),
+        round(elevation, COORDINATE_DECIMALS),
+        reference_location
+    )
+
+def _cache_get(key: tuple) -> Optional[YantraSpecs]:
+    specs = _specs_cache.get(key)
+    if specs is not None:
+        _specs_cache.move_to_end(key)
+    return specs
+
+def _cache_put(key: tuple, specs: YantraSpecs):
+    _specs_cache[key] = specs
+    _specs_cache.move_to_end(key)
+    if len(_specs_cache) > SPECS_CACHE_SIZE:
+        _specs_cache.popitem(last=False)
+
+def _generate_one(key: tuple) -> YantraSpecs:
+    yantra_type, latitude, longitude, elevation, reference_location = key
+    coords = _interned_coordinates(latitude, longitude, elevation)
+    return _dispatch(yantra_type, coords, reference_location)
+
+def generate_specs(yantra_type: str, latitude: float, longitude: float,
+                   elevation: float, reference_location: Optional[str]) -> YantraSpecs:
+    """Generate (or fetch cached) yantra specs for a known yantra type"""
+    key = _specs_key(yantra_type, latitude, longitude, elevation, reference_location)
+    specs = _cache_get(key)
+    if specs is None:
+        specs = _generate_one(key)
+        _cache_put(key, specs)
+    return specs
+
+# Engine calls are pure-CPU trig; run them in worker processes so the event
+# loop keeps serving other connections. One pool is shared by every handler,
+# created on first use so importing this module does not spawn processes.
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+def get_executor() -> ProcessPoolExecutor:
+    global EXECUTOR
+    if EXECUTOR is None:
+        context = None
+        if "forkserver" in mp.get_all_start_methods():
+            # Workers fork from a clean server that has imported the engine
+            # once, rather than from this threaded server process
+            context = mp.get_context("forkserver")
+            context.set_forkserver_preload(["parametric_engine"])
+        EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+    return EXECUTOR
+
+def _shutdown_executor():
+    global EXECUTOR
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        EXECUTOR = None
+
+atexit.register(_shutdown_executor)
+
+class GenerationBatcher:
+    """
+    Collects concurrent generation requests into engine batch calls
+    
+    A background task waits for the first pending request, then gathers more
+    for up to max_wait seconds or until max_batch_size, and runs each
+    yantra type's group through a single engine.generate_batch call in the
+    process pool.
+    """
+    
+    def __init__(self, max_batch_size: int = 32, max_wait: float = 0.005):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight = set()
+    
+    async def submit(self, key: tuple) -> YantraSpecs:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((key, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Don't wait for this batch before collecting the next one
+            task = loop.create_task(self._process(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+    
+    async def _compute(self, yantra_type: str, keys: List[tuple]) -> List:
+        global EXECUTOR
+        coords_array = np.array([key[1:4] for key in keys], dtype=float)
+        references = [key[4] for key in keys]
+        executor = get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, compute_specs_batch, yantra_type, coords_array, references
+            )
+        except BrokenProcessPool:
+            # A dead worker takes the pool with it; compute on a thread (off
+            # the event loop) and let the next batch start a fresh pool
+            executor.shutdown(wait=False)
+            if EXECUTOR is executor:
+                EXECUTOR = None
+            return await asyncio.to_thread(compute_specs_batch, yantra_type, coords_array, references)
+    
+    async def _process(self, batch: List[tuple]):
+        # Identical requests in one batch share a single generation
+        waiters: Dict[tuple, List[asyncio.Future]] = {}
+        for key, future in batch:
+            waiters.setdefault(key, []).append(future)
+        
+        groups: Dict[str, List[tuple]] = {}
+        for key in waiters:
+            groups.setdefault(key[0], []).append(key)
+        
+        try:
+            group_results = await asyncio.gather(*(
+                self._compute(yantra_type, keys) for yantra_type, keys in groups.items()
+            ))
+        except Exception as e:
+            # Executor failures other than a broken pool (shut down during
+            # reload, unpicklable result) fail the whole batch; every waiter
+            # must still be resolved or its request hangs forever
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for keys, results in zip(groups.values(), group_results):
+            for key, result in zip(keys, results):
+                if not isinstance(result, Exception):
+                    _cache_put(key, result)
+                for future in waiters[key]:
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+generation_batcher = GenerationBatcher()
+
+async def generate_specs_batched(yantra_type: str, latitude: float, longitude: float,
+                                 elevation: float, reference_location: Optional[str]) -> YantraSpecs:
+    """Fetch cached specs, or queue the request for the next generation batch"""
+    key = _specs_key(yantra_type, latitude, longitude, elevation, reference_location)
+    specs = _cache_get(key)
+    if specs is None:
+        specs = await generation_batcher.submit(key)
+    return specs
+
+# Static payloads, encoded once at import and served as raw bytes
+ROOT_INFO = {
+    "message": "Welcome to DIGIYANTRA - Ancient Indian Astronomical Instruments Generator",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "available_yantras": [
+        "samrat_yantra",
+        "rama_yantra", 
+        "jai_prakash_yantra",
+        "digamsa_yantra",
+        "dhruva_protha_chakra",
+        "kapala_yantra",
+        "chakra_yantra",
+        "unnatamsa_yantra"
+    ]
+}
+ROOT_BYTES = orjson.dumps(ROOT_INFO)
+
+AVAILABLE_YANTRAS = {
+    "yantras": [
+        {
+            "id": "samrat_yantra",
+            "name": "Samrat Yantra (Great Sundial)",
+            "description": "Large sundial for precise time measurement",
+            "accuracy": "±2 minutes"
+        },
+        {
+            "id": "rama_yantra", 
+            "name": "Rama Yantra (Cylindrical Altitude-Azimuth)",
+            "description": "Cylindrical structure for measuring celestial coordinates",
+            "accuracy": "±0.5° altitude, ±1° azimuth"
+        },
+        {
+            "id": "jai_prakash_yantra",
+            "name": "Jai Prakash Yantra (Hemispherical Sundial)", 
+            "description": "Hemispherical bowl representing celestial sphere",
+            "accuracy": "±1 minute time, ±0.5° coordinates"
+        },
+        {
+            "id": "digamsa_yantra",
+            "name": "Digamsa Yantra (Azimuth-Altitude Instrument)",
+            "description": "Vertical semicircle for measuring azimuthal directions and horizon angles",
+            "accuracy": "±0.5° azimuth and altitude"
+        },
+        {
+            "id": "dhruva_protha_chakra",
+            "name": "Dhruva-Protha-Chakra (Pole Circle)",
+            "description": "Circular disk for determining celestial pole position and latitude",
+            "accuracy": "±0.1° latitude, ±4 minutes time"
+        },
+        {
+            "id": "kapala_yantra",
+            "name": "Kapala Yantra (Bowl Sundial)",
+            "description": "Hemispherical bowl sundial for time and seasonal observations",
+            "accuracy": "±3 minutes time, ±3 days seasonal"
+        },
+        {
+            "id": "chakra_yantra",
+            "name": "Chakra Yantra (Ring Dial)",
+            "description": "Nested circular rings for solar observations and tracking",
+            "accuracy": "±0.2° angular measurements"
+        },
+        {
+            "id": "unnatamsa_yantra",
+            "name": "Unnatamsa Yantra (Solar Altitude Instrument)",
+            "description": "Quarter-circle arc for measuring solar altitude angles",
+            "accuracy": "±0.25° altitude, ±5 minutes time"
+        }
+    ]
+}
+AVAILABLE_YANTRAS_BYTES = orjson.dumps(AVAILABLE_YANTRAS)
+
+REFERENCES_BYTES = {
+    yantra_type: orjson.dumps({"yantra_type": yantra_type, "references": references})
+    for yantra_type in GEN
+    if (references := engine.get_available_references(yantra_type))
+}
+
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "Welcome to DIGIYANTRA - Ancient Indian Astronomical Instruments Generator",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "available_yantras": [
-            "samrat_yantra",
-            "rama_yantra", 
-            "jai_prakash_yantra",
-            "digamsa_yantra",
-            "dhruva_protha_chakra",
-            "kapala_yantra",
-            "chakra_yantra",
-            "unnatamsa_yantra"
-        ]
-    }
+    return Response(content=ROOT_BYTES, media_type="application/json")
 
 @app.get("/yantras/{yantra_type}/references")
 async def get_yantra_references(yantra_type: str):
     """Get available historical references for a yantra type"""
+    if yantra_type in REFERENCES_BYTES:
+        return Response(content=REFERENCES_BYTES[yantra_type], media_type="application/json")
+    
     try:
         references = engine.get_available_references(yantra_type)
         if not references:
@@ -92,157 +487,63 @@ async def get_yantra_references(yantra_type: str):
                 detail=f"No references found for yantra type: {yantra_type}"
             )
         return {"yantra_type": yantra_type, "references": references}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/yantras/available")
+@app.get("/yantras/available", response_class=ORJSONResponse)
 async def get_available_yantras():
     """Get list of available yantra types"""
-    return {
-        "yantras": [
-            {
-                "id": "samrat_yantra",
-                "name": "Samrat Yantra (Great Sundial)",
-                "description": "Large sundial for precise time measurement",
-                "accuracy": "±2 minutes"
-            },
-            {
-                "id": "rama_yantra", 
-                "name": "Rama Yantra (Cylindrical Altitude-Azimuth)",
-                "description": "Cylindrical structure for measuring celestial coordinates",
-                "accuracy": "±0.5° altitude, ±1° azimuth"
-            },
-            {
-                "id": "jai_prakash_yantra",
-                "name": "Jai Prakash Yantra (Hemispherical Sundial)", 
-                "description": "Hemispherical bowl representing celestial sphere",
-                "accuracy": "±1 minute time, ±0.5° coordinates"
-            },
-            {
-                "id": "digamsa_yantra",
-                "name": "Digamsa Yantra (Azimuth-Altitude Instrument)",
-                "description": "Vertical semicircle for measuring azimuthal directions and horizon angles",
-                "accuracy": "±0.5° azimuth and altitude"
-            },
-            {
-                "id": "dhruva_protha_chakra",
-                "name": "Dhruva-Protha-Chakra (Pole Circle)",
-                "description": "Circular disk for determining celestial pole position and latitude",
-                "accuracy": "±0.1° latitude, ±4 minutes time"
-            },
-            {
-                "id": "kapala_yantra",
-                "name": "Kapala Yantra (Bowl Sundial)",
-                "description": "Hemispherical bowl sundial for time and seasonal observations",
-                "accuracy": "±3 minutes time, ±3 days seasonal"
-            },
-            {
-                "id": "chakra_yantra",
-                "name": "Chakra Yantra (Ring Dial)",
-                "description": "Nested circular rings for solar observations and tracking",
-                "accuracy": "±0.2° angular measurements"
-            },
-            {
-                "id": "unnatamsa_yantra",
-                "name": "Unnatamsa Yantra (Solar Altitude Instrument)",
-                "description": "Quarter-circle arc for measuring solar altitude angles",
-                "accuracy": "±0.25° altitude, ±5 minutes time"
-            }
-        ]
-    }
+    return Response(content=AVAILABLE_YANTRAS_BYTES, media_type="application/json")
 
-@app.post("/yantras/generate", response_model=YantraResponse)
+# YantraResponse documents the payload only; it is not used for validation
+@app.post("/yantras/generate", responses={200: {"model": YantraResponse}})
 async def generate_yantra(request: YantraRequest):
     """Generate yantra specifications for given coordinates"""
     
     try:
-        print(f"Generating yantra: {request.yantra_type} at {request.coordinates.latitude}, {request.coordinates.longitude}")
-        print(f"Reference location: {request.reference_location}")
-        
-        # Validate yantra_type is not empty
-        if not request.yantra_type or request.yantra_type.strip() == "":
-            raise HTTPException(
-                status_code=400,
-                detail="yantra_type cannot be empty. Please specify a valid yantra type."
-            )
+        logger.debug("Generating yantra: %s at %s, %s (reference: %s)",
+                     request.yantra_type.value, request.coordinates.latitude,
+                     request.coordinates.longitude, request.reference_location)
         
-        # Convert coordinates
-        coords = Coordinates(
-            latitude=request.coordinates.latitude,
-            longitude=request.coordinates.longitude,
-            elevation=request.coordinates.elevation
+        # yantra_type is already validated against YantraType by Pydantic
+        specs = await generate_specs_batched(
+            request.yantra_type.value,
+            request.coordinates.latitude,
+            request.coordinates.longitude,
+            request.coordinates.elevation,
+            request.reference_location
         )
         
-        # Generate yantra based on type
-        if request.yantra_type == "samrat_yantra":
-            specs = engine.generate_samrat_yantra(coords, request.reference_location)
-        elif request.yantra_type == "rama_yantra":
-            specs = engine.generate_rama_yantra(coords, request.reference_location)
-        elif request.yantra_type == "jai_prakash_yantra":
-            specs = engine.generate_jai_prakash_yantra(coords, request.reference_location)
-        elif request.yantra_type == "digamsa_yantra":
-            # Check if function supports reference_location parameter
-            try:
-                specs = engine.generate_digamsa_yantra(coords, request.reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_digamsa_yantra(coords)
-        elif request.yantra_type == "dhruva_protha_chakra":
-            try:
-                specs = engine.generate_dhruva_protha_chakra(coords, request.reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_dhruva_protha_chakra(coords)
-        elif request.yantra_type == "kapala_yantra":
-            try:
-                specs = engine.generate_kapala_yantra(coords, request.reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_kapala_yantra(coords)
-        elif request.yantra_type == "chakra_yantra":
-            try:
-                specs = engine.generate_chakra_yantra(coords, request.reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_chakra_yantra(coords)
-        elif request.yantra_type == "unnatamsa_yantra":
-            try:
-                specs = engine.generate_unnatamsa_yantra(coords, request.reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_unnatamsa_yantra(coords)
-        else:
-            available_types = [
-                "samrat_yantra", "rama_yantra", "jai_prakash_yantra", 
-                "digamsa_yantra", "dhruva_protha_chakra", "kapala_yantra", 
-                "chakra_yantra", "unnatamsa_yantra"
-            ]
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Unknown yantra type: '{request.yantra_type}'. Available types: {', '.join(available_types)}"
-            )
-        
-        # Apply scale factor if provided
+        # Apply scale factor if provided; cached specs are never modified
+        dimensions = specs.dimensions
         if request.scale_factor != 1.0:
-            for key in specs.dimensions:
-                specs.dimensions[key] *= request.scale_factor
+            dimensions = {key: value * request.scale_factor for key, value in dimensions.items()}
         
-        # Convert to response format
-        return YantraResponse(
-            name=specs.name,
-            coordinates={
+        # Convert to response format; specs come from the engine, so the
+        # payload is serialized directly instead of re-validated
+        payload: YantraResponse = {
+            "name": specs.name,
+            "coordinates": {
                 "latitude": specs.coordinates.latitude,
                 "longitude": specs.coordinates.longitude,
                 "elevation": specs.coordinates.elevation
             },
-            dimensions=specs.dimensions,
-            angles=specs.angles,
-            construction_notes=specs.construction_notes,
-            accuracy_metrics=specs.accuracy_metrics
-        )
+            "dimensions": dimensions,
+            "angles": specs.angles,
+            "construction_notes": specs.construction_notes,
+            "accuracy_metrics": specs.accuracy_metrics
+        }
+        return ORJSONResponse(content=payload)
         
+    except HTTPException:
+        raise
     except ValueError as e:
-        print(f"ValueError: {e}")
+        logger.debug("Invalid yantra request: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error generating %s", request.yantra_type.value)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/solar/position")
@@ -251,13 +552,13 @@ async def calculate_solar_position(request: SolarPositionRequest):
     
     try:
         # Parse datetime
-        dt = datetime.fromisoformat(request.datetime.replace('Z', '+00:00'))
+        dt = parse_datetime(request.datetime)
         
         # Convert coordinates
-        coords = Coordinates(
-            latitude=request.coordinates.latitude,
-            longitude=request.coordinates.longitude,
-            elevation=request.coordinates.elevation
+        coords = make_coordinates(
+            request.coordinates.latitude,
+            request.coordinates.longitude,
+            request.coordinates.elevation
         )
         
         # Calculate solar position
@@ -280,7 +581,7 @@ async def calculate_solar_position(request: SolarPositionRequest):
 
 @app.get("/yantras/export/{yantra_type}")
 async def export_yantra_blueprint(
-    yantra_type: str,
+    yantra_type: YantraType,
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
     elevation: float = Query(default=0.0),
@@ -290,46 +591,9 @@ async def export_yantra_blueprint(
     """Export yantra specifications in various formats"""
     
     try:
-        # Convert coordinates
-        coords = Coordinates(latitude=latitude, longitude=longitude, elevation=elevation)
-        
         # Generate yantra
-        if yantra_type == "samrat_yantra":
-            specs = engine.generate_samrat_yantra(coords, reference_location)
-        elif yantra_type == "rama_yantra":
-            specs = engine.generate_rama_yantra(coords, reference_location)
-        elif yantra_type == "jai_prakash_yantra":
-            specs = engine.generate_jai_prakash_yantra(coords, reference_location)
-        elif yantra_type == "digamsa_yantra":
-            try:
-                specs = engine.generate_digamsa_yantra(coords, reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_digamsa_yantra(coords)
-        elif yantra_type == "dhruva_protha_chakra":
-            try:
-                specs = engine.generate_dhruva_protha_chakra(coords, reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_dhruva_protha_chakra(coords)
-        elif yantra_type == "kapala_yantra":
-            try:
-                specs = engine.generate_kapala_yantra(coords, reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_kapala_yantra(coords)
-        elif yantra_type == "chakra_yantra":
-            try:
-                specs = engine.generate_chakra_yantra(coords, reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_chakra_yantra(coords)
-        elif yantra_type == "unnatamsa_yantra":
-            try:
-                specs = engine.generate_unnatamsa_yantra(coords, reference_location)
-            except (TypeError, ValueError):
-                specs = engine.generate_unnatamsa_yantra(coords)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown yantra type: {yantra_type}"
-            )
+        yantra_type = yantra_type.value
+        specs = await generate_specs_batched(yantra_type, latitude, longitude, elevation, reference_location)
         
         # Export in requested format
         if format == "pdf":
@@ -357,17 +621,76 @@ async def export_yantra_blueprint(
                 media_type="image/svg+xml",
                 headers={"Content-Disposition": f"attachment; filename=yantra_{yantra_type}_{reference_location}.svg"}
             )
+        elif format == "json":
+            # Send the exported document itself rather than wrapping it as a
+            # JSON string inside another JSON object
+            return StreamingResponse(
+                engine.iter_json_specifications(specs),
+                media_type="application/json"
+            )
         else:
             exported = engine.export_specifications(specs, format)
+            return PlainTextResponse(exported)
             
-            if format == "json":
-                return {"content": exported, "content_type": "application/json"}
-            else:
-                return {"content": exported, "content_type": "text/plain"}
-            
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+CLIMATE_ZONES = ("Northern Temperate", "Northern Tropical", "Southern Tropical", "Southern Temperate")
+SUITABILITY_YANTRAS = (
+    "samrat_yantra", "rama_yantra", "jai_prakash_yantra", "digamsa_yantra",
+    "dhruva_protha_chakra", "kapala_yantra", "chakra_yantra", "unnatamsa_yantra"
+)
+
+def _classify_latitudes(latitudes: np.ndarray):
+    """Vectorized climate zone codes and per-yantra "Excellent" masks
+    
+    Returns a uint8 zone index into CLIMATE_ZONES per latitude and an (N, 8)
+    uint8 array, one column per SUITABILITY_YANTRAS entry.
+    """
+    zones = np.where(latitudes > 23.5, 0,
+                     np.where(latitudes > 0, 1,
+                              np.where(latitudes > -23.5, 2, 3))).astype(np.uint8)
+    abs_lat = np.abs(latitudes)
+    always = np.ones_like(abs_lat, dtype=bool)
+    excellent = np.column_stack([
+        abs_lat > 10,   # samrat_yantra
+        always,         # rama_yantra
+        abs_lat < 60,   # jai_prakash_yantra
+        always,         # digamsa_yantra
+        abs_lat > 5,    # dhruva_protha_chakra
+        abs_lat < 65,   # kapala_yantra
+        always,         # chakra_yantra
+        abs_lat > 5     # unnatamsa_yantra
+    ]).astype(np.uint8)
+    return zones, excellent
+
+def _build_location_profiles(latitudes: np.ndarray) -> list:
+    zones, excellent = _classify_latitudes(latitudes)
+    return [
+        (CLIMATE_ZONES[zone], {
+            yantra: "Excellent" if flag else "Good"
+            for yantra, flag in zip(SUITABILITY_YANTRAS, row)
+        })
+        for zone, row in zip(zones.tolist(), excellent.tolist())
+    ]
+
+# Every latitude threshold used by _classify_latitudes. Profiles are constant
+# between consecutive thresholds, so one is precomputed per open interval and
+# one per threshold; lookups are exact, not rounded to a grid.
+_thresholds = np.array([-65.0, -60.0, -23.5, -10.0, -5.0, 0.0, 5.0, 10.0, 23.5, 60.0, 65.0])
+_interval_edges = np.concatenate(([_thresholds[0] - 1], _thresholds, [_thresholds[-1] + 1]))
+SUITABILITY_THRESHOLDS = _thresholds.tolist()  # bisect is faster on a list
+SUITABILITY_AT = _build_location_profiles(_thresholds)
+SUITABILITY_BETWEEN = _build_location_profiles((_interval_edges[:-1] + _interval_edges[1:]) / 2)
+
+def lookup_location_profile(latitude: float):
+    index = bisect.bisect_left(SUITABILITY_THRESHOLDS, latitude)
+    if index < len(SUITABILITY_THRESHOLDS) and SUITABILITY_THRESHOLDS[index] == latitude:
+        return SUITABILITY_AT[index]
+    return SUITABILITY_BETWEEN[index]
+
 @app.get("/coordinates/validate")
 async def validate_coordinates(latitude: float, longitude: float):
     """Validate geographical coordinates and provide location info"""
@@ -378,37 +701,74 @@ async def validate_coordinates(latitude: float, longitude: float):
     if not (-180 <= longitude <= 180):
         raise HTTPException(status_code=400, detail="Longitude must be between -180 and 180 degrees")
     
-    # Basic location categorization
-    if latitude > 23.5:
-        climate_zone = "Northern Temperate"
-    elif latitude > 0:
-        climate_zone = "Northern Tropical"
-    elif latitude > -23.5:
-        climate_zone = "Southern Tropical"
-    else:
-        climate_zone = "Southern Temperate"
+    # Shared precomputed profile; never mutated
+    climate_zone, suitability = lookup_location_profile(latitude)
     
     return {
         "valid": True,
         "latitude": latitude,
         "longitude": longitude,
         "climate_zone": climate_zone,
-        "yantra_suitability": {
-            "samrat_yantra": "Excellent" if abs(latitude) > 10 else "Good",
-            "rama_yantra": "Excellent",
-            "jai_prakash_yantra": "Excellent" if abs(latitude) < 60 else "Good",
-            "digamsa_yantra": "Excellent",
-            "dhruva_protha_chakra": "Excellent" if abs(latitude) > 5 else "Good",
-            "kapala_yantra": "Excellent" if abs(latitude) < 65 else "Good",
-            "chakra_yantra": "Excellent",
-            "unnatamsa_yantra": "Excellent" if abs(latitude) > 5 else "Good"
-        }
+        "yantra_suitability": suitability
     }
 
+# /health is polled constantly by load balancers; its body is rebuilt once a
+# second by a background task instead of on every call
+HEALTH_REFRESH_SECONDS = 1.0
+
+def _health_body() -> bytes:
+    return orjson.dumps({"status": "healthy", "timestamp": datetime.now().isoformat()})
+
+_health_cache = _health_body()
+
+async def _refresh_health():
+    global _health_cache
+    while True:
+        await asyncio.sleep(HEALTH_REFRESH_SECONDS)
+        _health_cache = _health_body()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(content=_health_cache, media_type="application/json")
+
+# Manuscript keyword categories in match priority order:
+# (Devanagari and transliterated keywords, decoded formula, confidence)
+MANUSCRIPT_CATEGORIES = [
+    (("सूर्य", "surya"),  # Sun
+     "Solar angle = arcsin(sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H))", 0.92),
+    (("चन्द्र", "chandra"),  # Moon
+     "Lunar position = f(solar_longitude, lunar_node, time)", 0.88),
+    (("ग्रह", "graha"),  # Planet
+     "Planet_longitude = mean_longitude + equation_of_center", 0.82),
+    (("यन्त्र", "yantra"),  # Instrument
+     "Gnomon_height = base_length * tan(latitude)", 0.95)
+]
+GENERIC_MANUSCRIPT_FORMULA = ("Astronomical_parameter = trigonometric_function(celestial_coordinates)", 0.75)
+
+def _build_keyword_matcher() -> Callable[[str], Optional[int]]:
+    """Compile all manuscript keywords into one matcher returning the best category id
+    
+    Uses a pyahocorasick automaton when installed, otherwise a single regex
+    alternation; either way the text is scanned once for every keyword.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for category_id, (keywords, _, _) in enumerate(MANUSCRIPT_CATEGORIES):
+            for keyword in keywords:
+                automaton.add_word(keyword, category_id)
+        automaton.make_automaton()
+        return lambda text: min((category_id for _, category_id in automaton.iter(text)), default=None)
+    
+    category_of = {
+        keyword: category_id
+        for category_id, (keywords, _, _) in enumerate(MANUSCRIPT_CATEGORIES)
+        for keyword in keywords
+    }
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in category_of))
+    return lambda text: min((category_of[m.group()] for m in pattern.finditer(text)), default=None)
+
+match_manuscript_category = _build_keyword_matcher()
 
 @app.post("/ai/manuscript-decode")
 async def decode_manuscript(request: ManuscriptDecodeRequest):
@@ -419,26 +779,12 @@ async def decode_manuscript(request: ManuscriptDecodeRequest):
         # In a real implementation, this would use NLP and Sanskrit processing
         
         # Sample processing based on common astronomical text patterns
-        text = request.text.lower()
-        decoded_formula = ""
-        confidence = 0.85
-        
-        if "सूर्य" in text or "surya" in text:  # Sun
-            decoded_formula = "Solar angle = arcsin(sin(δ) * sin(φ) + cos(δ) * cos(φ) * cos(H))"
-            confidence = 0.92
-        elif "चन्द्र" in text or "chandra" in text:  # Moon
-            decoded_formula = "Lunar position = f(solar_longitude, lunar_node, time)"
-            confidence = 0.88
-        elif "ग्रह" in text or "graha" in text:  # Planet
-            decoded_formula = "Planet_longitude = mean_longitude + equation_of_center"
-            confidence = 0.82
-        elif "यन्त्र" in text or "yantra" in text:  # Instrument
-            decoded_formula = "Gnomon_height = base_length * tan(latitude)"
-            confidence = 0.95
-        else:
+        category_id = match_manuscript_category(request.text.lower())
+        if category_id is None:
             # Generic astronomical formula
-            decoded_formula = "Astronomical_parameter = trigonometric_function(celestial_coordinates)"
-            confidence = 0.75
+            decoded_formula, confidence = GENERIC_MANUSCRIPT_FORMULA
+        else:
+            _, decoded_formula, confidence = MANUSCRIPT_CATEGORIES[category_id]
         
         # Generate implementation code
         implementation_code = f"""
@@ -481,5 +827,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # C event loop and HTTP parser from uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
@@ -9,9 +9,16 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import math
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import our modules
 from yantra_geometry import (
     YantraGeometryEngine, AstronomicalCalculations, RayIntersection, 
@@ -20,6 +27,21 @@ from yantra_geometry import (
 from blueprint_generator import YantraBlueprintGenerator
 from parametric_engine import ParametricGeometryEngine, Coordinates
 
+# The calculators are stateless, so one instance of each serves every test
+_ASTRO = AstronomicalCalculations()
+_RAYS = RayIntersection()
+_SURFACE = SurfaceCoordinates()
+
+# Ray-plane verification constants from the worked example, built once and
+# read-only so repeated runs share them
+_SUN_VEC = np.array([0.70710678, -0.27829240, 0.65004103])
+_GNOMON_TIP = np.array([1.0, 0.0, 10.0])
+_EXPECTED_POINT = np.array([0.0, 0.39356489, 9.08070316])
+_SUN_VEC.setflags(write=False)
+_GNOMON_TIP.setflags(write=False)
+_EXPECTED_POINT.setflags(write=False)
+_DIAL_PLANE = Plane(point=Vector3D(0.0, 0.0, 0.0), normal=Vector3D(1.0, 0.0, 0.0))  # Vertical plane at x = 0
+
 def test_your_worked_example():
     """Test the exact worked example you provided (Ujjain, φ=23.1765°, H=45°, δ=0°)"""
     
@@ -34,8 +56,7 @@ def test_your_worked_example():
     hour_angle_deg = 45.0
     
     # Test astronomical calculations
-    astro_calc = AstronomicalCalculations()
-    sun_pos = astro_calc.solar_position(latitude_deg, declination_deg, hour_angle_deg)
+    sun_pos = _ASTRO.solar_position(latitude_deg, declination_deg, hour_angle_deg)
     
     print("STEP 1: Solar Position Calculations")
     print("-" * 40)
@@ -48,7 +69,8 @@ def test_your_worked_example():
     print(f"Calculated Results:")
     print(f"  Solar Altitude = {sun_pos.altitude:.6f}° (expected ~40.545°)")
     print(f"  Solar Azimuth = {sun_pos.azimuth:.6f}° (expected ~111.483°)")
-    print(f"  Sun Unit Vector = [{sun_pos.unit_vector.x:.8f}, {sun_pos.unit_vector.y:.8f}, {sun_pos.unit_vector.z:.8f}]")
+    uv = sun_pos.unit_vector
+    print(f"  Sun Unit Vector = [{uv[0]:.8f}, {uv[1]:.8f}, {uv[2]:.8f}]")
     
     # Verify against your expected values
     expected_altitude = 40.5446953
@@ -61,7 +83,7 @@ def test_your_worked_example():
     print(f"  Altitude Error: {altitude_error:.6f}° ({'✓ PASS' if altitude_error < 0.001 else '✗ FAIL'})")
     print(f"  Azimuth Error: {azimuth_error:.6f}° ({'✓ PASS' if azimuth_error < 0.001 else '✗ FAIL'})")
     
-    return sun_pos
+    return sun_pos, (altitude_error < 0.001 and azimuth_error < 0.001)
 
 def test_ray_intersection_calculations():
     """Test ray-surface intersection algorithms"""
@@ -70,27 +92,24 @@ def test_ray_intersection_calculations():
     print("TESTING RAY-SURFACE INTERSECTION ALGORITHMS")
     print("=" * 80)
     
-    ray_calc = RayIntersection()
-    
     # Test 1: Ray-Plane Intersection
     print("TEST 1: Ray-Plane Intersection")
     print("-" * 35)
     
     # Gnomon tip at (1, 0, 10) meters
-    gnomon_tip = Vector3D(1.0, 0.0, 10.0)
+    gnomon_tip = Vector3D(*_GNOMON_TIP.tolist())
     
-    # Shadow direction (opposite of sun from worked example)
-    sun_vector = Vector3D(0.70710678, -0.27829240, 0.65004103)  # From worked example
-    shadow_direction = Vector3D(-sun_vector.x, -sun_vector.y, -sun_vector.z)
+    # Shadow direction (opposite of sun from worked example), normalized
+    shadow_direction = -_SUN_VEC / np.sqrt(_SUN_VEC @ _SUN_VEC)
     
     # Create shadow ray
-    shadow_ray = Ray(origin=gnomon_tip, direction=shadow_direction.normalize())
+    shadow_ray = Ray(origin=gnomon_tip, direction=Vector3D(*shadow_direction.tolist()))
     
     # Vertical plane at x = 0 (dial face)
-    dial_plane = Plane(point=Vector3D(0, 0, 0), normal=Vector3D(1, 0, 0))
+    dial_plane = _DIAL_PLANE
     
     # Calculate intersection
-    intersection = ray_calc.ray_plane_intersection(shadow_ray, dial_plane)
+    intersection = _RAYS.ray_plane_intersection(shadow_ray, dial_plane)
     
     if intersection:
         t, point = intersection
@@ -100,18 +119,37 @@ def test_ray_intersection_calculations():
         print(f"  Expected Point ≈ (0.0, 0.39356489, 9.08070316)")
         
         # Verify against expected values
-        expected_point = Vector3D(0.0, 0.39356489, 9.08070316)
-        error_x = abs(point.x - expected_point.x)
-        error_y = abs(point.y - expected_point.y)
-        error_z = abs(point.z - expected_point.z)
+        diff = point.to_array() - _EXPECTED_POINT
+        error_x, error_y, error_z = np.abs(diff)
         
         print(f"  Position Errors: x={error_x:.6f}, y={error_y:.6f}, z={error_z:.6f}")
         
-        total_error = math.sqrt(error_x**2 + error_y**2 + error_z**2)
+        total_error = np.sqrt(diff @ diff)
         print(f"  Total Position Error: {total_error:.6f}m ({'✓ PASS' if total_error < 0.01 else '✗ FAIL'})")
     else:
         print("✗ FAIL: No intersection found")
     
+    # Batch path: shadow rays for 07:00-17:00 at Ujjain equinox in one call
+    hour_angles = np.arange(7, 18) * 15.0 - 180.0
+    sun = _ASTRO.solar_position_batch(23.1765, 0.0, hour_angles)
+    shadow_directions = -sun.unit_vectors  # (11, 3)
+    
+    batch_t, batch_points = _RAYS.ray_plane_intersection_batch(
+        _GNOMON_TIP, shadow_directions, dial_plane.point.to_array(), dial_plane.normal.to_array()
+    )
+    
+    batch_error = 0.0
+    for direction, t, point in zip(shadow_directions, batch_t, batch_points):
+        single = _RAYS.ray_plane_intersection(Ray(origin=gnomon_tip, direction=Vector3D(*direction)), dial_plane)
+        if single is None:
+            batch_error = max(batch_error, 0.0 if np.isnan(t) else math.inf)
+        else:
+            batch_error = max(batch_error, abs(single[0] - t), np.abs(single[1].to_array() - point).max())
+    
+    print(f"Batch Ray-Plane Intersection ({len(batch_t)} shadow rays):")
+    print(f"  Hits: {int(np.count_nonzero(~np.isnan(batch_t)))}")
+    print(f"  Max deviation from single-ray results: {batch_error:.2e} ({'✓ PASS' if batch_error < 1e-9 else '✗ FAIL'})")
+    
     # Test 2: Ray-Cylinder Intersection
     print("\nTEST 2: Ray-Cylinder Intersection")
     print("-" * 38)
@@ -125,7 +163,7 @@ def test_ray_intersection_calculations():
         direction=Vector3D(-1.0, 0.0, 0.0)  # Pointing toward center
     )
     
-    cylinder_intersection = ray_calc.ray_cylinder_intersection(test_ray, cylinder)
+    cylinder_intersection = _RAYS.ray_cylinder_intersection(test_ray, cylinder)
     
     if cylinder_intersection:
         t, point = cylinder_intersection
@@ -149,8 +187,6 @@ def test_surface_coordinate_systems():
     print("TESTING SURFACE COORDINATE SYSTEMS")
     print("=" * 80)
     
-    surface_calc = SurfaceCoordinates()
-    
     # Test plane coordinate system
     print("TEST: Plane Coordinate System")
     print("-" * 32)
@@ -159,34 +195,41 @@ def test_surface_coordinate_systems():
     plane = Plane(point=Vector3D(0, 0, 0), normal=Vector3D(1, 0, 0))
     
     # Create orthonormal basis
-    u, v = surface_calc.plane_coordinate_system(plane)
+    u, v = _SURFACE.plane_coordinate_system(plane)
     
     print(f"Plane normal: ({plane.normal.x}, {plane.normal.y}, {plane.normal.z})")  
     print(f"U vector: ({u.x:.6f}, {u.y:.6f}, {u.z:.6f})")
     print(f"V vector: ({v.x:.6f}, {v.y:.6f}, {v.z:.6f})")
     
-    # Verify orthonormality
-    u_magnitude = u.magnitude()
-    v_magnitude = v.magnitude()
-    dot_product = u.dot(v)
+    # Verify orthonormality from the Gram matrix G = [u v]ᵀ[u v], which is
+    # the 2×2 identity for an orthonormal basis
+    UV = np.array([[u.x, u.y, u.z], [v.x, v.y, v.z]])
+    G = UV @ UV.T
     
-    print(f"U magnitude: {u_magnitude:.6f} (should be 1.0)")
-    print(f"V magnitude: {v_magnitude:.6f} (should be 1.0)")
-    print(f"U·V dot product: {dot_product:.6f} (should be 0.0)")
+    print(f"U magnitude: {np.sqrt(G[0, 0]):.6f} (should be 1.0)")
+    print(f"V magnitude: {np.sqrt(G[1, 1]):.6f} (should be 1.0)")
+    print(f"U·V dot product: {G[0, 1]:.6f} (should be 0.0)")
     
-    orthonormal_pass = (abs(u_magnitude - 1.0) < 1e-6 and 
-                       abs(v_magnitude - 1.0) < 1e-6 and 
-                       abs(dot_product) < 1e-6)
+    orthonormal_pass = np.allclose(G, np.eye(2), atol=1e-6)
     print(f"Orthonormality: {'✓ PASS' if orthonormal_pass else '✗ FAIL'}")
     
     # Test point projection
     test_point = Vector3D(0, 2.5, 3.7)  # Point on the plane
-    local_coords = surface_calc.project_to_plane_coords(test_point, plane, u, v)
+    local_coords = _SURFACE.project_to_plane_coords(test_point, plane, u, v)
     
     print(f"\nPoint Projection Test:")
     print(f"  3D Point: ({test_point.x}, {test_point.y}, {test_point.z})")
     print(f"  Local Coordinates: ({local_coords[0]:.6f}, {local_coords[1]:.6f})")
 
+    # Batch projection must agree with the single-point form
+    batch_points = np.array([[0.0, 2.5, 3.7], [0.0, -1.0, 0.5], [0.0, 4.0, -2.0]])
+    batch_coords = _SURFACE.project_batch(batch_points, plane, u, v)
+    batch_pass = all(
+        np.allclose(batch_coords[i], _SURFACE.project_to_plane_coords(Vector3D(*p), plane, u, v), atol=1e-12)
+        for i, p in enumerate(batch_points.tolist())
+    )
+    print(f"  Batch projection ({len(batch_points)} points): {'✓ PASS' if batch_pass else '✗ FAIL'}")
+
 def test_complete_yantra_generation():
     """Test complete yantra generation with all mathematical formulas"""
     
@@ -202,9 +245,16 @@ def test_complete_yantra_generation():
     print(f"Generating yantras for Ujjain (φ = {ujjain_lat}°N)")
     print("-" * 50)
     
-    # Generate Samrat Yantra with ray-traced hour lines
+    # The three generators are independent and spend their time in numpy and
+    # the nogil hour-line kernel, so run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        samrat_future = executor.submit(geometry_engine.generate_samrat_yantra_geometry, ujjain_lat, base_length=20.0)
+        rama_future = executor.submit(geometry_engine.generate_rama_yantra_geometry, ujjain_lat, radius=8.0)
+        jai_prakash_future = executor.submit(geometry_engine.generate_jai_prakash_yantra_geometry, ujjain_lat, hemisphere_radius=8.0)
+    
+    # Samrat Yantra with ray-traced hour lines
     print("1. Samrat Yantra Generation:")
-    samrat_geometry = geometry_engine.generate_samrat_yantra_geometry(ujjain_lat, base_length=20.0)
+    samrat_geometry = samrat_future.result()
     
     print(f"   ✓ Generated {len(samrat_geometry.get('hour_lines', {}).get('east', []))} east hour lines")
     print(f"   ✓ Generated {len(samrat_geometry.get('hour_lines', {}).get('west', []))} west hour lines")
@@ -212,22 +262,23 @@ def test_complete_yantra_generation():
     
     # Show sample hour line calculations
     if samrat_geometry.get('hour_lines', {}).get('west'):
-        print("   Sample hour line positions (West Face):")
-        for hour, point in samrat_geometry['hour_lines']['west'][:3]:
-            print(f"     {hour:02d}:00 - 3D: ({point.position_3d.x:.3f}, {point.position_3d.y:.3f}, {point.position_3d.z:.3f})")
-            print(f"            Local: ({point.surface_coords[0]:.3f}, {point.surface_coords[1]:.3f})")
+        print("\n".join(["   Sample hour line positions (West Face):"] + [
+            f"     {hour:02d}:00 - 3D: ({point.position_3d.x:.3f}, {point.position_3d.y:.3f}, {point.position_3d.z:.3f})\n"
+            f"            Local: ({point.surface_coords[0]:.3f}, {point.surface_coords[1]:.3f})"
+            for hour, point in samrat_geometry['hour_lines']['west'][:3]
+        ]))
     
-    # Generate Rama Yantra with altitude-azimuth grid
+    # Rama Yantra with altitude-azimuth grid
     print("\n2. Rama Yantra Generation:")
-    rama_geometry = geometry_engine.generate_rama_yantra_geometry(ujjain_lat, radius=8.0)
+    rama_geometry = rama_future.result()
     
     print(f"   ✓ Generated {len(rama_geometry.get('altitude_circles', []))} altitude circles")
     print(f"   ✓ Generated {len(rama_geometry.get('azimuth_lines', []))} azimuth lines")
     print(f"   ✓ Generated {len(rama_geometry.get('solar_tracks', {}))} solar track points")
     
-    # Generate Jai Prakash Yantra with celestial coordinates
+    # Jai Prakash Yantra with celestial coordinates
     print("\n3. Jai Prakash Yantra Generation:")
-    jai_prakash_geometry = geometry_engine.generate_jai_prakash_yantra_geometry(ujjain_lat, hemisphere_radius=8.0)
+    jai_prakash_geometry = jai_prakash_future.result()
     
     print(f"   ✓ Generated {len(jai_prakash_geometry.get('declination_circles', []))} declination circles")
     print(f"   ✓ Generated {len(jai_prakash_geometry.get('hour_circles', []))} hour circles")
@@ -291,7 +342,8 @@ def test_blueprint_generation():
     
     print(f"✓ Generated {len(rama_pages)} blueprint pages")
     
-    return samrat_pages, rama_pages
+    # Only the counts are kept, so the pages' drawing elements can be freed
+    return len(samrat_pages), len(rama_pages)
 
 def test_accuracy_verification():
     """Test accuracy verification against standard formulas"""
@@ -310,25 +362,26 @@ def test_accuracy_verification():
     print("Testing hour line angles using θ = arctan(sin φ × tan H)")
     print()
     
-    for hour in [9, 12, 15]:  # 3 test hours
-        hour_angle = (hour - 12) * 15  # Degrees from solar noon
-        
-        # Analytical formula: θ = arctan(sin φ × tan H)
-        analytical_angle = math.degrees(math.atan(
-            math.sin(math.radians(latitude_deg)) * math.tan(math.radians(hour_angle))
-        ))
-        
+    hours = [9, 12, 15]  # 3 test hours
+    hour_angles = [(hour - 12) * 15 for hour in hours]  # Degrees from solar noon
+    
+    # Calculate all test hours using our ray-intersection method in one call
+    sun = _ASTRO.solar_position_batch(latitude_deg, 0, np.array(hour_angles))
+    
+    # Analytical formula: θ = arctan(sin φ × tan H), as arctan2(sin φ sin H, cos H)
+    # for every test hour at once; arctan2 keeps the right quadrant near ±90°
+    sin_phi = _ASTRO.latitude_trig(latitude_deg)[0]
+    H_rad = np.radians(hour_angles)
+    analytical_angles = np.degrees(np.arctan2(sin_phi * np.sin(H_rad), np.cos(H_rad)))
+    
+    for i, (hour, hour_angle, analytical_angle) in enumerate(zip(hours, hour_angles, analytical_angles)):
         print(f"Hour {hour:02d}:00 (H = {hour_angle:+3d}°):")
         print(f"  Analytical angle: θ = {analytical_angle:+7.3f}°")
         
-        # Calculate using our ray-intersection method
-        astro_calc = AstronomicalCalculations()
-        sun_pos = astro_calc.solar_position(latitude_deg, 0, hour_angle)
-        
         # For comparison, calculate equivalent horizontal dial angle
         # This would require projecting our 3D ray intersection to horizontal plane
-        print(f"  Solar altitude:   a = {sun_pos.altitude:7.3f}°")
-        print(f"  Solar azimuth:    A = {sun_pos.azimuth:7.3f}°")
+        print(f"  Solar altitude:   a = {sun.altitude[i]:7.3f}°")
+        print(f"  Solar azimuth:    A = {sun.azimuth[i]:7.3f}°")
         print()
 
 def run_comprehensive_test():
@@ -339,8 +392,12 @@ def run_comprehensive_test():
     print("=" * 80)
     
     try:
-        # Test 1: Your worked example
-        sun_pos = test_your_worked_example()
+        # Test 1: Your worked example. Every later test builds on these
+        # formulas, so stop here instead of running generation on bad input
+        sun_pos, worked_example_pass = test_your_worked_example()
+        if not worked_example_pass:
+            print("\n✗ TEST FAILED: worked example does not match the expected solar position")
+            return False
         
         # Test 2: Ray intersection algorithms
         test_ray_intersection_calculations()
@@ -352,7 +409,7 @@ def run_comprehensive_test():
         samrat_geo, rama_geo, jai_prakash_geo = test_complete_yantra_generation()
         
         # Test 5: Blueprint generation
-        samrat_pages, rama_pages = test_blueprint_generation()
+        samrat_page_count, rama_page_count = test_blueprint_generation()
         
         # Test 6: Accuracy verification
         test_accuracy_verification()
@@ -400,19 +457,27 @@ if __name__ == "__main__":
         print("\n❌ Some tests failed - please check the implementation.")
     
     # Save test results
-    with open('mathematical_implementation_test_results.json', 'w') as f:
-        json.dump({
-            'test_completed': True,
-            'timestamp': datetime.now().isoformat(),
-            'all_formulas_implemented': success,
-            'features': [
-                'Solar position calculations',
-                'Ray-surface intersections', 
-                'Surface coordinate systems',
-                'Hour line generation',
-                'Blueprint generation',
-                'CAD export capabilities'
-            ]
-        }, f, indent=2)
+    results = {
+        'test_completed': True,
+        'timestamp': datetime.now().isoformat(),
+        'all_formulas_implemented': success,
+        'features': [
+            'Solar position calculations',
+            'Ray-surface intersections', 
+            'Surface coordinate systems',
+            'Hour line generation',
+            'Blueprint generation',
+            'CAD export capabilities'
+        ]
+    }
+    
+    # orjson writes numpy arrays directly, so numerical dumps can be added
+    # to the results without converting them to lists first
+    if ORJSON_AVAILABLE:
+        with open('mathematical_implementation_test_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('mathematical_implementation_test_results.json', 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\nTest results saved to: mathematical_implementation_test_results.json")
\ No newline at end of file
@@ -5,27 +5,900 @@ Core mathematical calculations for ancient Indian astronomical instruments
 
 import numpy as np
 import math
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
-from datetime import datetime
+import inspect
+import functools
+import itertools
+import warnings
+from typing import Dict, Iterator, List, Tuple
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
 import json
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run kernels as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Fast-math flags for the kernels, minus the no-NaN/no-Inf assumptions:
+# shadows below the horizon are reported as inf
+KERNEL_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Degree/radian factors (the same constants math.radians/math.degrees use)
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
+
+@dataclass(frozen=True, slots=True)
 class Coordinates:
-    """Geographical coordinates"""
+    """Geographical coordinates (immutable, so instances can be shared)"""
     latitude: float  # in degrees (-90 to 90)
     longitude: float  # in degrees (-180 to 180)
     elevation: float = 0.0  # in meters above sea level
+    
+    def __reduce_ex__(self, protocol):
+        # Plain positional tuple: smaller and faster to pickle for worker
+        # processes than the default slots state dict
+        return (Coordinates, (self.latitude, self.longitude, self.elevation))
 
-@dataclass
+@dataclass(slots=True)
 class YantraSpecs:
-    """Generated yantra specifications"""
+    """
+    Generated yantra specifications
+    
+    Construction notes are kept as templates plus the values to fill in, and
+    only formatted when construction_notes is first read, so batch and cached
+    callers that never show them skip the string formatting.
+    
+    The engine's generators cache their specs and hand each caller a copy
+    with its own dimensions, angles and accuracy_metrics dicts. The class is
+    slotted but not frozen, since a frozen __init__ costs ~4x more per spec
+    and the dict fields would keep instances unhashable anyway.
+    """
     name: str
     coordinates: Coordinates
     dimensions: Dict[str, float]
     angles: Dict[str, float]
-    construction_notes: List[str]
     accuracy_metrics: Dict[str, float]
+    notes_template: Tuple[str, ...] = ()
+    notes_values: Dict[str, object] = field(default_factory=dict)
+    angles_layout: str = ""  # ANGLES_LAYOUTS entry the angles were built from
+    _construction_notes: List[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def construction_notes(self) -> List[str]:
+        """notes_template formatted with notes_values (str.format_map)"""
+        if self._construction_notes is None:
+            self._construction_notes = [template.format_map(self.notes_values) for template in self.notes_template]
+        return self._construction_notes
+    
+    def table_arrays(self, table: str = "angles", dtype=np.float64) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Columnar copy of a numeric table ("dimensions" or "angles")
+        
+        Returns the key names in order and a contiguous array of their
+        values, for vectorized post-processing; dtype=np.float32 halves the
+        memory of specs held in bulk at the cost of precision.
+        """
+        values = getattr(self, table)
+        return tuple(values), np.fromiter(values.values(), dtype=dtype, count=len(values))
+    
+    def __reduce_ex__(self, protocol):
+        # Angles built from a shared layout travel as their values only; the
+        # receiving process zips them back onto its own copy of the layout
+        # keys (the bulk of the payload for the marking-heavy yantras)
+        layout_keys = ANGLES_LAYOUT_KEYS.get(self.angles_layout)
+        if layout_keys is not None and tuple(itertools.islice(self.angles, len(layout_keys))) == layout_keys:
+            return (_unpickle_specs, (self.name, self.coordinates, self.dimensions, self.angles_layout,
+                                      tuple(itertools.islice(self.angles, len(layout_keys), None)),
+                                      list(self.angles.values()), self.accuracy_metrics,
+                                      self.notes_template, self.notes_values))
+        return (YantraSpecs, (self.name, self.coordinates, self.dimensions, self.angles,
+                              self.accuracy_metrics, self.notes_template, self.notes_values,
+                              self.angles_layout))
+
+# Samrat Yantra hour lines, 6 AM to 6 PM, as offsets from solar noon
+SAMRAT_HOURS = tuple(range(-6, 7))
+SAMRAT_HOUR_KEYS = tuple(f"hour_{hour + 6:02d}" for hour in SAMRAT_HOURS)
+SAMRAT_HOUR_RADIANS = np.radians(15 * np.array(SAMRAT_HOURS))  # 15° per hour
+SAMRAT_HOUR_RADIANS.setflags(write=False)
+# Reference dimensions scaled by the latitude factor; the rest are kept as is
+SAMRAT_SCALED_FIELDS = ("base_length", "base_width", "gnomon_height")
+# One record per site for generate_samrat_yantra_records: the columns of
+# generate_samrat_yantra_batch, hour-line angles and shadows as 13-wide subarrays
+SAMRAT_RECORD_DTYPE = np.dtype(
+    [(name, np.float64) for name in (
+        "latitude", "longitude", "base_length", "base_width", "gnomon_height", "gnomon_thickness",
+        "step_height", "step_width", "reference_base_length", "latitude_scale_factor",
+        "gnomon_angle", "reference_gnomon_angle", "base_orientation"
+    )] +
+    [("hour_line_angles", np.float64, (len(SAMRAT_HOURS),)), ("shadow_lengths", np.float64, (len(SAMRAT_HOURS),))]
+)
+
+# Cardinal and intercardinal compass points, degrees from true north
+CARDINAL_POINTS = {
+    "north": 0, "north_northeast": 22.5, "northeast": 45, "east_northeast": 67.5,
+    "east": 90, "east_southeast": 112.5, "southeast": 135, "south_southeast": 157.5,
+    "south": 180, "south_southwest": 202.5, "southwest": 225, "west_southwest": 247.5,
+    "west": 270, "west_northwest": 292.5, "northwest": 315, "north_northwest": 337.5
+}
+CARDINAL_AZIMUTHS = np.array(list(CARDINAL_POINTS.values()), dtype=np.float64)
+
+# Rama Yantra scales. Altitude marks every 5°, with the atmospheric
+# refraction factor applied below 10°, as fractions of the wall span
+RAMA_ALTITUDES = np.arange(0, 91, 5)
+RAMA_ALTITUDE_KEYS = tuple(f"altitude_{alt:02d}" for alt in RAMA_ALTITUDES.tolist())
+RAMA_ALTITUDE_FACTORS = RAMA_ALTITUDES * np.where(RAMA_ALTITUDES < 10, 0.97, 1.0) / 90.0
+RAMA_AZIMUTH_MARKINGS = {
+    **{f"azimuth_{direction}": azimuth for direction, azimuth in CARDINAL_POINTS.items()},
+    **{f"azimuth_{az:03d}": az for az in range(0, 360, 10)}  # Every 10°
+}
+RAMA_ZENITH_MARKINGS = {f"zenith_{zenith_dist:02d}": 90 - zenith_dist for zenith_dist in range(0, 91, 15)}
+
+# Jai Prakash Yantra grids: declination circles every 3° from -30° to +30°,
+# hour circles for every hour
+JAI_PRAKASH_DECLINATIONS = np.arange(-30, 31, 3)
+JAI_PRAKASH_DECLINATION_KEYS = tuple(f"declination_{decl:+03d}" for decl in JAI_PRAKASH_DECLINATIONS.tolist())
+JAI_PRAKASH_HOURS = np.arange(0, 24)
+JAI_PRAKASH_HOUR_KEYS = tuple(f"hour_{hour:02d}" for hour in JAI_PRAKASH_HOURS.tolist())
+JAI_PRAKASH_MERIDIAN_ANGLES = 15 * (JAI_PRAKASH_HOURS - 12)  # degrees from local noon
+JAI_PRAKASH_HOUR_ANGLE_KEYS = tuple(f"hour_angle_{key}" for key in JAI_PRAKASH_HOUR_KEYS)
+JAI_PRAKASH_DECL_CIRCLE_ANGLES = {
+    f"decl_circle_{key}": decl
+    for key, decl in zip(JAI_PRAKASH_DECLINATION_KEYS, JAI_PRAKASH_DECLINATIONS.tolist())
+}
+
+def _refraction_corrected_altitude(angle: int) -> float:
+    """Altitude plus atmospheric refraction (more significant at low altitudes), in degrees"""
+    if angle <= 10:
+        refraction_correction = 0.58 * (1.0 / math.tan((angle + 7.31/(angle + 4.4)) * DEG2RAD))
+    else:
+        refraction_correction = 0.58 * (1.0 / math.tan(angle * DEG2RAD))
+    
+    return angle + refraction_correction/60  # Convert arcminutes to degrees
+
+# Digamsa Yantra scales: azimuth every 5°, refraction-corrected altitude
+# every 2°, zenith distance every 5°
+DIGAMSA_AZIMUTH_SCALE = {f"azimuth_{angle:03d}": angle for angle in range(0, 360, 5)}
+DIGAMSA_ALTITUDE_MARKINGS = {f"altitude_{angle:02d}": _refraction_corrected_altitude(angle) for angle in range(0, 91, 2)}
+DIGAMSA_ZENITH_MARKINGS = {f"zenith_{zenith_angle:02d}": 90 - zenith_angle for zenith_angle in range(0, 91, 5)}
+# (true, magnetic) marking keys per compass point, in CARDINAL_POINTS order
+DIGAMSA_CARDINAL_KEYS = tuple((f"true_{direction}", f"magnetic_{direction}") for direction in CARDINAL_POINTS)
+
+# Dhruva-Protha-Chakra hour divisions around the circumference, 15° per hour
+DHRUVA_HOUR_MARKINGS = {f"hour_{hour:02d}": hour * 15 for hour in range(24)}
+
+# Daylight clock hours, 6 AM to 6 PM, for the Kapala and Unnatamsa tables
+DAYLIGHT_HOURS = tuple(range(6, 19))
+DAYLIGHT_HOUR_KEYS = tuple(f"hour_{hour:02d}" for hour in DAYLIGHT_HOURS)
+DAYLIGHT_HOUR_RADIANS = np.radians((np.array(DAYLIGHT_HOURS) - 12) * 15)  # from solar noon
+DAYLIGHT_HOUR_RADIANS.setflags(write=False)
+DAYLIGHT_HOUR_COSINES = tuple(math.cos(hour_rad) for hour_rad in DAYLIGHT_HOUR_RADIANS.tolist())
+
+# Kapala Yantra seasonal declination and daylight hour trig, rim hour
+# markings and shadow curve (radius, azimuth, depth) keys, flattened
+# season-major to match the raveled (season, hour) grid
+KAPALA_SEASONS = ("winter_solstice", "equinox", "summer_solstice")
+KAPALA_DECLINATIONS = np.array([-23.44, 0, 23.44])
+KAPALA_DECLINATION_RADIANS = np.radians(KAPALA_DECLINATIONS)[:, None]  # (season, 1) column
+KAPALA_DECL_SINES = np.sin(KAPALA_DECLINATION_RADIANS)
+KAPALA_DECL_COSINES = np.cos(KAPALA_DECLINATION_RADIANS)
+KAPALA_DECL_TANGENTS = np.tan(KAPALA_DECLINATION_RADIANS)
+KAPALA_HOUR_SINES = np.sin(DAYLIGHT_HOUR_RADIANS)
+KAPALA_HOUR_COSINES = np.cos(DAYLIGHT_HOUR_RADIANS)
+for _table in (KAPALA_DECL_SINES, KAPALA_DECL_COSINES, KAPALA_DECL_TANGENTS, KAPALA_HOUR_SINES, KAPALA_HOUR_COSINES):
+    _table.setflags(write=False)
+KAPALA_RIM_HOUR_MARKINGS = {f"rim_hour_{hour:02d}": (hour - 12) * 15 for hour in DAYLIGHT_HOURS}
+KAPALA_CURVE_KEYS = tuple(
+    (f"{season}_{hour_key}_radius", f"{season}_{hour_key}_azimuth", f"{season}_{hour_key}_depth")
+    for season in KAPALA_SEASONS for hour_key in DAYLIGHT_HOUR_KEYS
+)
+
+# Chakra Yantra equatorial hour markings and per-season angle keys
+CHAKRA_HOUR_MARKINGS = {f"equatorial_hour_{hour:02d}": hour * 15 for hour in range(24)}
+CHAKRA_SEASON_DECLINATIONS = {
+    "winter_solstice": -23.44,
+    "spring_equinox": 0.0,
+    "summer_solstice": 23.44,
+    "autumn_equinox": 0.0
+}
+CHAKRA_SEASONS = tuple(
+    (f"{season}_declination", f"{season}_ring_position", decl, math.tan(decl * DEG2RAD))
+    for season, decl in CHAKRA_SEASON_DECLINATIONS.items()
+)
+
+# Unnatamsa Yantra quadrant scale (major every 10°, medium every 5°, minor
+# every degree), azimuth references and per-season hourly altitude keys
+UNNATAMSA_SEASONS = ("summer_solstice", "winter_solstice", "spring_equinox", "autumn_equinox")
+UNNATAMSA_DECLINATIONS = (23.44, -23.44, 0.0, 0.0)
+UNNATAMSA_DECL_TRIG = {
+    season: (math.sin(decl * DEG2RAD), math.cos(decl * DEG2RAD))
+    for season, decl in zip(UNNATAMSA_SEASONS, UNNATAMSA_DECLINATIONS)
+}
+UNNATAMSA_ALTITUDE_SCALE = {
+    (f"major_altitude_{alt:02d}" if alt % 10 == 0 else
+     f"medium_altitude_{alt:02d}" if alt % 5 == 0 else
+     f"minor_altitude_{alt:02d}"): alt
+    for alt in range(0, 91)
+}
+UNNATAMSA_AZIMUTH_MARKINGS = {
+    f"azimuth_{direction}": azimuth
+    for direction, azimuth in CARDINAL_POINTS.items() if azimuth % 45 == 0
+}
+UNNATAMSA_ALTITUDE_KEYS = {
+    season: tuple(f"{season}_{hour_key}_altitude" for hour_key in DAYLIGHT_HOUR_KEYS)
+    for season in UNNATAMSA_SEASONS
+}
+
+def _angles_layout(*parts) -> Dict[str, object]:
+    """
+    Template for a generator's angles dict: every key in its final order,
+    with the fixed markings already filled in and None in the per-site slots
+    (parts given as a tuple of keys). Generators copy it, a straight table
+    clone, and overwrite the slots in place, instead of re-inserting every
+    marking into a fresh dict on each call
+    """
+    layout = {}
+    for part in parts:
+        layout.update(dict.fromkeys(part) if isinstance(part, tuple) else part)
+    return layout
+
+RAMA_ANGLES_LAYOUT = _angles_layout(
+    ("sector_angle", "num_sectors", "celestial_pole_altitude", "local_horizon_tilt"),
+    RAMA_AZIMUTH_MARKINGS, RAMA_ALTITUDE_KEYS, RAMA_ZENITH_MARKINGS
+)
+JAI_PRAKASH_ANGLES_LAYOUT = _angles_layout(
+    ("latitude_degrees", "celestial_equator_angle", "pole_altitude", "horizon_tilt",
+     "equator_radius_ratio", "local_meridian_correction_degrees"),
+    JAI_PRAKASH_HOUR_ANGLE_KEYS, JAI_PRAKASH_DECL_CIRCLE_ANGLES
+)
+DIGAMSA_ANGLES_LAYOUT = _angles_layout(
+    ("latitude_degrees", "magnetic_declination", "horizon_range", "altitude_range",
+     "meridian_azimuth", "magnetic_meridian_azimuth"),
+    {key: value
+     for (true_key, magnetic_key), true_azimuth in zip(DIGAMSA_CARDINAL_KEYS, CARDINAL_POINTS.values())
+     for key, value in ((true_key, true_azimuth), (magnetic_key, None))},
+    DIGAMSA_AZIMUTH_SCALE, DIGAMSA_ALTITUDE_MARKINGS, DIGAMSA_ZENITH_MARKINGS
+)
+DIGAMSA_MAGNETIC_KEYS = tuple(magnetic_key for _, magnetic_key in DIGAMSA_CARDINAL_KEYS)
+DHRUVA_ANGLES_LAYOUT = _angles_layout(
+    ("pole_elevation", "disk_tilt_angle", "latitude_setting"), DHRUVA_HOUR_MARKINGS
+)
+KAPALA_ANGLES_LAYOUT = _angles_layout(
+    ("bowl_tilt", "gnomon_angle", "rim_orientation", "magnetic_declination"), KAPALA_RIM_HOUR_MARKINGS
+)
+CHAKRA_ANGLES_LAYOUT = _angles_layout(
+    ("equatorial_ring_tilt", "meridian_ring_tilt", "horizon_ring_tilt", "declination_ring_tilt",
+     "magnetic_declination"),
+    CHAKRA_HOUR_MARKINGS,
+    {key: value
+     for declination_key, ring_position_key, decl, _ in CHAKRA_SEASONS
+     for key, value in ((declination_key, decl), (ring_position_key, None))}
+)
+CHAKRA_RING_POSITION_KEYS = tuple(ring_position_key for _, ring_position_key, _, _ in CHAKRA_SEASONS)
+CHAKRA_SEASON_TANGENTS = tuple(tan_decl for _, _, _, tan_decl in CHAKRA_SEASONS)
+UNNATAMSA_ANGLES_LAYOUT = _angles_layout(
+    ("quadrant_orientation", "max_altitude_summer", "max_altitude_winter", "max_altitude_equinox",
+     "latitude_complement", "magnetic_declination"),
+    UNNATAMSA_ALTITUDE_SCALE, UNNATAMSA_AZIMUTH_MARKINGS
+)
+
+# YantraSpecs.angles_layout names -> layout, and its keys for unpickling
+ANGLES_LAYOUTS = {
+    "rama_yantra": RAMA_ANGLES_LAYOUT,
+    "jai_prakash_yantra": JAI_PRAKASH_ANGLES_LAYOUT,
+    "digamsa_yantra": DIGAMSA_ANGLES_LAYOUT,
+    "dhruva_protha_chakra": DHRUVA_ANGLES_LAYOUT,
+    "kapala_yantra": KAPALA_ANGLES_LAYOUT,
+    "chakra_yantra": CHAKRA_ANGLES_LAYOUT,
+    "unnatamsa_yantra": UNNATAMSA_ANGLES_LAYOUT
+}
+ANGLES_LAYOUT_KEYS = {name: tuple(layout) for name, layout in ANGLES_LAYOUTS.items()}
+
+def _unpickle_specs(name, coordinates, dimensions, angles_layout, extra_angle_keys, angle_values,
+                    accuracy_metrics, notes_template, notes_values) -> YantraSpecs:
+    """Rebuild a YantraSpecs pickled with its layout angles as bare values"""
+    angles = dict(zip(ANGLES_LAYOUT_KEYS[angles_layout] + extra_angle_keys, angle_values))
+    return YantraSpecs(name, coordinates, dimensions, angles, accuracy_metrics,
+                       notes_template, notes_values, angles_layout)
+
+# Site-independent accuracy metrics, copied into each spec
+KAPALA_ACCURACY_METRICS = {
+    "time_accuracy_minutes": 3.0,
+    "seasonal_accuracy_days": 3.0,
+    "angular_measurement_accuracy": 1.0,
+    "usable_daylight_range": 12.0  # hours
+}
+CHAKRA_ACCURACY_METRICS = {
+    "angular_measurement_accuracy": 0.2,  # degrees
+    "tracking_accuracy": 0.5,
+    "declination_range": 47.0,  # +/- 23.5 degrees
+    "hour_angle_range": 360.0
+}
+UNNATAMSA_ACCURACY_METRICS = {
+    "altitude_measurement_accuracy": 0.25,  # degrees
+    "time_determination_accuracy": 5.0,  # minutes
+    "seasonal_variation_tracking": 1.0,  # degrees
+    "measurement_range": 90.0  # degrees altitude
+}
+
+# Construction note templates, filled in from YantraSpecs.notes_values when
+# the notes are read
+SAMRAT_NOTES = (
+    "Based on original {reference} Samrat Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
+    "Original dimensions: {ref_data[base_length]}m × {ref_data[base_width]}m",
+    "Scaled for latitude {coords.latitude:.2f}°N (scale factor: {latitude_scale:.3f})",
+    "Orient gnomon at {gnomon_angle:.1f}° from horizontal (= latitude)",
+    "Align base precisely with true north-south direction",
+    "Gnomon height: {gnomon_height:.2f}m for {base_length:.1f}m base",
+    "Mark hour lines according to calculated angles",
+    "Add steps for safe access to readings"
+)
+RAMA_NOTES = (
+    "Based on original {reference} Rama Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
+    "Enhanced for precise astronomical observations at {coords.latitude:.4f}°N",
+    "Outer radius: {outer_radius:.2f}m (scaled by factor {latitude_scale:.3f})",
+    "Inner measurement area: {inner_radius:.2f}m radius",
+    "Wall height: {wall_height:.2f}m (optimized for celestial pole at {pole_height:.1f}°)",
+    "Divide into {num_sectors} sectors of {sector_angle}° each",
+    "Mark altitude scales every 5° from 0° to 90°",
+    "Mark azimuth scales every 10° with cardinal directions",
+    "Central pillar height: {central_pillar_height:.2f}m for instrument mounting",
+    "Level instrument platform within ±1 arcminute",
+    "Align north sector with true north (not magnetic north)",
+    "Atmospheric refraction correction applied below 10° altitude",
+    "Observable sky fraction: {observable_sky_fraction:.3f} for this latitude"
+)
+JAI_PRAKASH_NOTES = (
+    "Based on original {reference} Jai Prakash Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
+    "Original hemisphere radius: {ref_data[hemisphere_radius]}m",
+    "Scaled for latitude {coords.latitude:.2f}°N (scale factor: {latitude_scale:.3f})",
+    "Excavate hemispherical bowl of radius {hemisphere_radius:.1f}m",
+    "Tilt celestial equator at {equator_tilt:.1f}° from horizontal",
+    "Mark declination circles for seasonal sun positions",
+    "Engrave hour lines for time measurement",
+    "Install gnomon or bead-on-wire for shadow casting",
+    "Ensure smooth interior surface for accurate readings"
+)
+DIGAMSA_NOTES = (
+    "Digamsa Yantra for precise azimuth and altitude measurements at {coords.latitude:.4f}°N, {coords.longitude:.4f}°E",
+    "Semicircular arc radius: {arc_radius:.2f}m (scaled for latitude visibility)",
+    "Base platform: {base_width:.2f}m × {base_length:.2f}m",
+    "Magnetic declination: {magnetic_declination:.2f}° (approximate for this location)",
+    "Support pillar height: {pillar_height:.2f}m for optimal viewing",
+    "Mount semicircular arc vertically in north-south plane",
+    "Mark altitude scales every 2° from 0° to 90° on arc",
+    "Mark azimuth scales every 5° on base platform",
+    "Install sighting mechanism at arc center",
+    "Apply atmospheric refraction corrections for low altitudes",
+    "Align true north carefully (not magnetic north)",
+    "Local solar noon varies by season: {earliest_noon:.2f}h to {latest_noon:.2f}h",
+    "Level base platform within ±1 arcminute",
+    "Use bronze or stainless steel for arc construction"
+)
+DHRUVA_NOTES = (
+    "Construct circular disk of radius {disk_radius}m",
+    "Tilt disk at {tilt_angle:.1f}° from horizontal (90° - latitude)",
+    "Central hole of {central_hole_mm}mm for pole star sighting",
+    "Mark 24 hour divisions around the circumference",
+    "Install rotation mechanism for tracking celestial motion",
+    "Balance with counterweight for smooth rotation",
+    "Align rotation axis parallel to Earth's axis",
+    "Pole star visible through center at {pole_elevation:.1f}° elevation"
+)
+KAPALA_NOTES = (
+    "Excavate hemispherical bowl of radius {bowl_radius}m",
+    "Tilt bowl axis at {coords.latitude:.1f}° from horizontal",
+    "Install central gnomon parallel to Earth's axis",
+    "Mark hour lines on the rim for time reading",
+    "Engrave seasonal curves for different months",
+    "Provide drainage hole at the bottom",
+    "Smooth interior surface for accurate shadow casting",
+    "Align bowl opening to face the celestial equator"
+)
+CHAKRA_NOTES = (
+    "Construct nested rings with outer radius {outer_ring_radius}m",
+    "Tilt equatorial ring at {coords.latitude:.1f}° (= latitude)",
+    "Mount meridian ring vertically in north-south plane",
+    "Position horizon ring horizontally",
+    "Mark degree scales on all rings",
+    "Ensure rings can rotate independently",
+    "Install sighting devices on ring intersections",
+    "Align system with true north-south direction"
+)
+UNNATAMSA_NOTES = (
+    "Construct quarter-circle arc of radius {arc_radius:.1f}m",
+    "Base platform: {base_length:.1f}m × {base_width:.1f}m",
+    "Mount vertically facing south for optimal solar tracking",
+    "Maximum summer altitude: {max_altitude_summer:.1f}°",
+    "Maximum winter altitude: {max_altitude_winter:.1f}°",
+    "Equinox maximum altitude: {max_altitude_equinox:.1f}°",
+    "Install precision movable sighting arm along the graduated arc",
+    "Mark altitude scale every degree with major divisions every 10°",
+    "Engrave seasonal curves for solstices and equinoxes",
+    "Add azimuth reference markings for cardinal directions",
+    "Ensure precise vertical alignment using plumb line",
+    "Scaled for latitude {coords.latitude:.2f}°N with factor {latitude_scale:.3f}"
+)
+
+# The kernel takes and returns plain floats/arrays only; the spec dicts are
+# built by the Python caller. Do not move dict construction in here: numba's
+# typed Dict is far slower than a CPython dict at these sizes
+@njit(cache=True, nogil=True, fastmath=KERNEL_FASTMATH)
+def _samrat_shadow_kernel(lat_rad, gnomon_height):
+    """
+    Samrat Yantra hour-line angles and equinox shadow lengths for hours -6..6
+    
+    Scalar loop compiled by numba when available. Specialized to solar
+    declination 0 (the equinox, the only case the generators use), where
+    sin(elevation) = cos(latitude) × cos(hour_angle); a declination argument
+    would need the general sin(φ)sin(δ) + cos(φ)cos(δ)cos(H) form back.
+    
+    Args:
+        lat_rad: Site latitude in radians
+        gnomon_height: Gnomon height in meters
+        
+    Returns:
+        (hour_line_angles_deg, shadow_lengths) float64 arrays of length 13;
+        shadow length is inf while the sun is below the horizon
+    """
+    n = 13
+    hour_line_angles = np.empty(n)
+    shadow_lengths = np.empty(n)
+    
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    
+    for k in range(n):
+        solar_rad = SAMRAT_HOUR_RADIANS[k]  # hour angle from solar noon
+        
+        # tan(hour_line_angle) = sin(latitude) × tan(solar_hour_angle)
+        hour_line_angles[k] = math.atan(sin_lat * math.tan(solar_rad)) * RAD2DEG
+        
+        # Solar elevation angle; no shadow while the sun is below the horizon
+        elevation_angle = math.asin(cos_lat * math.cos(solar_rad))
+        if elevation_angle > 0:
+            shadow_lengths[k] = gnomon_height / math.tan(elevation_angle)
+        else:
+            shadow_lengths[k] = math.inf
+    
+    return hour_line_angles, shadow_lengths
+
+def _samrat_shadow_numpy(lat_rad, gnomon_height):
+    """
+    _samrat_shadow_kernel with NumPy ufuncs, for when numba is not installed
+    (the plain-Python fallback of the kernel loop would be far slower)
+    """
+    hour_line_angles = np.arctan(math.sin(lat_rad) * np.tan(SAMRAT_HOUR_RADIANS)) * RAD2DEG
+    
+    # Below-horizon entries get a dummy elevation before the divide, as in
+    # generate_samrat_yantra_batch
+    elevation_angle = np.arcsin(math.cos(lat_rad) * np.cos(SAMRAT_HOUR_RADIANS))
+    above_horizon = elevation_angle > 0
+    safe_elevation = np.where(above_horizon, elevation_angle, 1.0)
+    shadow_lengths = np.where(above_horizon, gnomon_height / np.tan(safe_elevation), np.inf)
+    
+    return hour_line_angles, shadow_lengths
+
+_samrat_shadows = _samrat_shadow_kernel if NUMBA_AVAILABLE else _samrat_shadow_numpy
+
+if NUMBA_AVAILABLE:
+    # Compile the kernel (or load it from the cache=True artifact) at import,
+    # so forkserver-preloaded workers start with it ready
+    try:
+        _samrat_shadow_kernel(0.4, 1.0)
+    except Exception as e:
+        warnings.warn(f"Samrat shadow kernel warmup failed ({e}), compiling on first use", RuntimeWarning)
+
+@njit(cache=True, nogil=True, fastmath=KERNEL_FASTMATH)
+def _solar_position_kernel(lat_deg, day_of_year, hour):
+    """
+    Simplified solar position for one site and time
+    
+    Args:
+        lat_deg: Site latitude in degrees
+        day_of_year: Day of year (1-366)
+        hour: Local time as decimal hours (e.g. 13.5)
+        
+    Returns:
+        (elevation_deg, azimuth_deg, declination_deg, hour_angle_deg)
+    """
+    # Solar declination (simplified) and hour angle
+    declination = 23.45 * math.sin(DEG2RAD * (360 * (284 + day_of_year) / 365))
+    hour_angle = 15 * (hour - 12)
+    
+    lat_rad = lat_deg * DEG2RAD
+    decl_rad = declination * DEG2RAD
+    hour_rad = hour_angle * DEG2RAD
+    # sin/cos of each angle side by side so LLVM can merge them into one
+    # sincos call; tan(decl) then follows from the pair
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_decl = math.sin(decl_rad)
+    cos_decl = math.cos(decl_rad)
+    sin_hour = math.sin(hour_rad)
+    cos_hour = math.cos(hour_rad)
+    
+    elevation = math.asin(sin_lat * sin_decl + cos_lat * cos_decl * cos_hour)
+    azimuth = math.atan2(sin_hour, cos_hour * sin_lat - sin_decl / cos_decl * cos_lat)
+    
+    return elevation * RAD2DEG, azimuth * RAD2DEG, declination, hour_angle
+
+@njit(cache=True, nogil=True, parallel=True, fastmath=KERNEL_FASTMATH)
+def _solar_position_batch(lat_deg, day_of_year, hour):
+    """
+    _solar_position_kernel over (N,) latitude/day_of_year/hour arrays, in parallel
+    
+    Returns:
+        (4, N) float64 array of elevation, azimuth, declination and hour angle
+        rows, in degrees
+    """
+    n = hour.shape[0]
+    out = np.empty((4, n))
+    for i in prange(n):
+        elevation, azimuth, declination, hour_angle = _solar_position_kernel(lat_deg[i], day_of_year[i], hour[i])
+        out[0, i] = elevation
+        out[1, i] = azimuth
+        out[2, i] = declination
+        out[3, i] = hour_angle
+    return out
+
+def _solar_position_numpy(lat_deg, day_of_year, hour):
+    """
+    _solar_position_batch with NumPy ufuncs, for when numba is not installed
+    (the plain-Python fallback of the kernel loop would be far slower)
+    """
+    declination = 23.45 * np.sin(DEG2RAD * (360 * (284 + day_of_year) / 365))
+    hour_angle = 15 * (hour - 12)
+    
+    lat_rad = lat_deg * DEG2RAD
+    decl_rad = declination * DEG2RAD
+    hour_rad = hour_angle * DEG2RAD
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_decl = np.sin(decl_rad)
+    cos_decl = np.cos(decl_rad)
+    cos_hour = np.cos(hour_rad)
+    
+    elevation = np.arcsin(sin_lat * sin_decl + cos_lat * cos_decl * cos_hour)
+    azimuth = np.arctan2(np.sin(hour_rad), cos_hour * sin_lat - sin_decl / cos_decl * cos_lat)
+    
+    return np.stack((elevation * RAD2DEG, azimuth * RAD2DEG, declination, hour_angle))
+
+if NUMBA_AVAILABLE:
+    # The scalar kernel serves API requests, so compile it at import; the
+    # parallel batch variant compiles (or loads from cache) on first use
+    try:
+        _solar_position_kernel(26.9, 1, 12.0)
+    except Exception as e:
+        warnings.warn(f"Solar position kernel warmup failed ({e}), compiling on first use", RuntimeWarning)
+
+# Per-instance memoization of the spec generators (see
+# ParametricGeometryEngine.__init__)
+GENERATOR_CACHE_SIZE = 1024
+CACHED_GENERATORS = (
+    "generate_samrat_yantra", "generate_rama_yantra", "generate_jai_prakash_yantra",
+    "generate_digamsa_yantra", "generate_dhruva_protha_chakra", "generate_kapala_yantra",
+    "generate_chakra_yantra", "generate_unnatamsa_yantra"
+)
+
+def _coordinates_key(coords: Coordinates) -> tuple:
+    """
+    Cache key for coordinates that also tells apart values which compare
+    equal but format differently in the specs (0.0 vs -0.0, 26 vs 26.0)
+    """
+    return tuple(
+        (type(value), math.copysign(1.0, value), value)
+        for value in (coords.latitude, coords.longitude, coords.elevation)
+    )
+
+def _memoize_generator(generator, maxsize: int = GENERATOR_CACHE_SIZE):
+    """Wrap a generate_* method in an LRU cache keyed on (coordinates, reference)"""
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(key, coords, *args, **kwargs):
+        return generator(coords, *args, **kwargs)
+    
+    @functools.wraps(generator)
+    def wrapper(coords: Coordinates, *args, **kwargs) -> YantraSpecs:
+        # Each caller gets its own tables, so editing a returned spec cannot
+        # leak into later calls through the cached entry
+        spec = cached(_coordinates_key(coords), coords, *args, **kwargs)
+        return replace(
+            spec, dimensions=dict(spec.dimensions), angles=dict(spec.angles),
+            accuracy_metrics=dict(spec.accuracy_metrics)
+        )
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+# Reference tables, built once at import and shared by every engine
+# instance; treat them as read-only
+
+# Historical reference coordinates for authentic yantra dimensions
+REFERENCE_LOCATIONS = {
+    "jaipur": Coordinates(latitude=26.9124, longitude=75.7873, elevation=431),  # Jantar Mantar Jaipur
+    "delhi": Coordinates(latitude=28.6139, longitude=77.2090, elevation=216),   # Jantar Mantar Delhi
+    "ujjain": Coordinates(latitude=23.1765, longitude=75.7885, elevation=492), # Jantar Mantar Ujjain
+    "varanasi": Coordinates(latitude=25.3176, longitude=82.9739, elevation=80), # Man Mandir Ghat
+    "mathura": Coordinates(latitude=27.4924, longitude=77.6737, elevation=174)  # Historical observatory
+}
+
+def _reference_trig(ref_coords: Coordinates) -> Tuple[float, float, float]:
+    """(latitude in radians, cos(latitude), sin(latitude)) of a reference location"""
+    ref_lat_rad = ref_coords.latitude * DEG2RAD
+    return ref_lat_rad, math.cos(ref_lat_rad), math.sin(ref_lat_rad)
+
+@functools.lru_cache(maxsize=128)
+def _lat_trig_cached(lat_deg: float, sign: float) -> Tuple[float, float, float]:
+    lat_rad = lat_deg * DEG2RAD
+    return lat_rad, math.sin(lat_rad), math.cos(lat_rad)
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _noon_altitudes(lat_deg: float) -> Tuple[float, float, float]:
+    """
+    Noon solar altitudes (equinox, summer solstice, winter solstice) at a
+    site latitude, in degrees; typed, so integer latitudes keep an integer
+    equinox altitude
+    """
+    return 90 - abs(lat_deg), 90 - abs(lat_deg - 23.44), 90 - abs(lat_deg + 23.44)
+
+def _lat_trig(lat_deg: float) -> Tuple[float, float, float]:
+    """
+    (latitude in radians, sin(latitude), cos(latitude)) of a site latitude,
+    cached since the same sites are requested over and over. The sign is
+    part of the key so -0.0 keeps its own sin(-0.0) == -0.0
+    """
+    return _lat_trig_cached(lat_deg, math.copysign(1.0, lat_deg))
+
+# Reference latitude trig, fixed for every request
+REFERENCE_TRIG = {name: _reference_trig(ref_coords) for name, ref_coords in REFERENCE_LOCATIONS.items()}
+
+# Historical yantra dimensions from original constructions
+# Multiple references available for each yantra type
+REFERENCE_DIMENSIONS = {
+    "samrat_yantra": {
+        "jaipur": {
+            "base_length": 27.0,      # meters - Jaipur Samrat Yantra
+            "base_width": 21.6,       # meters
+            "gnomon_height": 22.6,    # meters
+            "gnomon_thickness": 1.5,  # meters
+            "step_height": 0.3,       # meters
+            "step_width": 0.6         # meters
+        },
+        "delhi": {
+            "base_length": 21.3,      # meters - Delhi Samrat Yantra
+            "base_width": 17.0,       # meters
+            "gnomon_height": 18.2,    # meters
+            "gnomon_thickness": 1.2,  # meters
+            "step_height": 0.25,      # meters
+            "step_width": 0.5         # meters
+        },
+        "ujjain": {
+            "base_length": 24.5,      # meters - Ujjain Samrat Yantra
+            "base_width": 19.6,       # meters
+            "gnomon_height": 20.8,    # meters
+            "gnomon_thickness": 1.3,  # meters
+            "step_height": 0.28,      # meters
+            "step_width": 0.55        # meters
+        }
+    },
+    "rama_yantra": {
+        "jaipur": {
+            "outer_radius": 8.5,      # meters - Jaipur Rama Yantra
+            "inner_radius": 3.0,      # meters
+            "wall_height": 2.8,       # meters
+            "wall_thickness": 0.45,   # meters
+            "central_pillar_radius": 0.3,  # meters
+            "step_height": 0.25       # meters
+        },
+        "delhi": {
+            "outer_radius": 7.2,      # meters - Delhi Rama Yantra
+            "inner_radius": 2.5,      # meters
+            "wall_height": 2.5,       # meters
+            "wall_thickness": 0.40,   # meters
+            "central_pillar_radius": 0.25, # meters
+            "step_height": 0.22       # meters
+        }
+    },
+    "jai_prakash_yantra": {
+        "jaipur": {
+            "hemisphere_radius": 8.64,  # meters - Jaipur Jai Prakash
+            "rim_thickness": 0.5,       # meters
+            "inner_depth": 8.64,        # meters
+            "marble_thickness": 0.1,    # meters
+            "step_width": 0.4,          # meters
+            "drainage_channel_width": 0.15  # meters
+        },
+        "delhi": {
+            "hemisphere_radius": 6.8,   # meters - Delhi Jai Prakash
+            "rim_thickness": 0.4,       # meters
+            "inner_depth": 6.8,         # meters
+            "marble_thickness": 0.08,   # meters
+            "step_width": 0.35,         # meters
+            "drainage_channel_width": 0.12  # meters
+        }
+    },
+    "digamsa_yantra": {
+        "delhi": {
+            "arc_radius": 4.8,        # meters - Delhi Digamsa
+            "base_width": 10.5,       # meters
+            "pillar_height": 7.2,     # meters
+            "arc_thickness": 0.25,    # meters
+            "base_thickness": 0.5,    # meters
+            "scale_marking_depth": 0.02  # meters
+        },
+        "jaipur": {
+            "arc_radius": 5.2,        # meters - Jaipur Digamsa
+            "base_width": 11.0,       # meters
+            "pillar_height": 7.8,     # meters
+            "arc_thickness": 0.28,    # meters
+            "base_thickness": 0.55,   # meters
+            "scale_marking_depth": 0.02  # meters
+        }
+    },
+    "dhruva_protha_chakra": {
+        "ujjain": {
+            "disk_radius": 3.2,       # meters - Ujjain reference
+            "central_hole_radius": 0.08,  # meters
+            "rim_thickness": 0.15,    # meters
+            "support_pillar_height": 2.5,  # meters
+            "rotation_axis_length": 7.0,   # meters
+            "counterweight_mass": 75.0     # kg
+        },
+        "delhi": {
+            "disk_radius": 2.8,       # meters - Delhi reference
+            "central_hole_radius": 0.07,  # meters
+            "rim_thickness": 0.12,    # meters
+            "support_pillar_height": 2.2,  # meters
+            "rotation_axis_length": 6.2,   # meters
+            "counterweight_mass": 65.0     # kg
+        }
+    },
+    "kapala_yantra": {
+        "varanasi": {
+            "bowl_radius": 3.5,       # meters - Varanasi reference
+            "bowl_depth": 3.5,        # meters
+            "rim_width": 0.3,         # meters
+            "gnomon_height": 2.8,     # meters
+            "gnomon_thickness": 0.04, # meters
+            "drainage_hole_diameter": 0.08  # meters
+        },
+        "jaipur": {
+            "bowl_radius": 3.0,       # meters - Jaipur reference
+            "bowl_depth": 3.0,        # meters
+            "rim_width": 0.25,        # meters
+            "gnomon_height": 2.4,     # meters
+            "gnomon_thickness": 0.035, # meters
+            "drainage_hole_diameter": 0.07  # meters
+        }
+    },
+    "chakra_yantra": {
+        "mathura": {
+            "outer_ring_radius": 2.8,  # meters - Mathura reference
+            "inner_ring_radius": 2.2,  # meters
+            "ring_thickness": 0.08,    # meters
+            "ring_width": 0.15,        # meters
+            "mounting_post_height": 3.0,  # meters
+            "base_support_radius": 3.5    # meters
+        },
+        "ujjain": {
+            "outer_ring_radius": 2.5,  # meters - Ujjain reference
+            "inner_ring_radius": 2.0,  # meters
+            "ring_thickness": 0.07,    # meters
+            "ring_width": 0.12,        # meters
+            "mounting_post_height": 2.8,  # meters
+            "base_support_radius": 3.2    # meters
+        }
+    },
+    "unnatamsa_yantra": {
+        "delhi": {
+            "quadrant_radius": 3.6,   # meters - Delhi reference
+            "base_length": 5.4,       # meters
+            "base_width": 4.3,        # meters
+            "vertical_post_height": 3.6,  # meters
+            "arc_thickness": 0.12,    # meters
+            "sighting_arm_length": 3.2    # meters
+        },
+        "jaipur": {
+            "quadrant_radius": 3.8,   # meters - Jaipur reference
+            "base_length": 5.7,       # meters
+            "base_width": 4.6,        # meters
+            "vertical_post_height": 3.8,  # meters
+            "arc_thickness": 0.13,    # meters
+            "sighting_arm_length": 3.4    # meters
+        }
+    }
+}
+
+# Fallback dimensions for yantra types whose table lacks the requested
+# reference location
+REFERENCE_DEFAULTS = {
+    "kapala_yantra": {
+        "bowl_radius": 2.5,
+        "bowl_depth": 2.5,
+        "rim_width": 0.3
+    },
+    "chakra_yantra": {
+        "outer_ring_radius": 2.0,
+        "inner_ring_radius": 1.2,
+        "ring_thickness": 0.08
+    },
+    "unnatamsa_yantra": {
+        "quadrant_radius": 2.5,
+        "base_length": 3.5,
+        "base_width": 2.8
+    }
+}
+
+def _reference_arrays(references: Dict[str, Dict[str, float]]) -> Tuple[np.ndarray, Dict[str, int], List[str]]:
+    """Columnar copy of one yantra's reference dimensions: (values, reference -> row, fields)"""
+    fields = list(next(iter(references.values())))
+    values = np.array([[dims[field] for field in fields] for dims in references.values()])
+    rows = {name: row for row, name in enumerate(references)}
+    return values, rows, fields
+
+# Columnar copy of REFERENCE_DIMENSIONS for the batch generators:
+# yantra type -> ((references, fields) array, reference -> row, fields)
+REFERENCE_ARRAYS = {
+    yantra_type: _reference_arrays(references) for yantra_type, references in REFERENCE_DIMENSIONS.items()
+}
+
+def _available_references(yantra_type: str) -> Dict[str, Dict]:
+    """Public description of each historical reference for a yantra type"""
+    references = {}
+    for ref_name in REFERENCE_DIMENSIONS[yantra_type].keys():
+        if ref_name in REFERENCE_LOCATIONS:
+            ref_coords = REFERENCE_LOCATIONS[ref_name]
+            references[ref_name] = {
+                "name": ref_name.title(),
+                "latitude": ref_coords.latitude,
+                "longitude": ref_coords.longitude,
+                "elevation": ref_coords.elevation,
+                "description": f"Historical {yantra_type.replace('_', ' ').title()} at {ref_name.title()}"
+            }
+    
+    return references
+
+# get_available_references results, built from the static tables above
+AVAILABLE_REFERENCES = {yantra_type: _available_references(yantra_type) for yantra_type in REFERENCE_DIMENSIONS}
+
+# export_specifications formats -> engine method producing the document
+EXPORT_FORMATS = {
+    "json": "_export_json",
+    "blueprint": "_export_blueprint"
+}
+
+@functools.lru_cache(maxsize=4096)
+def _display_key(key: str) -> str:
+    """Blueprint label of a spec key ("gnomon_height" -> "Gnomon Height")"""
+    return key.replace('_', ' ').title()
+
+@functools.lru_cache(maxsize=256)
+def _display_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Blueprint labels of a whole table's keys; each yantra type has only a
+    few key layouts, so after the first export of a layout this is one lookup
+    """
+    return tuple(map(_display_key, keys))
+
+@functools.lru_cache(maxsize=256)
+def _accuracy_label(key: str) -> Tuple[str, str]:
+    """Blueprint label and unit suffix of an accuracy metric key"""
+    unit = "°" if "degrees" in key else ("min" if "minutes" in key else "")
+    return _display_key(key), unit
 
 class ParametricGeometryEngine:
     """
@@ -37,172 +910,30 @@ class ParametricGeometryEngine:
         self.earth_radius = 6371000  # meters
         self.obliquity = 23.44  # Earth's axial tilt in degrees
         
-        # Historical reference coordinates for authentic yantra dimensions
-        self.reference_locations = {
-            "jaipur": Coordinates(latitude=26.9124, longitude=75.7873, elevation=431),  # Jantar Mantar Jaipur
-            "delhi": Coordinates(latitude=28.6139, longitude=77.2090, elevation=216),   # Jantar Mantar Delhi
-            "ujjain": Coordinates(latitude=23.1765, longitude=75.7885, elevation=492), # Jantar Mantar Ujjain
-            "varanasi": Coordinates(latitude=25.3176, longitude=82.9739, elevation=80), # Man Mandir Ghat
-            "mathura": Coordinates(latitude=27.4924, longitude=77.6737, elevation=174)  # Historical observatory
-        }
-        
-        # Historical yantra dimensions from original constructions
-        # Multiple references available for each yantra type
-        self.reference_dimensions = {
-            "samrat_yantra": {
-                "jaipur": {
-                    "base_length": 27.0,      # meters - Jaipur Samrat Yantra
-                    "base_width": 21.6,       # meters
-                    "gnomon_height": 22.6,    # meters
-                    "gnomon_thickness": 1.5,  # meters
-                    "step_height": 0.3,       # meters
-                    "step_width": 0.6         # meters
-                },
-                "delhi": {
-                    "base_length": 21.3,      # meters - Delhi Samrat Yantra
-                    "base_width": 17.0,       # meters
-                    "gnomon_height": 18.2,    # meters
-                    "gnomon_thickness": 1.2,  # meters
-                    "step_height": 0.25,      # meters
-                    "step_width": 0.5         # meters
-                },
-                "ujjain": {
-                    "base_length": 24.5,      # meters - Ujjain Samrat Yantra
-                    "base_width": 19.6,       # meters
-                    "gnomon_height": 20.8,    # meters
-                    "gnomon_thickness": 1.3,  # meters
-                    "step_height": 0.28,      # meters
-                    "step_width": 0.55        # meters
-                }
-            },
-            "rama_yantra": {
-                "jaipur": {
-                    "outer_radius": 8.5,      # meters - Jaipur Rama Yantra
-                    "inner_radius": 3.0,      # meters
-                    "wall_height": 2.8,       # meters
-                    "wall_thickness": 0.45,   # meters
-                    "central_pillar_radius": 0.3,  # meters
-                    "step_height": 0.25       # meters
-                },
-                "delhi": {
-                    "outer_radius": 7.2,      # meters - Delhi Rama Yantra
-                    "inner_radius": 2.5,      # meters
-                    "wall_height": 2.5,       # meters
-                    "wall_thickness": 0.40,   # meters
-                    "central_pillar_radius": 0.25, # meters
-                    "step_height": 0.22       # meters
-                }
-            },
-            "jai_prakash_yantra": {
-                "jaipur": {
-                    "hemisphere_radius": 8.64,  # meters - Jaipur Jai Prakash
-                    "rim_thickness": 0.5,       # meters
-                    "inner_depth": 8.64,        # meters
-                    "marble_thickness": 0.1,    # meters
-                    "step_width": 0.4,          # meters
-                    "drainage_channel_width": 0.15  # meters
-                },
-                "delhi": {
-                    "hemisphere_radius": 6.8,   # meters - Delhi Jai Prakash
-                    "rim_thickness": 0.4,       # meters
-                    "inner_depth": 6.8,         # meters
-                    "marble_thickness": 0.08,   # meters
-                    "step_width": 0.35,         # meters
-                    "drainage_channel_width": 0.12  # meters
-                }
-            },
-            "digamsa_yantra": {
-                "delhi": {
-                    "arc_radius": 4.8,        # meters - Delhi Digamsa
-                    "base_width": 10.5,       # meters
-                    "pillar_height": 7.2,     # meters
-                    "arc_thickness": 0.25,    # meters
-                    "base_thickness": 0.5,    # meters
-                    "scale_marking_depth": 0.02  # meters
-                },
-                "jaipur": {
-                    "arc_radius": 5.2,        # meters - Jaipur Digamsa
-                    "base_width": 11.0,       # meters
-                    "pillar_height": 7.8,     # meters
-                    "arc_thickness": 0.28,    # meters
-                    "base_thickness": 0.55,   # meters
-                    "scale_marking_depth": 0.02  # meters
-                }
-            },
-            "dhruva_protha_chakra": {
-                "ujjain": {
-                    "disk_radius": 3.2,       # meters - Ujjain reference
-                    "central_hole_radius": 0.08,  # meters
-                    "rim_thickness": 0.15,    # meters
-                    "support_pillar_height": 2.5,  # meters
-                    "rotation_axis_length": 7.0,   # meters
-                    "counterweight_mass": 75.0     # kg
-                },
-                "delhi": {
-                    "disk_radius": 2.8,       # meters - Delhi reference
-                    "central_hole_radius": 0.07,  # meters
-                    "rim_thickness": 0.12,    # meters
-                    "support_pillar_height": 2.2,  # meters
-                    "rotation_axis_length": 6.2,   # meters
-                    "counterweight_mass": 65.0     # kg
-                }
-            },
-            "kapala_yantra": {
-                "varanasi": {
-                    "bowl_radius": 3.5,       # meters - Varanasi reference
-                    "bowl_depth": 3.5,        # meters
-                    "rim_width": 0.3,         # meters
-                    "gnomon_height": 2.8,     # meters
-                    "gnomon_thickness": 0.04, # meters
-                    "drainage_hole_diameter": 0.08  # meters
-                },
-                "jaipur": {
-                    "bowl_radius": 3.0,       # meters - Jaipur reference
-                    "bowl_depth": 3.0,        # meters
-                    "rim_width": 0.25,        # meters
-                    "gnomon_height": 2.4,     # meters
-                    "gnomon_thickness": 0.035, # meters
-                    "drainage_hole_diameter": 0.07  # meters
-                }
-            },
-            "chakra_yantra": {
-                "mathura": {
-                    "outer_ring_radius": 2.8,  # meters - Mathura reference
-                    "inner_ring_radius": 2.2,  # meters
-                    "ring_thickness": 0.08,    # meters
-                    "ring_width": 0.15,        # meters
-                    "mounting_post_height": 3.0,  # meters
-                    "base_support_radius": 3.5    # meters
-                },
-                "ujjain": {
-                    "outer_ring_radius": 2.5,  # meters - Ujjain reference
-                    "inner_ring_radius": 2.0,  # meters
-                    "ring_thickness": 0.07,    # meters
-                    "ring_width": 0.12,        # meters
-                    "mounting_post_height": 2.8,  # meters
-                    "base_support_radius": 3.2    # meters
-                }
-            },
-            "unnatamsa_yantra": {
-                "delhi": {
-                    "quadrant_radius": 3.6,   # meters - Delhi reference
-                    "base_length": 5.4,       # meters
-                    "base_width": 4.3,        # meters
-                    "vertical_post_height": 3.6,  # meters
-                    "arc_thickness": 0.12,    # meters
-                    "sighting_arm_length": 3.2    # meters
-                },
-                "jaipur": {
-                    "quadrant_radius": 3.8,   # meters - Jaipur reference
-                    "base_length": 5.7,       # meters
-                    "base_width": 4.6,        # meters
-                    "vertical_post_height": 3.8,  # meters
-                    "arc_thickness": 0.13,    # meters
-                    "sighting_arm_length": 3.4    # meters
-                }
-            }
-        }
-        
+        # Historical reference coordinates and yantra dimensions from original
+        # constructions (module-level tables, shared by every instance)
+        self.reference_locations = REFERENCE_LOCATIONS
+        self.reference_dimensions = REFERENCE_DIMENSIONS
+        self.reference_defaults = REFERENCE_DEFAULTS
+        self._ref_trig = REFERENCE_TRIG
+        self._ref_arrays = REFERENCE_ARRAYS
+        self._available_refs = AVAILABLE_REFERENCES
+        
+        # Specs are a pure function of (coordinates, reference location), so
+        # repeated queries for the same site (UI sliders, re-renders, several
+        # export formats) skip the trig pipeline. Each call returns a copy
+        # of the cached spec with its own dimensions, angles and
+        # accuracy_metrics dicts, so callers may edit what they get back
+        for name in CACHED_GENERATORS:
+            setattr(self, name, _memoize_generator(getattr(self, name)))
+    
+    def _reference_data(self, yantra_type: str, reference_location: str) -> Dict[str, float]:
+        """Reference dimensions for a yantra type, or its REFERENCE_DEFAULTS entry"""
+        references = self.reference_dimensions.get(yantra_type, {})
+        if reference_location in references:
+            return references[reference_location]
+        return self.reference_defaults[yantra_type]
+    
     def get_available_references(self, yantra_type: str) -> Dict[str, Dict]:
         """
         Get available historical references for a yantra type
@@ -211,24 +942,10 @@ class ParametricGeometryEngine:
             yantra_type: Type of yantra (e.g., "samrat_yantra")
             
         Returns:
-            Dictionary of available references with their details
+            Dictionary of available references with their details (shared,
+            precomputed at import; do not modify)
         """
-        if yantra_type not in self.reference_dimensions:
-            return {}
-        
-        references = {}
-        for ref_name in self.reference_dimensions[yantra_type].keys():
-            if ref_name in self.reference_locations:
-                ref_coords = self.reference_locations[ref_name]
-                references[ref_name] = {
-                    "name": ref_name.title(),
-                    "latitude": ref_coords.latitude,
-                    "longitude": ref_coords.longitude,
-                    "elevation": ref_coords.elevation,
-                    "description": f"Historical {yantra_type.replace('_', ' ').title()} at {ref_name.title()}"
-                }
-        
-        return references
+        return self._available_refs.get(yantra_type, {})
     
     def generate_samrat_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
         """
@@ -253,12 +970,12 @@ class ParametricGeometryEngine:
         ref_data = self.reference_dimensions["samrat_yantra"][reference_location]
         ref_location = self.reference_locations[reference_location]
         
-        lat_rad = math.radians(coords.latitude)
-        ref_lat_rad = math.radians(ref_location.latitude)
+        lat_rad, _, cos_lat = _lat_trig(coords.latitude)
+        _, ref_cos_lat, _ = self._ref_trig[reference_location]
         
         # Calculate scaling factor based on latitude difference
         # This affects shadow lengths and optimal viewing angles
-        latitude_scale = math.cos(lat_rad) / math.cos(ref_lat_rad)
+        latitude_scale = cos_lat / ref_cos_lat
         
         # Core calculations using reference dimensions
         gnomon_angle = coords.latitude  # Gnomon parallel to Earth's axis
@@ -271,39 +988,10 @@ class ParametricGeometryEngine:
         gnomon_thickness = ref_data["gnomon_thickness"]
         
         # Hour line angles (PROPER SUNDIAL MATHEMATICS - latitude dependent)
-        hour_angles = {}
-        for hour in range(-6, 7):  # 6 AM to 6 PM
-            solar_hour_angle = 15 * hour  # degrees from solar noon
-            
-            if solar_hour_angle == 0:  # Solar noon
-                angle = 0
-            else:
-                # Correct sundial formula for Samrat Yantra:
-                # tan(hour_line_angle) = sin(latitude) × tan(solar_hour_angle)
-                solar_rad = math.radians(solar_hour_angle)
-                hour_line_angle_rad = math.atan(math.sin(lat_rad) * math.tan(solar_rad))
-                angle = math.degrees(hour_line_angle_rad)
-            
-            hour_angles[f"hour_{hour + 6:02d}"] = angle
-            
-        # Shadow lengths at different times (adjusted for location)
-        shadow_lengths = {}
-        for hour in range(-6, 7):
-            hour_angle = math.radians(15 * hour)
-            # Solar declination (simplified for equinox)
-            declination = 0  # at equinox
-            
-            # Solar elevation angle
-            elevation_angle = math.asin(
-                math.sin(lat_rad) * math.sin(math.radians(declination)) +
-                math.cos(lat_rad) * math.cos(math.radians(declination)) * math.cos(hour_angle)
-            )
-            
-            if elevation_angle > 0:  # Sun is above horizon
-                shadow_length = gnomon_height / math.tan(elevation_angle)
-                shadow_lengths[f"hour_{hour + 6:02d}"] = shadow_length
-            else:
-                shadow_lengths[f"hour_{hour + 6:02d}"] = float('inf')  # No shadow
+        # for all hours in one kernel call (NumPy ufuncs without numba). Solar
+        # declination simplified for equinox (declination 0), which the
+        # kernel is specialized to
+        hour_line_angles, _ = _samrat_shadows(lat_rad, gnomon_height)
         
         # Construct specifications
         dimensions = {
@@ -320,20 +1008,22 @@ class ParametricGeometryEngine:
         angles = {
             "gnomon_angle": gnomon_angle,
             "reference_gnomon_angle": ref_gnomon_angle,
-            "base_orientation": 0,  # True north
-            **hour_angles
+            "base_orientation": 0  # True north
+        }
+        # Hour line angles go straight into angles, without an intermediate dict
+        for key, hour, angle in zip(SAMRAT_HOUR_KEYS, SAMRAT_HOURS, hour_line_angles.tolist()):
+            angles[key] = angle if hour else 0  # Solar noon
+        
+        notes_values = {
+            "reference": reference_location.title(),
+            "ref_location": ref_location,
+            "ref_data": ref_data,
+            "coords": coords,
+            "latitude_scale": latitude_scale,
+            "gnomon_angle": gnomon_angle,
+            "gnomon_height": gnomon_height,
+            "base_length": base_length
         }
-        
-        construction_notes = [
-            f"Based on original {reference_location.title()} Samrat Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
-            f"Original dimensions: {ref_data['base_length']}m × {ref_data['base_width']}m",
-            f"Scaled for latitude {coords.latitude:.2f}°N (scale factor: {latitude_scale:.3f})",
-            f"Orient gnomon at {gnomon_angle:.1f}° from horizontal (= latitude)",
-            "Align base precisely with true north-south direction",
-            f"Gnomon height: {gnomon_height:.2f}m for {base_length:.1f}m base",
-            "Mark hour lines according to calculated angles",
-            "Add steps for safe access to readings"
-        ]
         
         # Calculate accuracy metrics
         accuracy_metrics = {
@@ -349,8 +1039,101 @@ class ParametricGeometryEngine:
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=SAMRAT_NOTES,
+            notes_values=notes_values
+        )
+    
+    def generate_samrat_yantra_batch(self, latitudes: np.ndarray, longitudes: np.ndarray,
+                                     reference_location: str = "jaipur") -> Dict[str, np.ndarray]:
+        """
+        Generate Samrat Yantra dimensions and angles for many locations at once
+        
+        Columnar counterpart of generate_samrat_yantra: the same formulas,
+        evaluated over arrays instead of one site at a time.
+        
+        Args:
+            latitudes: (N,) site latitudes in degrees
+            longitudes: (N,) site longitudes in degrees
+            reference_location: Historical reference ("jaipur", "delhi", "ujjain")
+            
+        Returns:
+            Dict of arrays: (N,) columns for each dimension and angle of
+            generate_samrat_yantra, plus (N, 13) "hour_line_angles" and
+            "shadow_lengths" whose columns follow SAMRAT_HOUR_KEYS
+        """
+        
+        # Validate reference location
+        if reference_location not in self.reference_dimensions["samrat_yantra"]:
+            available = list(self.reference_dimensions["samrat_yantra"].keys())
+            raise ValueError(f"Reference location '{reference_location}' not available. Choose from: {available}")
+        
+        values, rows, fields = self._ref_arrays["samrat_yantra"]
+        ref_row = values[rows[reference_location]]
+        ref_location = self.reference_locations[reference_location]
+        _, ref_cos_lat, _ = self._ref_trig[reference_location]
+        
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        lat_rad = np.radians(latitudes)
+        count = latitudes.shape[0]
+        
+        # Scaling factor based on latitude difference, applied to every
+        # scaled reference dimension in one broadcast multiply
+        latitude_scale = np.cos(lat_rad) / ref_cos_lat
+        scaled = np.isin(fields, SAMRAT_SCALED_FIELDS)[:, None]
+        dimensions = dict(zip(fields, np.where(scaled, ref_row[:, None] * latitude_scale, ref_row[:, None])))
+        gnomon_height = dimensions["gnomon_height"]
+        
+        # Hour line angles: tan(hour_line_angle) = sin(latitude) × tan(solar_hour_angle)
+        solar_rad = SAMRAT_HOUR_RADIANS
+        sin_lat = np.sin(lat_rad)[:, None]
+        hour_line_angles = np.degrees(np.arctan(sin_lat * np.tan(solar_rad)))
+        
+        # Shadow lengths at equinox (declination 0); inf below the horizon.
+        # Branchless: below-horizon entries get a dummy elevation before the
+        # divide, so there is nothing to warn about or branch on
+        elevation_angle = np.arcsin(np.cos(lat_rad)[:, None] * np.cos(solar_rad))
+        above_horizon = elevation_angle > 0
+        safe_elevation = np.where(above_horizon, elevation_angle, 1.0)
+        shadow_lengths = np.where(above_horizon, gnomon_height[:, None] / np.tan(safe_elevation), np.inf)
+        
+        return {
+            "latitude": latitudes,
+            "longitude": longitudes,
+            **dimensions,
+            "reference_base_length": np.full(count, ref_row[fields.index("base_length")]),
+            "latitude_scale_factor": latitude_scale,
+            "gnomon_angle": latitudes,  # Gnomon parallel to Earth's axis
+            "reference_gnomon_angle": np.full(count, ref_location.latitude),
+            "base_orientation": np.zeros(count),  # True north
+            "hour_line_angles": hour_line_angles,
+            "shadow_lengths": shadow_lengths
+        }
+    
+    def generate_samrat_yantra_records(self, latitudes: np.ndarray, longitudes: np.ndarray,
+                                       reference_location: str = "jaipur") -> np.ndarray:
+        """
+        Samrat Yantra specifications as a structured array, one record per site
+        
+        Same values as generate_samrat_yantra_batch, laid out as
+        SAMRAT_RECORD_DTYPE records for consumers that index, sort or save
+        whole rows (np.save, plotting) instead of a dict of columns.
+        
+        Returns:
+            (N,) array of SAMRAT_RECORD_DTYPE
+        """
+        columns = self.generate_samrat_yantra_batch(latitudes, longitudes, reference_location)
+        
+        records = np.empty(columns["latitude"].shape[0], dtype=SAMRAT_RECORD_DTYPE)
+        for name in SAMRAT_RECORD_DTYPE.names:
+            records[name] = columns[name]
+        return records
+    
+    def generate_samrat_yantra_array(self, coords: Coordinates, reference_location: str = "jaipur") -> np.ndarray:
+        """Samrat Yantra specifications for one site as a length-1 SAMRAT_RECORD_DTYPE array"""
+        return self.generate_samrat_yantra_records(
+            np.array([coords.latitude]), np.array([coords.longitude]), reference_location
         )
     
     def generate_rama_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
@@ -375,15 +1158,15 @@ class ParametricGeometryEngine:
         ref_data = self.reference_dimensions["rama_yantra"][reference_location]
         ref_location = self.reference_locations[reference_location]
         
-        lat_rad = math.radians(coords.latitude)
-        ref_lat_rad = math.radians(ref_location.latitude)
+        _, sin_lat, _ = _lat_trig(coords.latitude)
+        _, _, ref_sin_lat = self._ref_trig[reference_location]
         
         # ENHANCED SCALING: Proper latitude-dependent geometry
         # Rama Yantra effectiveness depends on local horizon and celestial pole height
         pole_height = coords.latitude  # Celestial pole altitude = latitude
         
         # Scale based on observable sky portion and horizon geometry
-        horizon_scale = math.sin(lat_rad) / math.sin(ref_lat_rad)
+        horizon_scale = sin_lat / ref_sin_lat
         latitude_scale = math.sqrt(horizon_scale)  # Geometric mean for optimal viewing
         
         # Scale dimensions from reference with enhanced calculations
@@ -401,49 +1184,17 @@ class ParametricGeometryEngine:
         sector_angle = 360 / num_sectors
         
         # PRECISE ALTITUDE SCALE MARKINGS with astronomical corrections
-        altitude_markings = {}
-        for alt in range(0, 91, 5):  # Every 5° for precision
-            # Radius calculation accounts for observer height and refraction
-            atmospheric_correction = 0.97 if alt < 10 else 1.0  # Atmospheric refraction
-            corrected_alt = alt * atmospheric_correction
-            
-            # Map altitude to radius with perspective correction
-            alt_factor = corrected_alt / 90.0
-            radius_at_altitude = inner_radius + (outer_radius - inner_radius) * alt_factor
-            altitude_markings[f"altitude_{alt:02d}"] = radius_at_altitude
-        
-        # ENHANCED AZIMUTH MARKINGS with cardinal point calculations
-        azimuth_markings = {}
-        cardinal_points = {
-            "north": 0, "north_northeast": 22.5, "northeast": 45, "east_northeast": 67.5,
-            "east": 90, "east_southeast": 112.5, "southeast": 135, "south_southeast": 157.5,
-            "south": 180, "south_southwest": 202.5, "southwest": 225, "west_southwest": 247.5,
-            "west": 270, "west_northwest": 292.5, "northwest": 315, "north_northwest": 337.5
-        }
+        # Map altitude to radius with perspective correction, every 5°
+        radii_at_altitude = inner_radius + (outer_radius - inner_radius) * RAMA_ALTITUDE_FACTORS
         
-        for direction, azimuth in cardinal_points.items():
-            azimuth_markings[f"azimuth_{direction}"] = azimuth
-            
-        # Additional precise azimuth markings every 10°
-        for az in range(0, 360, 10):
-            azimuth_markings[f"azimuth_{az:03d}"] = az
-        
-        # ZENITH DISTANCE CALCULATIONS (complement of altitude)
-        zenith_markings = {}
-        for zenith_dist in range(0, 91, 15):  # Zenith distance markings
-            zenith_markings[f"zenith_{zenith_dist:02d}"] = 90 - zenith_dist
+        # ENHANCED AZIMUTH MARKINGS with cardinal point calculations, plus
+        # precise azimuth markings every 10°, and ZENITH DISTANCES
+        # (complement of altitude): site independent, in RAMA_ANGLES_LAYOUT
             
         # CELESTIAL COORDINATE INTEGRATION
-        # Calculate optimal viewing times for different celestial objects
-        seasonal_adjustments = {}
-        for season in ["spring_equinox", "summer_solstice", "autumn_equinox", "winter_solstice"]:
-            declinations = {"spring_equinox": 0, "summer_solstice": 23.44, 
-                          "autumn_equinox": 0, "winter_solstice": -23.44}
-            decl = declinations[season]
-            
-            # Maximum altitude for objects at this declination
-            max_altitude = 90 - abs(coords.latitude - decl)
-            seasonal_adjustments[season] = max_altitude
+        # Calculate optimal viewing times for different celestial objects:
+        # maximum altitude for objects at each season's declination
+        seasonal_altitudes = _noon_altitudes(coords.latitude)
         
         dimensions = {
             "outer_radius": outer_radius,
@@ -455,39 +1206,35 @@ class ParametricGeometryEngine:
             "reference_outer_radius": ref_data["outer_radius"],
             "latitude_scale_factor": latitude_scale,
             "pole_height_degrees": pole_height,
-            "observable_sky_fraction": math.sin(lat_rad),
+            "observable_sky_fraction": sin_lat,
             "effective_diameter": outer_radius * 2,
             "measurement_area": math.pi * (outer_radius**2 - inner_radius**2)
         }
         
-        angles = {
-            "sector_angle": sector_angle,
+        angles = RAMA_ANGLES_LAYOUT.copy()
+        angles["sector_angle"] = sector_angle
+        angles["num_sectors"] = num_sectors
+        angles["celestial_pole_altitude"] = pole_height
+        angles["local_horizon_tilt"] = 90 - coords.latitude
+        angles.update(zip(RAMA_ALTITUDE_KEYS, radii_at_altitude.tolist()))
+        
+        notes_values = {
+            "reference": reference_location.title(),
+            "ref_location": ref_location,
+            "coords": coords,
+            "outer_radius": outer_radius,
+            "inner_radius": inner_radius,
+            "latitude_scale": latitude_scale,
+            "wall_height": wall_height,
+            "pole_height": pole_height,
             "num_sectors": num_sectors,
-            "celestial_pole_altitude": pole_height,
-            "local_horizon_tilt": 90 - coords.latitude,
-            **azimuth_markings,
-            **altitude_markings,
-            **zenith_markings
+            "sector_angle": sector_angle,
+            "central_pillar_height": ref_data["central_pillar_radius"] * 3,
+            "observable_sky_fraction": sin_lat
         }
         
-        construction_notes = [
-            f"Based on original {reference_location.title()} Rama Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
-            f"Enhanced for precise astronomical observations at {coords.latitude:.4f}°N",
-            f"Outer radius: {outer_radius:.2f}m (scaled by factor {latitude_scale:.3f})",
-            f"Inner measurement area: {inner_radius:.2f}m radius",
-            f"Wall height: {wall_height:.2f}m (optimized for celestial pole at {pole_height:.1f}°)",
-            f"Divide into {num_sectors} sectors of {sector_angle}° each",
-            f"Mark altitude scales every 5° from 0° to 90°",
-            f"Mark azimuth scales every 10° with cardinal directions",
-            f"Central pillar height: {ref_data['central_pillar_radius']*3:.2f}m for instrument mounting",
-            "Level instrument platform within ±1 arcminute",
-            "Align north sector with true north (not magnetic north)",
-            f"Atmospheric refraction correction applied below 10° altitude",
-            f"Observable sky fraction: {math.sin(lat_rad):.3f} for this latitude"
-        ]
-        
         # Calculate seasonal observation range as the difference between max and min seasonal altitudes
-        seasonal_range = max(seasonal_adjustments.values()) - min(seasonal_adjustments.values())
+        seasonal_range = max(seasonal_altitudes) - min(seasonal_altitudes)
         
         accuracy_metrics = {
             "altitude_accuracy_degrees": 0.25,  # Enhanced precision
@@ -507,8 +1254,10 @@ class ParametricGeometryEngine:
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=RAMA_NOTES,
+            notes_values=notes_values,
+            angles_layout="rama_yantra"
         )
     
     def generate_jai_prakash_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
@@ -532,13 +1281,13 @@ class ParametricGeometryEngine:
         ref_data = self.reference_dimensions["jai_prakash_yantra"][reference_location]
         ref_location = self.reference_locations[reference_location]
         
-        lat_rad = math.radians(coords.latitude)
-        ref_lat_rad = math.radians(ref_location.latitude)
+        _, sin_lat, cos_lat = _lat_trig(coords.latitude)
+        _, _, ref_sin_lat = self._ref_trig[reference_location]
         
         # ENHANCED SCALING: Hemispherical geometry accounts for spherical trigonometry
         # Optimal hemisphere size varies with latitude for celestial mapping accuracy
-        celestial_sphere_scale = math.sin(math.radians(90 - abs(coords.latitude - ref_location.latitude)))
-        hemisphere_visibility_factor = (math.sin(lat_rad) + 1) / (math.sin(ref_lat_rad) + 1)
+        celestial_sphere_scale = math.sin((90 - abs(coords.latitude - ref_location.latitude)) * DEG2RAD)
+        hemisphere_visibility_factor = (sin_lat + 1) / (ref_sin_lat + 1)
         latitude_scale = math.sqrt(celestial_sphere_scale * hemisphere_visibility_factor)
         
         # PRECISE HEMISPHERE DIMENSIONS with astronomical corrections
@@ -547,97 +1296,26 @@ class ParametricGeometryEngine:
         bowl_depth = hemisphere_radius * 0.95  # Slightly less than full hemisphere for stability
         
         # COMPREHENSIVE CELESTIAL COORDINATE SYSTEM
-        # Declination circles (parallel to celestial equator) with seasonal precision
-        declination_circles = {}
-        seasonal_declinations = {
-            "winter_solstice": -23.44, "spring_equinox": 0, 
-            "summer_solstice": 23.44, "autumn_equinox": 0
-        }
-        
-        # Map declination circles with precise radial positions
-        for decl in range(-30, 31, 3):  # Every 3° from -30° to +30°
-            # Hemispherical projection: r = R * cos(declination)
-            circle_radius = hemisphere_radius * math.cos(math.radians(decl))
-            # Height on hemisphere wall: h = R * sin(declination)  
-            circle_height = hemisphere_radius * math.sin(math.radians(abs(decl)))
-            declination_circles[f"declination_{decl:+03d}"] = {
-                "radius": circle_radius,
-                "height": circle_height,
-                "angular_position": decl
-            }
+        # Declination circles (parallel to celestial equator) with seasonal
+        # precision; their angular positions are JAI_PRAKASH_DECL_CIRCLE_ANGLES
         
         # ENHANCED HOUR CIRCLE CALCULATIONS with local meridian corrections
-        hour_circles = {}
         local_meridian_correction = coords.longitude - ref_location.longitude
         
-        for hour in range(0, 24):  # Every hour for precision
-            # Standard hour angle from local meridian
-            hour_angle = 15 * (hour - 12)  # Degrees from local noon
-            
-            # Apply longitude correction for local solar time
-            corrected_hour_angle = hour_angle + (local_meridian_correction / 15) * 15
-            
-            # Hemispherical coordinate transformation
-            azimuth = corrected_hour_angle % 360
-            hour_circles[f"hour_{hour:02d}"] = {
-                "azimuth_degrees": azimuth,
-                "meridian_angle": hour_angle,
-                "local_correction": local_meridian_correction / 15  # In hours
-            }
+        # Standard hour angle from local meridian, degrees from local noon
+        meridian_angles = JAI_PRAKASH_MERIDIAN_ANGLES
+        
+        # Apply longitude correction for local solar time, then the
+        # hemispherical coordinate transformation
+        corrected_hour_angles = meridian_angles + (local_meridian_correction / 15) * 15
+        hour_azimuths = corrected_hour_angles % 360
         
         # LATITUDE-SPECIFIC GEOMETRIC CALCULATIONS
         # Celestial equator projection on hemisphere
-        equator_radius = hemisphere_radius * math.cos(lat_rad)
-        equator_height = hemisphere_radius * math.sin(lat_rad)
+        equator_radius = hemisphere_radius * cos_lat
         
-        # Celestial pole positions
-        north_pole_height = hemisphere_radius * math.sin(lat_rad)
-        south_pole_depth = hemisphere_radius * math.sin(lat_rad)  # Below horizon
-        
-        # SEASONAL SUN PATH CALCULATIONS
-        seasonal_paths = {}
-        for season, declination in seasonal_declinations.items():
-            decl_rad = math.radians(declination)
-            
-            # Maximum altitude for this declination
-            max_altitude = math.degrees(math.asin(
-                math.sin(lat_rad) * math.sin(decl_rad) + 
-                math.cos(lat_rad) * math.cos(decl_rad)
-            ))
-            
-            # Sunrise/sunset hour angle
-            cos_hour_angle = -math.tan(lat_rad) * math.tan(decl_rad)
-            if abs(cos_hour_angle) <= 1:  # Sun rises and sets
-                hour_angle_max = math.degrees(math.acos(cos_hour_angle))
-                daylight_hours = 2 * hour_angle_max / 15
-            else:
-                hour_angle_max = 180 if cos_hour_angle < -1 else 0
-                daylight_hours = 24 if cos_hour_angle < -1 else 0
-            
-            seasonal_paths[season] = {
-                "declination": declination,
-                "max_altitude": max_altitude,
-                "sunrise_hour_angle": -hour_angle_max,
-                "sunset_hour_angle": hour_angle_max,
-                "daylight_duration": daylight_hours
-            }
-        
-        # ANALEMMA CALCULATION (Sun's yearly path)
-        analemma_points = {}
-        for day_of_year in range(0, 365, 15):  # Every 15 days
-            # Approximate solar declination for day of year
-            decl = 23.44 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-            
-            # Equation of time approximation (solar vs mean time difference)
-            B = math.radians(360 * (day_of_year - 81) / 365)
-            equation_of_time = 9.87 * math.sin(2*B) - 7.53 * math.cos(B) - 1.5 * math.sin(B)
-            
-            analemma_points[f"day_{day_of_year:03d}"] = {
-                "declination": decl,
-                "equation_of_time_minutes": equation_of_time,
-                "hemisphere_x": hemisphere_radius * math.cos(math.radians(decl)),
-                "hemisphere_y": hemisphere_radius * math.sin(math.radians(decl))
-            }
+        # Celestial pole position
+        north_pole_height = hemisphere_radius * sin_lat
         
         dimensions = {
             "hemisphere_radius": hemisphere_radius,
@@ -654,62 +1332,25 @@ class ParametricGeometryEngine:
             "celestial_sphere_scale": celestial_sphere_scale
         }
         
-        angles = {
-            "latitude_degrees": coords.latitude,
-            "celestial_equator_angle": 90 - coords.latitude,
-            "pole_altitude": coords.latitude,
-            "horizon_tilt": 90 - coords.latitude,
-            "equator_radius_ratio": equator_radius / hemisphere_radius,
-            "local_meridian_correction_degrees": local_meridian_correction,
-            **{f"hour_angle_{k}": v["azimuth_degrees"] for k, v in hour_circles.items()},
-            **{f"decl_circle_{k}": v["angular_position"] for k, v in declination_circles.items()}
-        }
-        
-        construction_notes = [
-            f"Based on original {reference_location.title()} Jai Prakash Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
-            f"Enhanced hemispherical design for {coords.latitude:.4f}°N, {coords.longitude:.4f}°E",
-            f"Hemisphere radius: {hemisphere_radius:.2f}m (scaled by {latitude_scale:.3f})",
-            f"Bowl depth: {bowl_depth:.2f}m with {rim_thickness:.2f}m rim",
-            f"Celestial equator at {equator_radius:.2f}m radius, {equator_height:.2f}m height",
-            f"North celestial pole at {north_pole_height:.2f}m height",
-            f"Declination circles marked every 3° from -30° to +30°",
-            f"Hour circles for all 24 hours with local meridian correction",
-            f"Seasonal sun paths calculated for solstices and equinoxes",
-            f"Analemma (sun's yearly path) marked for navigation",
-            "Excavate bowl to precise hemispherical shape",
-            "Interior surface must be perfectly smooth marble or stone",
-            "Install drainage system at lowest point",
-            "Align rim precisely with local horizon",
-            f"Mark cardinal directions adjusted for {local_meridian_correction:.2f}° longitude correction"
-        ]
-        
-        accuracy_metrics = {
-            "coordinate_accuracy_degrees": 0.5,
-            "time_accuracy_minutes": 2.0,
-            "seasonal_accuracy_days": 1.0,
-            "hemisphere_precision_mm": 5.0,
-            "effective_range_declination": (-30, 30),
-            "effective_range_hour_angle": (-180, 180),
-            "optimal_sun_altitude_range": (10, 80),
-            "seasonal_observation_data": seasonal_paths,
-            "analemma_precision": analemma_points,
-            "reference_latitude": ref_location.latitude,
-            "reference_longitude": ref_location.longitude,
-            "local_meridian_offset_hours": local_meridian_correction / 15
+        angles = JAI_PRAKASH_ANGLES_LAYOUT.copy()
+        angles["latitude_degrees"] = coords.latitude
+        angles["celestial_equator_angle"] = 90 - coords.latitude
+        angles["pole_altitude"] = coords.latitude
+        angles["horizon_tilt"] = 90 - coords.latitude
+        angles["equator_radius_ratio"] = equator_radius / hemisphere_radius
+        angles["local_meridian_correction_degrees"] = local_meridian_correction
+        angles.update(zip(JAI_PRAKASH_HOUR_ANGLE_KEYS, hour_azimuths.tolist()))
+        
+        notes_values = {
+            "reference": reference_location.title(),
+            "ref_location": ref_location,
+            "ref_data": ref_data,
+            "coords": coords,
+            "latitude_scale": latitude_scale,
+            "hemisphere_radius": hemisphere_radius,
+            "equator_tilt": 90 - coords.latitude
         }
         
-        construction_notes = [
-            f"Based on original {reference_location.title()} Jai Prakash Yantra ({ref_location.latitude:.2f}°N, {ref_location.longitude:.2f}°E)",
-            f"Original hemisphere radius: {ref_data['hemisphere_radius']}m",
-            f"Scaled for latitude {coords.latitude:.2f}°N (scale factor: {latitude_scale:.3f})",
-            f"Excavate hemispherical bowl of radius {hemisphere_radius:.1f}m",
-            f"Tilt celestial equator at {90 - coords.latitude:.1f}° from horizontal",
-            "Mark declination circles for seasonal sun positions",
-            "Engrave hour lines for time measurement",
-            "Install gnomon or bead-on-wire for shadow casting",
-            "Ensure smooth interior surface for accurate readings"
-        ]
-        
         accuracy_metrics = {
             "time_accuracy_minutes": 1.0,
             "seasonal_accuracy_days": 2.0,
@@ -724,8 +1365,10 @@ class ParametricGeometryEngine:
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=JAI_PRAKASH_NOTES,
+            notes_values=notes_values,
+            angles_layout="jai_prakash_yantra"
         )
     
     def generate_digamsa_yantra(self, coords: Coordinates) -> YantraSpecs:
@@ -736,8 +1379,6 @@ class ParametricGeometryEngine:
         with precision scaling for local latitude and magnetic declination corrections
         """
         
-        lat_rad = math.radians(coords.latitude)
-        
         # LATITUDE-DEPENDENT SCALING for optimal visibility range
         # Higher latitudes see more sky in north-south, less in east-west
         visibility_factor = 1.0 + 0.2 * abs(coords.latitude) / 90.0
@@ -754,35 +1395,11 @@ class ParametricGeometryEngine:
         # Simplified calculation - in practice, use NOAA/IGRF models
         magnetic_declination = 0.5 * coords.longitude / 15  # Very rough approximation
         
-        # Precise azimuth markings with cardinal and intercardinal points
-        azimuth_markings = {}
-        cardinal_points = {
-            "north": 0, "north_northeast": 22.5, "northeast": 45, "east_northeast": 67.5,
-            "east": 90, "east_southeast": 112.5, "southeast": 135, "south_southeast": 157.5,
-            "south": 180, "south_southwest": 202.5, "southwest": 225, "west_southwest": 247.5,
-            "west": 270, "west_northwest": 292.5, "northwest": 315, "north_northwest": 337.5
-        }
-        
-        for direction, true_azimuth in cardinal_points.items():
-            magnetic_azimuth = (true_azimuth + magnetic_declination) % 360
-            azimuth_markings[f"true_{direction}"] = true_azimuth
-            azimuth_markings[f"magnetic_{direction}"] = magnetic_azimuth
-        
-        # Additional precision markings every 5°
-        for angle in range(0, 360, 5):
-            azimuth_markings[f"azimuth_{angle:03d}"] = angle
-        
-        # ENHANCED ALTITUDE CALCULATIONS with atmospheric refraction
-        altitude_markings = {}
-        for angle in range(0, 91, 2):  # Every 2° for precision
-            # Atmospheric refraction correction (more significant at low altitudes)
-            if angle <= 10:
-                refraction_correction = 0.58 * (1.0 / math.tan(math.radians(angle + 7.31/(angle + 4.4))))
-            else:
-                refraction_correction = 0.58 * (1.0 / math.tan(math.radians(angle)))
-            
-            corrected_angle = angle + refraction_correction/60  # Convert arcminutes to degrees
-            altitude_markings[f"altitude_{angle:02d}"] = corrected_angle
+        # Precise azimuth markings with cardinal and intercardinal points;
+        # the true azimuths, the precision markings every 5° and the
+        # ENHANCED ALTITUDE CALCULATIONS with atmospheric refraction, every
+        # 2°, are site independent (see DIGAMSA_ANGLES_LAYOUT)
+        magnetic_azimuths = (CARDINAL_AZIMUTHS + magnetic_declination) % 360
         
         # MERIDIAN CALCULATIONS for local solar time
         # Local meridian passage times for different seasons
@@ -798,11 +1415,8 @@ class ParametricGeometryEngine:
             local_solar_noon = 12.0 + longitude_correction/60 + equation_minutes/60
             meridian_passages[season] = local_solar_noon
         
-        # ZENITH DISTANCE CALCULATIONS (complement of altitude)
-        zenith_markings = {}
-        for zenith_angle in range(0, 91, 5):
-            altitude_equivalent = 90 - zenith_angle
-            zenith_markings[f"zenith_{zenith_angle:02d}"] = altitude_equivalent
+        # ZENITH DISTANCE CALCULATIONS (complement of altitude), also in
+        # DIGAMSA_ANGLES_LAYOUT
         
         dimensions = {
             "arc_radius": arc_radius,
@@ -816,35 +1430,26 @@ class ParametricGeometryEngine:
             "platform_area": base_width * base_length
         }
         
-        angles = {
-            "latitude_degrees": coords.latitude,
+        angles = DIGAMSA_ANGLES_LAYOUT.copy()
+        angles["latitude_degrees"] = coords.latitude
+        angles["magnetic_declination"] = magnetic_declination
+        angles["horizon_range"] = 360.0
+        angles["altitude_range"] = 90.0
+        angles["meridian_azimuth"] = 0.0  # True north
+        angles["magnetic_meridian_azimuth"] = magnetic_declination
+        angles.update(zip(DIGAMSA_MAGNETIC_KEYS, magnetic_azimuths.tolist()))
+        
+        notes_values = {
+            "coords": coords,
+            "arc_radius": arc_radius,
+            "base_width": base_width,
+            "base_length": base_length,
             "magnetic_declination": magnetic_declination,
-            "horizon_range": 360.0,
-            "altitude_range": 90.0,
-            "meridian_azimuth": 0.0,  # True north
-            "magnetic_meridian_azimuth": magnetic_declination,
-            **azimuth_markings,
-            **altitude_markings,
-            **zenith_markings
+            "pillar_height": pillar_height,
+            "earliest_noon": min(meridian_passages.values()),
+            "latest_noon": max(meridian_passages.values())
         }
         
-        construction_notes = [
-            f"Digamsa Yantra for precise azimuth and altitude measurements at {coords.latitude:.4f}°N, {coords.longitude:.4f}°E",
-            f"Semicircular arc radius: {arc_radius:.2f}m (scaled for latitude visibility)",
-            f"Base platform: {base_width:.2f}m × {base_length:.2f}m",
-            f"Magnetic declination: {magnetic_declination:.2f}° (approximate for this location)",
-            f"Support pillar height: {pillar_height:.2f}m for optimal viewing",
-            "Mount semicircular arc vertically in north-south plane",
-            "Mark altitude scales every 2° from 0° to 90° on arc",
-            "Mark azimuth scales every 5° on base platform",
-            "Install sighting mechanism at arc center",
-            "Apply atmospheric refraction corrections for low altitudes",
-            "Align true north carefully (not magnetic north)",
-            f"Local solar noon varies by season: {min(meridian_passages.values()):.2f}h to {max(meridian_passages.values()):.2f}h",
-            "Level base platform within ±1 arcminute",
-            "Use bronze or stainless steel for arc construction"
-        ]
-        
         accuracy_metrics = {
             "azimuth_accuracy_degrees": 0.5,
             "altitude_accuracy_degrees": 0.25,
@@ -863,36 +1468,10 @@ class ParametricGeometryEngine:
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
-        )
-        
-        construction_notes = [
-            f"Construct vertical semicircular arc of radius {arc_radius}m",
-            "Mount on stable base aligned with cardinal directions",
-            f"Pillar height: {pillar_height}m for comfortable observation",
-            "Engrave azimuth markings every 10° around the base",
-            "Mark altitude scale every 5° on the arc",
-            "Install movable sighting rod for angular measurements",
-            "Ensure perfect vertical alignment of the semicircle",
-            "Base must be precisely leveled and oriented to true north"
-        ]
-        
-        accuracy_metrics = {
-            "azimuth_accuracy_degrees": 0.5,
-            "altitude_accuracy_degrees": 0.5,
-            "measurement_range_azimuth": 360.0,
-            "measurement_range_altitude": 90.0,
-            "precision_arcminutes": 30
-        }
-        
-        return YantraSpecs(
-            name="Digamsa Yantra (Azimuth-Altitude Instrument)",
-            coordinates=coords,
-            dimensions=dimensions,
-            angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=DIGAMSA_NOTES,
+            notes_values=notes_values,
+            angles_layout="digamsa_yantra"
         )
     
     def generate_dhruva_protha_chakra(self, coords: Coordinates) -> YantraSpecs:
@@ -904,8 +1483,6 @@ class ParametricGeometryEngine:
         a circular disk that can be rotated and tilted.
         """
         
-        lat_rad = math.radians(coords.latitude)
-        
         # Base dimensions
         disk_radius = 2.5  # meters
         central_hole_radius = 0.05  # For pole star sighting
@@ -914,17 +1491,7 @@ class ParametricGeometryEngine:
         # Pole star elevation equals latitude
         pole_elevation = coords.latitude
         
-        # Hour markings around the circumference
-        hour_markings = {}
-        for hour in range(24):
-            angle = hour * 15  # 15° per hour
-            hour_markings[f"hour_{hour:02d}"] = angle
-        
-        # Declination circles for different celestial objects
-        declination_circles = {}
-        for decl in range(-30, 31, 10):  # -30° to +30° declination
-            circle_radius = disk_radius * math.cos(math.radians(decl))
-            declination_circles[f"declination_{decl}"] = circle_radius
+        # Hour markings around the circumference (DHRUVA_ANGLES_LAYOUT)
         
         # Latitude-specific adjustments
         tilt_angle = 90 - coords.latitude  # Complement of latitude
@@ -939,23 +1506,17 @@ class ParametricGeometryEngine:
             "counterweight_mass": 50.0  # kg for balance
         }
         
-        angles = {
-            "pole_elevation": pole_elevation,
-            "disk_tilt_angle": tilt_angle,
-            "latitude_setting": coords.latitude,
-            **hour_markings
-        }
+        angles = DHRUVA_ANGLES_LAYOUT.copy()
+        angles["pole_elevation"] = pole_elevation
+        angles["disk_tilt_angle"] = tilt_angle
+        angles["latitude_setting"] = coords.latitude
         
-        construction_notes = [
-            f"Construct circular disk of radius {disk_radius}m",
-            f"Tilt disk at {tilt_angle:.1f}° from horizontal (90° - latitude)",
-            f"Central hole of {central_hole_radius*1000}mm for pole star sighting",
-            "Mark 24 hour divisions around the circumference",
-            "Install rotation mechanism for tracking celestial motion",
-            "Balance with counterweight for smooth rotation",
-            "Align rotation axis parallel to Earth's axis",
-            f"Pole star visible through center at {pole_elevation:.1f}° elevation"
-        ]
+        notes_values = {
+            "disk_radius": disk_radius,
+            "tilt_angle": tilt_angle,
+            "central_hole_mm": central_hole_radius*1000,
+            "pole_elevation": pole_elevation
+        }
         
         accuracy_metrics = {
             "latitude_measurement_accuracy": 0.1,  # degrees
@@ -969,8 +1530,10 @@ class ParametricGeometryEngine:
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=DHRUVA_NOTES,
+            notes_values=notes_values,
+            angles_layout="dhruva_protha_chakra"
         )
     
     def generate_kapala_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
@@ -985,16 +1548,9 @@ class ParametricGeometryEngine:
         ref_location = self.reference_locations[reference_location]
         
         # Use reference dimensions if available, otherwise defaults
-        if "kapala_yantra" in self.reference_dimensions and reference_location in self.reference_dimensions["kapala_yantra"]:
-            ref_data = self.reference_dimensions["kapala_yantra"][reference_location]
-        else:
-            ref_data = {
-                "bowl_radius": 2.5,
-                "bowl_depth": 2.5,
-                "rim_width": 0.3
-            }
+        ref_data = self._reference_data("kapala_yantra", reference_location)
         
-        lat_rad = math.radians(coords.latitude)
+        _, sin_lat, cos_lat = _lat_trig(coords.latitude)
         
         # Scale based on latitude
         latitude_scale = self._calculate_latitude_scale(coords.latitude, ref_location.latitude)
@@ -1004,49 +1560,21 @@ class ParametricGeometryEngine:
         bowl_depth = ref_data["bowl_depth"] * latitude_scale
         rim_width = ref_data["rim_width"]
         
-        # Enhanced shadow curve calculations for different seasons
-        shadow_curves = {}
-        seasons = ["winter_solstice", "equinox", "summer_solstice"]
-        declinations = [-23.44, 0, 23.44]
-        
-        for season, decl in zip(seasons, declinations):
-            curves = {}
-            for hour in range(6, 19):  # 6 AM to 6 PM
-                hour_angle = (hour - 12) * 15  # degrees
-                
-                # Solar elevation angle
-                elevation = math.asin(
-                    math.sin(lat_rad) * math.sin(math.radians(decl)) +
-                    math.cos(lat_rad) * math.cos(math.radians(decl)) * math.cos(math.radians(hour_angle))
-                )
-                
-                # Solar azimuth angle
-                azimuth = math.atan2(
-                    math.sin(math.radians(hour_angle)),
-                    math.cos(math.radians(hour_angle)) * math.sin(lat_rad) - 
-                    math.tan(math.radians(decl)) * math.cos(lat_rad)
-                )
-                
-                # Shadow position in hemispherical bowl
-                if elevation > 0:
-                    # Shadow tip position in bowl coordinates
-                    shadow_radius = bowl_radius * math.cos(elevation) * abs(math.cos(azimuth))
-                    shadow_depth = bowl_radius * math.sin(elevation)
-                    
-                    curves[f"hour_{hour:02d}"] = {
-                        "radius": min(shadow_radius, bowl_radius),
-                        "azimuth": math.degrees(azimuth) % 360,
-                        "depth": min(shadow_depth, bowl_depth),
-                        "elevation": math.degrees(elevation)
-                    }
-            
-            shadow_curves[season] = curves
+        # Enhanced shadow curve calculations for different seasons, on one
+        # (season, hour) grid from 6 AM to 6 PM
+        # (declination and hour trig are site independent, see KAPALA_DECL_SINES)
+        cos_hour = KAPALA_HOUR_COSINES
         
-        # Calculate hour markings on rim
-        hour_markings = {}
-        for hour in range(6, 19):
-            hour_angle = (hour - 12) * 15
-            hour_markings[f"rim_hour_{hour:02d}"] = hour_angle
+        # Solar elevation and azimuth angles
+        elevation = np.arcsin(sin_lat * KAPALA_DECL_SINES + cos_lat * KAPALA_DECL_COSINES * cos_hour)
+        azimuth = np.arctan2(KAPALA_HOUR_SINES, cos_hour * sin_lat - KAPALA_DECL_TANGENTS * cos_lat)
+        
+        # Shadow tip position in bowl coordinates, used while the sun is up
+        shadow_radius = np.minimum(bowl_radius * np.cos(elevation) * np.abs(np.cos(azimuth)), bowl_radius)
+        shadow_azimuth = np.degrees(azimuth) % 360
+        shadow_depth = np.minimum(bowl_radius * np.sin(elevation), bowl_depth)
+        
+        # Hour markings on rim (KAPALA_ANGLES_LAYOUT)
         
         # Gnomon calculations
         gnomon_height = bowl_radius * 0.75
@@ -1064,46 +1592,34 @@ class ParametricGeometryEngine:
             "latitude_scale_factor": latitude_scale
         }
         
-        angles = {
-            "bowl_tilt": coords.latitude,  # Bowl tilted to latitude angle
-            "gnomon_angle": coords.latitude,
-            "rim_orientation": 0,  # Aligned north-south
-            "magnetic_declination": self._calculate_magnetic_declination(coords),
-            **hour_markings
-        }
+        angles = KAPALA_ANGLES_LAYOUT.copy()
+        angles["bowl_tilt"] = coords.latitude  # Bowl tilted to latitude angle
+        angles["gnomon_angle"] = coords.latitude
+        angles["rim_orientation"] = 0  # Aligned north-south
+        angles["magnetic_declination"] = self._calculate_magnetic_declination(coords)
         
-        # Add comprehensive shadow curve data
-        for season, curves in shadow_curves.items():
-            for hour_key, curve_data in curves.items():
-                angles[f"{season}_{hour_key}_radius"] = curve_data["radius"]
-                angles[f"{season}_{hour_key}_azimuth"] = curve_data["azimuth"]
-                angles[f"{season}_{hour_key}_depth"] = curve_data["depth"]
-        
-        construction_notes = [
-            f"Excavate hemispherical bowl of radius {bowl_radius}m",
-            f"Tilt bowl axis at {coords.latitude:.1f}° from horizontal",
-            "Install central gnomon parallel to Earth's axis",
-            "Mark hour lines on the rim for time reading",
-            "Engrave seasonal curves for different months",
-            "Provide drainage hole at the bottom",
-            "Smooth interior surface for accurate shadow casting",
-            "Align bowl opening to face the celestial equator"
-        ]
+        # Add comprehensive shadow curve data, straight from the grid rows
+        for (radius_key, azimuth_key, depth_key), up, radius, azimuth_deg, depth in zip(
+                KAPALA_CURVE_KEYS, (elevation > 0).ravel().tolist(), shadow_radius.ravel().tolist(),
+                shadow_azimuth.ravel().tolist(), shadow_depth.ravel().tolist()):
+            if up:
+                angles[radius_key] = radius
+                angles[azimuth_key] = azimuth_deg
+                angles[depth_key] = depth
         
-        accuracy_metrics = {
-            "time_accuracy_minutes": 3.0,
-            "seasonal_accuracy_days": 3.0,
-            "angular_measurement_accuracy": 1.0,
-            "usable_daylight_range": 12.0  # hours
-        }
+        notes_values = {"bowl_radius": bowl_radius, "coords": coords}
+        
+        accuracy_metrics = dict(KAPALA_ACCURACY_METRICS)
         
         return YantraSpecs(
             name="Kapala Yantra (Bowl Sundial)",
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=KAPALA_NOTES,
+            notes_values=notes_values,
+            angles_layout="kapala_yantra"
         )
     
     def generate_chakra_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
@@ -1117,17 +1633,10 @@ class ParametricGeometryEngine:
         # Get reference data
         ref_location = self.reference_locations[reference_location]
         
-        # Use reference dimensions if available
-        if "chakra_yantra" in self.reference_dimensions and reference_location in self.reference_dimensions["chakra_yantra"]:
-            ref_data = self.reference_dimensions["chakra_yantra"][reference_location]
-        else:
-            ref_data = {
-                "outer_ring_radius": 2.0,
-                "inner_ring_radius": 1.2,
-                "ring_thickness": 0.08
-            }
+        # Use reference dimensions if available, otherwise defaults
+        ref_data = self._reference_data("chakra_yantra", reference_location)
         
-        lat_rad = math.radians(coords.latitude)
+        _, sin_lat, _ = _lat_trig(coords.latitude)
         
         # Scale based on latitude
         latitude_scale = self._calculate_latitude_scale(coords.latitude, ref_location.latitude)
@@ -1137,60 +1646,12 @@ class ParametricGeometryEngine:
         inner_ring_radius = ref_data["inner_ring_radius"] * latitude_scale
         ring_thickness = ref_data["ring_thickness"]
         
-        # Multiple precision rings for different astronomical functions
-        rings = {
-            "equatorial_ring": {
-                "radius": outer_ring_radius,
-                "tilt": coords.latitude,  # Parallel to celestial equator
-                "function": "hour_angle_measurement"
-            },
-            "meridian_ring": {
-                "radius": outer_ring_radius * 0.9,
-                "tilt": 0,  # Vertical, aligned with local meridian
-                "function": "altitude_measurement"
-            },
-            "horizon_ring": {
-                "radius": outer_ring_radius * 0.8,
-                "tilt": 90,  # Horizontal, parallel to observer's horizon
-                "function": "azimuth_measurement"
-            },
-            "declination_ring": {
-                "radius": outer_ring_radius * 0.85,
-                "tilt": coords.latitude,  # Same as equatorial but offset
-                "function": "solar_declination_tracking"
-            }
-        }
-        
-        # Precise degree markings for all rings
-        degree_markings = {}
-        for ring_name in rings.keys():
-            for degree in range(0, 361, 1):  # Every degree for precision
-                if degree % 5 == 0:  # Major markings every 5 degrees
-                    degree_markings[f"{ring_name}_major_{degree:03d}"] = degree
-                elif degree % 1 == 0:  # Minor markings every degree
-                    degree_markings[f"{ring_name}_minor_{degree:03d}"] = degree
-        
-        # Hour angle markings on equatorial ring
-        hour_markings = {}
-        for hour in range(24):
-            hour_angle = hour * 15  # 15 degrees per hour
-            hour_markings[f"equatorial_hour_{hour:02d}"] = hour_angle
-        
-        # Seasonal declination markings
-        seasonal_angles = {}
-        seasons_decl = {
-            "winter_solstice": -23.44,
-            "spring_equinox": 0.0,
-            "summer_solstice": 23.44,
-            "autumn_equinox": 0.0
-        }
-        
-        for season, decl in seasons_decl.items():
-            seasonal_angles[f"{season}_declination"] = decl
-            # Calculate ring position for this declination
-            ring_position = math.degrees(math.atan(math.tan(math.radians(decl)) / math.sin(lat_rad)))
-            seasonal_angles[f"{season}_ring_position"] = ring_position
+        # Hour angle markings on equatorial ring, 15 degrees per hour
+        # (CHAKRA_ANGLES_LAYOUT)
         
+        # Multiple precision rings for different astronomical functions:
+        # equatorial (hour angle), meridian (altitude), horizon (azimuth)
+        # and declination (solar declination tracking)
         dimensions = {
             "outer_ring_radius": outer_ring_radius,
             "inner_ring_radius": inner_ring_radius,
@@ -1199,49 +1660,40 @@ class ParametricGeometryEngine:
             "central_axis_length": outer_ring_radius * 2.4,
             "base_support_radius": outer_ring_radius + 0.4,
             "mounting_post_height": 2.0,
-            "equatorial_ring_radius": rings["equatorial_ring"]["radius"],
-            "meridian_ring_radius": rings["meridian_ring"]["radius"],
-            "horizon_ring_radius": rings["horizon_ring"]["radius"],
-            "declination_ring_radius": rings["declination_ring"]["radius"],
+            "equatorial_ring_radius": outer_ring_radius,
+            "meridian_ring_radius": outer_ring_radius * 0.9,
+            "horizon_ring_radius": outer_ring_radius * 0.8,
+            "declination_ring_radius": outer_ring_radius * 0.85,
             "total_assembly_height": 2.5,
             "latitude_scale_factor": latitude_scale
         }
         
-        angles = {
-            "equatorial_ring_tilt": rings["equatorial_ring"]["tilt"],
-            "meridian_ring_tilt": rings["meridian_ring"]["tilt"],
-            "horizon_ring_tilt": rings["horizon_ring"]["tilt"],
-            "declination_ring_tilt": rings["declination_ring"]["tilt"],
-            "magnetic_declination": self._calculate_magnetic_declination(coords),
-            **hour_markings,
-            **seasonal_angles
-        }
+        angles = CHAKRA_ANGLES_LAYOUT.copy()
+        angles["equatorial_ring_tilt"] = coords.latitude  # Parallel to celestial equator
+        angles["meridian_ring_tilt"] = 0  # Vertical, aligned with local meridian
+        angles["horizon_ring_tilt"] = 90  # Horizontal, parallel to observer's horizon
+        angles["declination_ring_tilt"] = coords.latitude  # Same as equatorial but offset
+        angles["magnetic_declination"] = self._calculate_magnetic_declination(coords)
         
-        construction_notes = [
-            f"Construct nested rings with outer radius {outer_ring_radius}m",
-            f"Tilt equatorial ring at {coords.latitude:.1f}° (= latitude)",
-            "Mount meridian ring vertically in north-south plane",
-            "Position horizon ring horizontally",
-            "Mark degree scales on all rings",
-            "Ensure rings can rotate independently",
-            "Install sighting devices on ring intersections",
-            "Align system with true north-south direction"
-        ]
+        # Seasonal declination markings are in the layout; the ring position
+        # of each declination is the only site-dependent part
+        angles.update(zip(CHAKRA_RING_POSITION_KEYS, [
+            math.atan(tan_decl / sin_lat) * RAD2DEG for tan_decl in CHAKRA_SEASON_TANGENTS
+        ]))
         
-        accuracy_metrics = {
-            "angular_measurement_accuracy": 0.2,  # degrees
-            "tracking_accuracy": 0.5,
-            "declination_range": 47.0,  # +/- 23.5 degrees
-            "hour_angle_range": 360.0
-        }
+        notes_values = {"outer_ring_radius": outer_ring_radius, "coords": coords}
+        
+        accuracy_metrics = dict(CHAKRA_ACCURACY_METRICS)
         
         return YantraSpecs(
             name="Chakra Yantra (Ring Dial)",
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=CHAKRA_NOTES,
+            notes_values=notes_values,
+            angles_layout="chakra_yantra"
         )
     
     def generate_unnatamsa_yantra(self, coords: Coordinates, reference_location: str = "jaipur") -> YantraSpecs:
@@ -1255,17 +1707,10 @@ class ParametricGeometryEngine:
         # Get reference data
         ref_location = self.reference_locations[reference_location]
         
-        # Use reference dimensions if available
-        if "unnatamsa_yantra" in self.reference_dimensions and reference_location in self.reference_dimensions["unnatamsa_yantra"]:
-            ref_data = self.reference_dimensions["unnatamsa_yantra"][reference_location]
-        else:
-            ref_data = {
-                "arc_radius": 2.5,
-                "base_length": 3.5,
-                "base_width": 2.8
-            }
+        # Use reference dimensions if available, otherwise defaults
+        ref_data = self._reference_data("unnatamsa_yantra", reference_location)
         
-        lat_rad = math.radians(coords.latitude)
+        _, sin_lat, cos_lat = _lat_trig(coords.latitude)
         
         # Scale based on latitude
         latitude_scale = self._calculate_latitude_scale(coords.latitude, ref_location.latitude)
@@ -1275,66 +1720,24 @@ class ParametricGeometryEngine:
         base_length = ref_data["base_length"] * latitude_scale
         base_width = ref_data["base_width"] * latitude_scale
         
-        # Precise solar altitude calculations for different seasons
-        seasons_data = {
-            "summer_solstice": {
-                "declination": 23.44,
-                "max_altitude": 90 - abs(coords.latitude - 23.44)
-            },
-            "winter_solstice": {
-                "declination": -23.44,
-                "max_altitude": 90 - abs(coords.latitude + 23.44)
-            },
-            "spring_equinox": {
-                "declination": 0.0,
-                "max_altitude": 90 - abs(coords.latitude)
-            },
-            "autumn_equinox": {
-                "declination": 0.0,
-                "max_altitude": 90 - abs(coords.latitude)
-            }
-        }
+        # Noon solar altitudes at the solstices and equinoxes
+        max_altitude_equinox, max_altitude_summer, max_altitude_winter = _noon_altitudes(coords.latitude)
         
-        # Hour-wise altitude calculations for each season
+        # Hour-wise altitude calculations for each season, 6 AM to 6 PM.
+        # Scalar math: at 4 × 13 points numpy's per-call overhead outweighs it
         seasonal_altitudes = {}
-        for season, data in seasons_data.items():
-            decl = data["declination"]
-            season_altitudes = {}
-            
-            for hour in range(6, 19):  # 6 AM to 6 PM
-                hour_angle = (hour - 12) * 15  # degrees from solar noon
-                
-                # Solar altitude calculation
-                altitude = math.asin(
-                    math.sin(lat_rad) * math.sin(math.radians(decl)) +
-                    math.cos(lat_rad) * math.cos(math.radians(decl)) * math.cos(math.radians(hour_angle))
-                )
-                
-                if altitude > 0:  # Sun is above horizon
-                    altitude_deg = math.degrees(altitude)
-                    season_altitudes[f"hour_{hour:02d}"] = altitude_deg
-            
-            seasonal_altitudes[season] = season_altitudes
-        
-        # Precise altitude scale markings on the quadrant arc
-        altitude_scale = {}
-        for alt in range(0, 91):  # Every degree from 0° to 90°
-            if alt % 10 == 0:  # Major divisions every 10°
-                altitude_scale[f"major_altitude_{alt:02d}"] = alt
-            elif alt % 5 == 0:  # Medium divisions every 5°
-                altitude_scale[f"medium_altitude_{alt:02d}"] = alt
-            else:  # Minor divisions every degree
-                altitude_scale[f"minor_altitude_{alt:02d}"] = alt
-        
-        # Azimuth reference markings
-        azimuth_markings = {}
-        cardinal_directions = {
-            "north": 0, "northeast": 45, "east": 90, "southeast": 135,
-            "south": 180, "southwest": 225, "west": 270, "northwest": 315
-        }
+        asin = math.asin
         
-        for direction, azimuth in cardinal_directions.items():
-            azimuth_markings[f"azimuth_{direction}"] = azimuth
+        for season, (sin_decl, cos_decl) in UNNATAMSA_DECL_TRIG.items():
+            sin_lat_sin_decl = sin_lat * sin_decl  # invariant over the day
+            cos_lat_cos_decl = cos_lat * cos_decl
+            seasonal_altitudes[season] = [
+                asin(sin_lat_sin_decl + cos_lat_cos_decl * cos_hour) for cos_hour in DAYLIGHT_HOUR_COSINES
+            ]
+        
+        # Precise altitude scale markings on the quadrant arc, every degree
+        # from 0° to 90°, and azimuth reference markings for the eight
+        # cardinal directions (site independent, see UNNATAMSA_ANGLES_LAYOUT)
         
         dimensions = {
             "arc_radius": arc_radius,
@@ -1349,88 +1752,156 @@ class ParametricGeometryEngine:
             "latitude_scale_factor": latitude_scale
         }
         
-        angles = {
-            "quadrant_orientation": 180,  # Facing south for northern hemisphere
-            "max_altitude_summer": seasons_data["summer_solstice"]["max_altitude"],
-            "max_altitude_winter": seasons_data["winter_solstice"]["max_altitude"],
-            "max_altitude_equinox": seasons_data["spring_equinox"]["max_altitude"],
-            "latitude_complement": 90 - coords.latitude,
-            "magnetic_declination": self._calculate_magnetic_declination(coords),
-            **altitude_scale,
-            **azimuth_markings
-        }
-        
-        # Add seasonal altitude data to angles
-        for season, season_altitudes in seasonal_altitudes.items():
-            for hour_key, altitude in season_altitudes.items():
-                angles[f"{season}_{hour_key}_altitude"] = altitude
-        
-        construction_notes = [
-            f"Construct quarter-circle arc of radius {arc_radius:.1f}m",
-            f"Base platform: {base_length:.1f}m × {base_width:.1f}m",
-            "Mount vertically facing south for optimal solar tracking",
-            f"Maximum summer altitude: {seasons_data['summer_solstice']['max_altitude']:.1f}°",
-            f"Maximum winter altitude: {seasons_data['winter_solstice']['max_altitude']:.1f}°",
-            f"Equinox maximum altitude: {seasons_data['spring_equinox']['max_altitude']:.1f}°",
-            "Install precision movable sighting arm along the graduated arc",
-            "Mark altitude scale every degree with major divisions every 10°",
-            "Engrave seasonal curves for solstices and equinoxes",
-            "Add azimuth reference markings for cardinal directions",
-            "Ensure precise vertical alignment using plumb line",
-            f"Scaled for latitude {coords.latitude:.2f}°N with factor {latitude_scale:.3f}"
-        ]
+        angles = UNNATAMSA_ANGLES_LAYOUT.copy()
+        angles["quadrant_orientation"] = 180  # Facing south for northern hemisphere
+        angles["max_altitude_summer"] = max_altitude_summer
+        angles["max_altitude_winter"] = max_altitude_winter
+        angles["max_altitude_equinox"] = max_altitude_equinox
+        angles["latitude_complement"] = 90 - coords.latitude
+        angles["magnetic_declination"] = self._calculate_magnetic_declination(coords)
+        
+        # Add seasonal altitude data to angles, in degrees, for the hours
+        # the sun is above the horizon
+        for season, altitudes in seasonal_altitudes.items():
+            angles.update(
+                (key, altitude * RAD2DEG)
+                for key, altitude in zip(UNNATAMSA_ALTITUDE_KEYS[season], altitudes) if altitude > 0
+            )
         
-        accuracy_metrics = {
-            "altitude_measurement_accuracy": 0.25,  # degrees
-            "time_determination_accuracy": 5.0,  # minutes
-            "seasonal_variation_tracking": 1.0,  # degrees
-            "measurement_range": 90.0  # degrees altitude
+        notes_values = {
+            "arc_radius": arc_radius,
+            "base_length": base_length,
+            "base_width": base_width,
+            "max_altitude_summer": max_altitude_summer,
+            "max_altitude_winter": max_altitude_winter,
+            "max_altitude_equinox": max_altitude_equinox,
+            "coords": coords,
+            "latitude_scale": latitude_scale
         }
         
+        accuracy_metrics = dict(UNNATAMSA_ACCURACY_METRICS)
+        
         return YantraSpecs(
             name="Unnatamsa Yantra (Solar Altitude Instrument)",
             coordinates=coords,
             dimensions=dimensions,
             angles=angles,
-            construction_notes=construction_notes,
-            accuracy_metrics=accuracy_metrics
+            accuracy_metrics=accuracy_metrics,
+            notes_template=UNNATAMSA_NOTES,
+            notes_values=notes_values,
+            angles_layout="unnatamsa_yantra"
         )
     
+    def generate_batch(self, yantra_type: str, coords_array: np.ndarray,
+                       reference_locations: List[str]) -> List[YantraSpecs]:
+        """
+        Generate specifications of one yantra type for many locations
+        
+        Args:
+            yantra_type: Type of yantra (e.g., "samrat_yantra")
+            coords_array: (N, 3) array of latitude, longitude, elevation rows
+            reference_locations: Historical reference location for each row
+            
+        Returns:
+            List of N YantraSpecs in row order
+        """
+        generator = getattr(self, f"generate_{yantra_type}", None)
+        if generator is None:
+            raise ValueError(f"Unknown yantra type: {yantra_type}")
+        takes_reference = "reference_location" in inspect.signature(generator).parameters
+        
+        specs = []
+        for (latitude, longitude, elevation), reference in zip(coords_array.tolist(), reference_locations):
+            coords = Coordinates(latitude=latitude, longitude=longitude, elevation=elevation)
+            specs.append(generator(coords, reference) if takes_reference else generator(coords))
+        return specs
+    
     def calculate_solar_position(self, coords: Coordinates, date_time: datetime) -> Dict[str, float]:
         """
         Calculate solar position (elevation and azimuth) for given coordinates and time
         Simplified calculation for demonstration
         """
         
-        # Day of year
-        day_of_year = date_time.timetuple().tm_yday
+        # Day of year (ordinal arithmetic, no struct_time) and decimal local hour
+        day_of_year = date_time.toordinal() - date(date_time.year, 1, 1).toordinal() + 1
+        hour = date_time.hour + date_time.minute/60
         
-        # Solar declination (simplified)
-        declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
+        elevation, azimuth, declination, hour_angle = _solar_position_kernel(
+            float(coords.latitude), day_of_year, hour
+        )
         
-        # Hour angle
-        hour_angle = 15 * (date_time.hour + date_time.minute/60 - 12)
+        return {
+            "elevation_degrees": elevation,
+            "azimuth_degrees": azimuth,
+            "declination_degrees": declination,
+            "hour_angle_degrees": hour_angle
+        }
+    
+    def calculate_solar_positions(self, coords: Coordinates, times) -> Dict[str, np.ndarray]:
+        """
+        Solar positions at one site for an array of local times
         
-        # Convert to radians
-        lat_rad = math.radians(coords.latitude)
-        decl_rad = math.radians(declination)
-        hour_rad = math.radians(hour_angle)
+        Vectorized calculate_solar_position: times is anything NumPy reads as
+        datetime64 (datetimes, ISO strings, a datetime64 range) and, like the
+        scalar method, is resolved to the minute.
         
-        # Solar elevation angle
-        elevation = math.asin(
-            math.sin(lat_rad) * math.sin(decl_rad) +
-            math.cos(lat_rad) * math.cos(decl_rad) * math.cos(hour_rad)
-        )
+        Returns:
+            Dict of arrays shaped like times, with the same keys as
+            calculate_solar_position
+        """
+        minutes = np.asarray(times, dtype="datetime64[m]")
+        days = minutes.astype("datetime64[D]")
+        day_of_year = (days - minutes.astype("datetime64[Y]")).astype(np.int64) + 1
+        hour = (minutes - days).astype(np.int64) / 60
         
-        # Solar azimuth angle
-        azimuth = math.atan2(
-            math.sin(hour_rad),
-            math.cos(hour_rad) * math.sin(lat_rad) - math.tan(decl_rad) * math.cos(lat_rad)
-        )
+        return self.calculate_solar_position_arrays(float(coords.latitude), day_of_year, hour)
+    
+    def calculate_solar_position_batch(self, coords: Coordinates, day_of_year: np.ndarray,
+                                       hour: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Solar positions at one site for many times (e.g. a per-minute day)
         
+        Args:
+            coords: Site coordinates
+            day_of_year: (N,) days of year
+            hour: (N,) local times as decimal hours
+            
+        Returns:
+            Dict of (N,) arrays with the same keys as calculate_solar_position
+        """
+        return self.calculate_solar_position_arrays(float(coords.latitude), day_of_year, hour)
+    
+    def calculate_solar_position_arrays(self, latitudes: np.ndarray, day_of_year: np.ndarray,
+                                        hour: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Solar positions for many (latitude, day, time) samples
+        
+        Takes plain numbers so sweeps convert their datetimes once, outside
+        the kernel.
+        
+        Args:
+            latitudes: Latitudes in degrees
+            day_of_year: Days of year
+            hour: Local times as decimal hours
+            
+        Returns:
+            Dict of arrays, in the broadcast shape of the three inputs, with
+            the same keys as calculate_solar_position
+        """
+        columns = [np.asarray(values, dtype=np.float64) for values in (latitudes, day_of_year, hour)]
+        shape = np.broadcast_shapes(*(column.shape for column in columns))
+        # Broadcast inputs are materialized so the kernel gets flat contiguous arrays
+        columns = [
+            np.ascontiguousarray(column).ravel() if column.shape == shape else np.broadcast_to(column, shape).ravel()
+            for column in columns
+        ]
+        
+        solar_positions = _solar_position_batch if NUMBA_AVAILABLE else _solar_position_numpy
+        positions = solar_positions(*columns).reshape((4,) + shape)
+        elevation, azimuth, declination, hour_angle = positions
         return {
-            "elevation_degrees": math.degrees(elevation),
-            "azimuth_degrees": math.degrees(azimuth),
+            "elevation_degrees": elevation,
+            "azimuth_degrees": azimuth,
             "declination_degrees": declination,
             "hour_angle_degrees": hour_angle
         }
@@ -1444,15 +1915,12 @@ class ParametricGeometryEngine:
         - Shadow lengths and geometric relationships
         - Celestial sphere projections
         """
-        target_rad = math.radians(target_latitude)
-        reference_rad = math.radians(reference_latitude)
-        
         # Scale based on sine of latitude complement (distance from pole)
         # This affects shadow lengths and gnomon geometry
         target_complement = 90 - abs(target_latitude)
         reference_complement = 90 - abs(reference_latitude)
         
-        scale_factor = math.sin(math.radians(target_complement)) / math.sin(math.radians(reference_complement))
+        scale_factor = math.sin(target_complement * DEG2RAD) / math.sin(reference_complement * DEG2RAD)
         
         return scale_factor
     
@@ -1469,65 +1937,132 @@ class ParametricGeometryEngine:
         
         return base_declination + latitude_factor + longitude_factor
     
+    def _specifications_dict(self, yantra_specs: YantraSpecs) -> Dict:
+        return {
+            "name": yantra_specs.name,
+            "coordinates": {
+                "latitude": yantra_specs.coordinates.latitude,
+                "longitude": yantra_specs.coordinates.longitude,
+                "elevation": yantra_specs.coordinates.elevation
+            },
+            "dimensions": yantra_specs.dimensions,
+            "angles": yantra_specs.angles,
+            "construction_notes": yantra_specs.construction_notes,
+            "accuracy_metrics": yantra_specs.accuracy_metrics
+        }
+    
+    def _json_bytes(self, yantra_specs: YantraSpecs) -> bytes:
+        """The indented JSON export encoded with orjson"""
+        return orjson.dumps(
+            self._specifications_dict(yantra_specs),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    def iter_json_specifications(self, yantra_specs: YantraSpecs, chunk_size: int = 8192) -> Iterator[bytes]:
+        """
+        Yield the JSON export as UTF-8 byte chunks
+        
+        Produces the same document as export_specifications(specs, "json"),
+        grouped into chunks of roughly chunk_size bytes for streaming.
+        """
+        if ORJSON_AVAILABLE:
+            document = self._json_bytes(yantra_specs)
+            for start in range(0, len(document), chunk_size):
+                yield document[start:start + chunk_size]
+            return
+        
+        encoder = json.JSONEncoder(indent=2)
+        pending = []
+        pending_size = 0
+        for piece in encoder.iterencode(self._specifications_dict(yantra_specs)):
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= chunk_size:
+                yield "".join(pending).encode("utf-8")
+                pending = []
+                pending_size = 0
+        if pending:
+            yield "".join(pending).encode("utf-8")
+    
     def export_specifications(self, yantra_specs: YantraSpecs, format: str = "json") -> str:
-        """Export yantra specifications in various formats"""
-        
-        if format.lower() == "json":
-            return json.dumps({
-                "name": yantra_specs.name,
-                "coordinates": {
-                    "latitude": yantra_specs.coordinates.latitude,
-                    "longitude": yantra_specs.coordinates.longitude,
-                    "elevation": yantra_specs.coordinates.elevation
-                },
-                "dimensions": yantra_specs.dimensions,
-                "angles": yantra_specs.angles,
-                "construction_notes": yantra_specs.construction_notes,
-                "accuracy_metrics": yantra_specs.accuracy_metrics
-            }, indent=2)
-        
-        elif format.lower() == "blueprint":
-            # Generate human-readable blueprint format
-            blueprint = f"""
+        """Export yantra specifications in various formats (see EXPORT_FORMATS)"""
+        exporter = EXPORT_FORMATS.get(format.lower())
+        if exporter is None:
+            raise ValueError(f"Unsupported export format: {format}")
+        return getattr(self, exporter)(yantra_specs)
+    
+    def _export_json(self, yantra_specs: YantraSpecs) -> str:
+        """Indented JSON document (orjson when installed)"""
+        if ORJSON_AVAILABLE:
+            return self._json_bytes(yantra_specs).decode("utf-8")
+        return json.dumps(self._specifications_dict(yantra_specs), indent=2)
+    
+    def _export_blueprint(self, yantra_specs: YantraSpecs) -> str:
+        """Human-readable blueprint, collected as lines and joined once at the end"""
+        coordinates = yantra_specs.coordinates
+        parts = [f"""
 YANTRA CONSTRUCTION BLUEPRINT
 =============================
 
 Instrument: {yantra_specs.name}
-Location: {yantra_specs.coordinates.latitude:.4f}°N, {yantra_specs.coordinates.longitude:.4f}°E
-Elevation: {yantra_specs.coordinates.elevation}m
+Location: {coordinates.latitude:.4f}°N, {coordinates.longitude:.4f}°E
+Elevation: {coordinates.elevation}m
 
 DIMENSIONS:
 -----------
-"""
-            for key, value in yantra_specs.dimensions.items():
-                blueprint += f"{key.replace('_', ' ').title()}: {value:.2f}m\n"
-            
-            blueprint += f"""
+"""]
+        dimensions = yantra_specs.dimensions
+        parts.extend(f"{label}: {value:.2f}m\n" for label, value in zip(_display_keys(tuple(dimensions)), dimensions.values()))
+        
+        parts.append("""
 ANGLES:
 -------
-"""
-            for key, value in yantra_specs.angles.items():
-                blueprint += f"{key.replace('_', ' ').title()}: {value:.2f}°\n"
-            
-            blueprint += f"""
+""")
+        angles = yantra_specs.angles
+        parts.extend(f"{label}: {value:.2f}°\n" for label, value in zip(_display_keys(tuple(angles)), angles.values()))
+        
+        parts.append("""
 CONSTRUCTION NOTES:
 ------------------
-"""
-            for i, note in enumerate(yantra_specs.construction_notes, 1):
-                blueprint += f"{i}. {note}\n"
-            
-            blueprint += f"""
+""")
+        parts.extend(f"{i}. {note}\n" for i, note in enumerate(yantra_specs.construction_notes, 1))
+        
+        parts.append("""
 ACCURACY SPECIFICATIONS:
 -----------------------
-"""
-            for key, value in yantra_specs.accuracy_metrics.items():
-                unit = "°" if "degrees" in key else ("min" if "minutes" in key else "")
-                blueprint += f"{key.replace('_', ' ').title()}: ±{value:.1f}{unit}\n"
-            
-            return blueprint
+""")
+        for key, value in yantra_specs.accuracy_metrics.items():
+            label, unit = _accuracy_label(key)
+            parts.append(f"{label}: ±{value:.1f}{unit}\n")
         
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+        return "".join(parts)
+
+# Engine owned by a pool worker process, created on its first batch
+_worker_engine = None
+
+def compute_specs_batch(yantra_type: str, coords_array: np.ndarray,
+                        reference_locations: List[str]) -> List:
+    """
+    Generate one yantra type for many locations inside a worker process
+    
+    Module-level so it pickles by reference without importing the API app.
+    Failures are returned in place of specs so one bad row does not fail
+    the rest of the batch.
+    """
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = ParametricGeometryEngine()
+    
+    try:
+        return _worker_engine.generate_batch(yantra_type, coords_array, reference_locations)
+    except Exception:
+        results = []
+        for row, reference in zip(coords_array, reference_locations):
+            try:
+                results.extend(_worker_engine.generate_batch(yantra_type, row[np.newaxis], [reference]))
+            except Exception as e:
+                results.append(e)
+        return results
 
 # Example usage and testing
 if __name__ == "__main__":
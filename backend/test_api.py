@@ -1,6 +1,7 @@
 """
 Simple test script to check the yantra generation API
 """
+import asyncio
 import requests
 import json
 
@@ -70,5 +71,38 @@ def test_api():
     except Exception as e:
         print(f"ERROR: {e}")
 
+class FailingExecutor:
+    """Executor whose submit fails like a pool shut down during reload"""
+    
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+def test_batcher_failure_resolves_waiters():
+    """A batch whose executor call fails must fail its requests, not hang them"""
+    import main
+    
+    async def run_batch():
+        batcher = main.GenerationBatcher()
+        keys = [
+            main._specs_key("samrat_yantra", 12.9716, 77.5946, 920, "jaipur"),
+            main._specs_key("samrat_yantra", 12.9716, 77.5946, 920, "jaipur"),
+            main._specs_key("rama_yantra", 28.6139, 77.2090, 216, "jaipur")
+        ]
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(key) for key in keys), return_exceptions=True),
+            timeout=5
+        )
+    
+    get_executor = main.get_executor
+    main.get_executor = FailingExecutor
+    try:
+        results = asyncio.run(run_batch())
+    finally:
+        main.get_executor = get_executor
+    
+    assert len(results) == 3
+    assert all(isinstance(result, RuntimeError) for result in results)
+
 if __name__ == "__main__":
-    test_api()
\ No newline at end of file
+    test_api()
+    test_batcher_failure_resolves_waiters()
\ No newline at end of file
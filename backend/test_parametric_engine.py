@@ -0,0 +1,171 @@
+"""
+Test the parametric engine's pickling and batch entry points used by the API worker pool
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ast
+import dataclasses
+import math
+import pickle
+import numpy as np
+
+from parametric_engine import (
+    ParametricGeometryEngine, Coordinates, YantraSpecs, CACHED_GENERATORS, SAMRAT_HOUR_KEYS,
+    DEG2RAD, _samrat_shadows, compute_specs_batch
+)
+
+# Sites every generator supports (Rama and Chakra need a positive latitude)
+TEST_SITES = (
+    Coordinates(latitude=28.6139, longitude=77.2090, elevation=216),
+    Coordinates(latitude=12.9716, longitude=77.5946, elevation=920)
+)
+
+def assert_same(expected, actual, path="specs"):
+    """Deep equality that also requires identical types and dict key order"""
+    assert type(expected) is type(actual), f"{path}: {type(expected).__name__} != {type(actual).__name__}"
+    if isinstance(expected, dict):
+        assert list(expected) == list(actual), f"{path}: key order differs"
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}[{key!r}]")
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual), f"{path}: length differs"
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            assert_same(a, b, f"{path}[{i}]")
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual), f"{path}: {actual} is not nan"
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+def assert_round_trip(spec: YantraSpecs):
+    restored = pickle.loads(pickle.dumps(spec))
+    assert restored == spec
+    for field in dataclasses.fields(YantraSpecs):
+        if field.compare:
+            assert_same(getattr(spec, field.name), getattr(restored, field.name), f"{spec.name}.{field.name}")
+    assert restored.construction_notes == spec.construction_notes
+
+def test_specs_pickle_round_trip():
+    """Every cached generator's specs survive pickling, layout-packed or not"""
+    engine = ParametricGeometryEngine()
+    
+    for name in CACHED_GENERATORS:
+        for coords in TEST_SITES:
+            spec = getattr(engine, name)(coords)
+            assert_round_trip(spec)
+            
+            # Extra angles after the layout keys travel alongside its values;
+            # angles that no longer start with the layout take the plain path
+            modified = dataclasses.replace(spec, angles={**spec.angles, "extra_marking": 1.5})
+            assert_round_trip(modified)
+            reordered = dataclasses.replace(spec, angles=dict(reversed(list(spec.angles.items()))))
+            assert_round_trip(reordered)
+    
+    print(f"✓ {len(CACHED_GENERATORS)} generators round-trip through pickle")
+
+def test_compute_specs_batch_errors():
+    """Bad rows come back as ValueError in place, without failing the batch"""
+    coords_array = np.array([
+        [coords.latitude, coords.longitude, coords.elevation] for coords in TEST_SITES
+    ])
+    
+    results = compute_specs_batch("samrat_yantra", coords_array, ["jaipur", "atlantis"])
+    assert len(results) == 2
+    assert isinstance(results[0], YantraSpecs)
+    assert isinstance(results[1], ValueError)
+    
+    results = compute_specs_batch("no_such_yantra", coords_array, ["jaipur", "delhi"])
+    assert len(results) == 2
+    assert all(isinstance(result, ValueError) for result in results)
+    
+    print("✓ compute_specs_batch returns per-row ValueErrors")
+
+def test_samrat_batch_matches_scalar():
+    """generate_samrat_yantra_batch columns agree with generate_samrat_yantra site by site"""
+    engine = ParametricGeometryEngine()
+    latitudes = np.array([-33.8688, 0.0, 12.9716, 45.0, 89.0])
+    longitudes = np.array([151.2093, 32.5825, 77.5946, -73.5673, 0.0])
+    
+    for reference in ("jaipur", "delhi", "ujjain"):
+        batch = engine.generate_samrat_yantra_batch(latitudes, longitudes, reference)
+        
+        for i, (latitude, longitude) in enumerate(zip(latitudes.tolist(), longitudes.tolist())):
+            spec = engine.generate_samrat_yantra(Coordinates(latitude, longitude, 0.0), reference)
+            scalar = {"latitude": latitude, "longitude": longitude, **spec.dimensions, **spec.angles}
+            hour_angles = [scalar.pop(key) for key in SAMRAT_HOUR_KEYS]
+            
+            assert set(batch) == set(scalar) | {"hour_line_angles", "shadow_lengths"}
+            for key, value in scalar.items():
+                assert math.isclose(batch[key][i], value, rel_tol=1e-12, abs_tol=1e-12), (reference, latitude, key)
+            for batch_angle, angle in zip(batch["hour_line_angles"][i].tolist(), hour_angles):
+                assert math.isclose(batch_angle, angle, rel_tol=1e-12, abs_tol=1e-12), (reference, latitude)
+            
+            # The scalar path's shadow kernel, for the same gnomon
+            _, shadows = _samrat_shadows(latitude * DEG2RAD, spec.dimensions["gnomon_height"])
+            for batch_shadow, shadow in zip(batch["shadow_lengths"][i].tolist(), shadows.tolist()):
+                assert batch_shadow == shadow or math.isclose(batch_shadow, shadow, rel_tol=1e-12), (reference, latitude)
+    
+    print(f"✓ Samrat batch matches the scalar generator at {len(latitudes)} latitudes")
+
+def test_cached_specs_are_copies():
+    """Editing a returned spec does not change what later calls return"""
+    engine = ParametricGeometryEngine()
+    coords = TEST_SITES[0]
+    
+    for name in CACHED_GENERATORS:
+        generator = getattr(engine, name)
+        first = generator(coords)
+        expected = pickle.loads(pickle.dumps(first))
+        for table in (first.dimensions, first.angles, first.accuracy_metrics):
+            table[next(iter(table))] = -1
+            table["extra_marking"] = 1.5
+        
+        assert_same(expected.dimensions, generator(coords).dimensions, f"{name}.dimensions")
+        assert_same(expected.angles, generator(coords).angles, f"{name}.angles")
+        assert_same(expected.accuracy_metrics, generator(coords).accuracy_metrics, f"{name}.accuracy_metrics")
+    
+    print(f"✓ {len(CACHED_GENERATORS)} cached generators return independent specs")
+
+def _names(node, ctx):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ctx)}
+
+def test_generators_have_no_dead_locals():
+    """No generate_* method assigns a local it never reads, or overwrites one before reading it"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "parametric_engine.py")) as f:
+        tree = ast.parse(f.read())
+    engine_class = next(
+        node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "ParametricGeometryEngine"
+    )
+    generators = [
+        node for node in engine_class.body
+        if isinstance(node, ast.FunctionDef) and node.name.startswith("generate_")
+    ]
+    
+    for func in generators:
+        unused = _names(func, ast.Store) - _names(func, ast.Load) - {"_"}
+        assert not unused, f"{func.name} never reads {sorted(unused)}"
+        
+        # Straight-line reassignment: a top-level `name = ...` whose value is
+        # replaced by a later top-level assignment with no read in between
+        unread = {}
+        for stmt in func.body:
+            for name in _names(stmt, ast.Load):
+                unread.pop(name, None)
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if isinstance(target, ast.Name):
+                        assert target.id not in unread, (
+                            f"{func.name} overwrites {target.id} (line {unread[target.id]}) before reading it"
+                        )
+                        unread[target.id] = stmt.lineno
+    
+    print(f"✓ {len(generators)} generators have no dead locals")
+
+if __name__ == "__main__":
+    test_specs_pickle_round_trip()
+    test_compute_specs_batch_errors()
+    test_samrat_batch_matches_scalar()
+    test_cached_specs_are_copies()
+    test_generators_have_no_dead_locals()
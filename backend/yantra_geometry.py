@@ -6,6 +6,8 @@ Based on ray-surface intersection algorithms and celestial mechanics
 
 import numpy as np
 import math
+import functools
+import warnings
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime
@@ -13,6 +15,22 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Arc
 import json
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run kernels as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Fast-math flags for the kernels, minus the no-NaN/no-Inf assumptions:
+# misses are reported as NaN
+KERNEL_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
 @dataclass
 class Vector3D:
     """3D vector with basic operations"""
@@ -51,6 +69,68 @@ class Vector3D:
     def to_array(self):
         return np.array([self.x, self.y, self.z])
 
+class Vector3DArray:
+    """Batch of 3D vectors stored as one (N, 3) float64 array"""
+    
+    __slots__ = ('a',)
+    
+    def __init__(self, a):
+        self.a = np.asarray(a, dtype=np.float64).reshape(-1, 3)
+    
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector3D]) -> 'Vector3DArray':
+        return cls([(v.x, v.y, v.z) for v in vectors])
+    
+    @staticmethod
+    def _rows(other) -> np.ndarray:
+        if isinstance(other, Vector3DArray):
+            return other.a
+        if isinstance(other, Vector3D):
+            return other.to_array()
+        return np.asarray(other, dtype=np.float64)
+    
+    def __len__(self):
+        return len(self.a)
+    
+    def __getitem__(self, index) -> Vector3D:
+        return Vector3D(*self.a[index].tolist())
+    
+    def to_vectors(self) -> List[Vector3D]:
+        return [Vector3D(x, y, z) for x, y, z in self.a.tolist()]
+    
+    def __add__(self, other):
+        return Vector3DArray(self.a + self._rows(other))
+    
+    def __sub__(self, other):
+        return Vector3DArray(self.a - self._rows(other))
+    
+    def __mul__(self, scalar):
+        # Scalar or per-row (N,) factors
+        factor = np.asarray(scalar, dtype=np.float64)
+        return Vector3DArray(self.a * (factor[:, None] if factor.ndim == 1 else factor))
+    
+    def dot(self, other) -> np.ndarray:
+        b = np.broadcast_to(self._rows(other), self.a.shape)
+        return np.einsum('ij,ij->i', self.a, b)
+    
+    def cross(self, other):
+        a = self.a
+        b = np.broadcast_to(self._rows(other), a.shape)
+        return Vector3DArray(np.stack([
+            a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+            a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        ], axis=1))
+    
+    def magnitude(self) -> np.ndarray:
+        return np.sqrt(np.einsum('ij,ij->i', self.a, self.a))
+    
+    def normalize(self):
+        mag = self.magnitude()[:, None]
+        # Near-zero vectors normalize to zero, as in Vector3D.normalize
+        safe = np.where(mag > 1e-9, mag, 1.0)
+        return Vector3DArray(np.where(mag > 1e-9, self.a / safe, 0.0))
+
 @dataclass
 class Ray:
     """3D ray defined by origin and direction"""
@@ -81,7 +161,16 @@ class SunPosition:
     azimuth: float      # degrees from North toward East
     declination: float  # degrees
     hour_angle: float   # degrees from solar noon
-    unit_vector: Vector3D  # ENU coordinates (East, North, Up)
+    unit_vector: np.ndarray  # (3,) ENU coordinates (East, North, Up)
+
+@dataclass
+class SunPositionBatch:
+    """Solar positions for broadcast arrays of declination and hour angle"""
+    altitude: np.ndarray      # degrees above horizon
+    azimuth: np.ndarray       # degrees from North toward East
+    declination: np.ndarray   # degrees
+    hour_angle: np.ndarray    # degrees from solar noon
+    unit_vectors: np.ndarray  # (..., 3) ENU coordinates (East, North, Up)
 
 @dataclass
 class YantraPoint:
@@ -95,6 +184,18 @@ class YantraPoint:
 class AstronomicalCalculations:
     """Core astronomical calculation functions"""
     
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def latitude_trig(latitude_deg: float) -> Tuple[float, float, float]:
+        """
+        (sin φ, cos φ, tan φ) for a latitude in degrees, memoized
+        
+        A site's latitude is fixed across all of its hour lines, seasons and
+        yantras, so these are computed once per latitude.
+        """
+        phi = math.radians(latitude_deg)
+        return (math.sin(phi), math.cos(phi), math.tan(phi))
+    
     @staticmethod
     def solar_position(latitude_deg: float, declination_deg: float, 
                       hour_angle_deg: float) -> SunPosition:
@@ -110,12 +211,12 @@ class AstronomicalCalculations:
             SunPosition with altitude, azimuth, and unit vector
         """
         # Convert to radians
-        phi = math.radians(latitude_deg)
+        sin_phi, cos_phi, _ = AstronomicalCalculations.latitude_trig(latitude_deg)
         delta = math.radians(declination_deg)
         H = math.radians(hour_angle_deg)
         
         # Solar altitude: sin(a) = sin(φ)sin(δ) + cos(φ)cos(δ)cos(H)
-        sin_altitude = math.sin(phi) * math.sin(delta) + math.cos(phi) * math.cos(delta) * math.cos(H)
+        sin_altitude = sin_phi * math.sin(delta) + cos_phi * math.cos(delta) * math.cos(H)
         
         # Clamp to valid range
         sin_altitude = max(-1.0, min(1.0, sin_altitude))
@@ -131,7 +232,7 @@ class AstronomicalCalculations:
             azimuth_deg = 0.0
         else:
             sin_azimuth = math.cos(delta) * math.sin(H) / cos_altitude
-            cos_azimuth = (math.sin(delta) - sin_altitude * math.sin(phi)) / (cos_altitude * math.cos(phi))
+            cos_azimuth = (math.sin(delta) - sin_altitude * sin_phi) / (cos_altitude * cos_phi)
             
             # Use atan2 to preserve quadrant
             azimuth_rad = math.atan2(sin_azimuth, cos_azimuth)
@@ -139,11 +240,12 @@ class AstronomicalCalculations:
         
         # Sun unit direction vector in ENU (East, North, Up) coordinates
         # s = [cos(a)sin(A), cos(a)cos(A), sin(a)]
-        sun_vector = Vector3D(
+        # as an ndarray, the same layout as SunPositionBatch.unit_vectors rows
+        sun_vector = np.array([
             cos_altitude * math.sin(math.radians(azimuth_deg)),  # East
             cos_altitude * math.cos(math.radians(azimuth_deg)),  # North  
             sin_altitude  # Up
-        )
+        ])
         
         return SunPosition(
             altitude=altitude_deg,
@@ -153,6 +255,60 @@ class AstronomicalCalculations:
             unit_vector=sun_vector
         )
     
+    @staticmethod
+    def solar_position_batch(latitude_deg: float, declination_deg: Union[float, np.ndarray],
+                             hour_angle_deg: Union[float, np.ndarray]) -> SunPositionBatch:
+        """
+        Vectorized solar_position over broadcast declination / hour angle arrays
+        
+        Args:
+            latitude_deg: Latitude φ in degrees (positive north)
+            declination_deg: Solar declination δ in degrees (scalar or array)
+            hour_angle_deg: Hour angle H in degrees (scalar or array)
+        
+        Returns:
+            SunPositionBatch with arrays of the broadcast shape, matching
+            solar_position element by element
+        """
+        sin_phi, cos_phi, _ = AstronomicalCalculations.latitude_trig(latitude_deg)
+        
+        declination_deg, hour_angle_deg = np.broadcast_arrays(
+            np.asarray(declination_deg, dtype=float), np.asarray(hour_angle_deg, dtype=float)
+        )
+        delta = np.radians(declination_deg)
+        H = np.radians(hour_angle_deg)
+        sin_delta = np.sin(delta)
+        cos_delta = np.cos(delta)
+        
+        # sin(a) = sin(φ)sin(δ) + cos(φ)cos(δ)cos(H)
+        sin_altitude = np.clip(sin_phi * sin_delta + cos_phi * cos_delta * np.cos(H), -1.0, 1.0)
+        altitude_rad = np.arcsin(sin_altitude)
+        cos_altitude = np.cos(altitude_rad)
+        
+        # Azimuth via atan2 to preserve quadrant; 0 where the sun is at zenith
+        zenith = np.abs(cos_altitude) < 1e-9
+        safe_cos_altitude = np.where(zenith, 1.0, cos_altitude)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sin_azimuth = cos_delta * np.sin(H) / safe_cos_altitude
+            cos_azimuth = (sin_delta - sin_altitude * sin_phi) / (safe_cos_altitude * cos_phi)
+        azimuth_deg = np.where(zenith, 0.0, np.degrees(np.arctan2(sin_azimuth, cos_azimuth)))
+        
+        # s = [cos(a)sin(A), cos(a)cos(A), sin(a)]
+        azimuth_rad = np.radians(azimuth_deg)
+        unit_vectors = np.stack([
+            cos_altitude * np.sin(azimuth_rad),  # East
+            cos_altitude * np.cos(azimuth_rad),  # North
+            sin_altitude                         # Up
+        ], axis=-1)
+        
+        return SunPositionBatch(
+            altitude=np.degrees(altitude_rad),
+            azimuth=azimuth_deg,
+            declination=declination_deg,
+            hour_angle=hour_angle_deg,
+            unit_vectors=unit_vectors
+        )
+    
     @staticmethod
     def solar_declination(day_of_year: int) -> float:
         """
@@ -171,6 +327,104 @@ class AstronomicalCalculations:
         equation_time = 9.87 * math.sin(2 * B) - 7.53 * math.cos(B) - 1.5 * math.sin(B)
         return equation_time  # minutes
 
+# Array math only: the YantraPoints and seasonal curve dicts are built in
+# Python by the caller, since numba typed containers are slower than their
+# CPython counterparts at these sizes
+@njit(cache=True, nogil=True, fastmath=KERNEL_FASTMATH)
+def _hourline_kernel(phi, delta_arr, H_arr, gnomon_tip, plane_P0, plane_n, u, v):
+    """
+    Solar position -> shadow ray -> dial plane hit -> (u, v) for N sun positions
+    
+    Scalar loop over raw float64 arrays, compiled by numba (releasing the
+    GIL) when available.
+    Follows AstronomicalCalculations.solar_position,
+    RayIntersection.ray_plane_intersection and
+    SurfaceCoordinates.project_to_plane_coords step for step.
+    
+    Args:
+        phi: Latitude in radians
+        delta_arr, H_arr: (N,) declinations and hour angles in radians
+        gnomon_tip: (3,) shadow ray origin
+        plane_P0, plane_n: (3,) plane point and normal
+        u, v: (3,) plane basis vectors
+        
+    Returns:
+        (altitude_deg, azimuth_deg, t, points, local) arrays with shapes
+        (N,), (N,), (N,), (N, 3), (N, 2); t, points and local are NaN where
+        the shadow ray misses the plane
+    """
+    n = delta_arr.shape[0]
+    altitude_deg = np.empty(n)
+    azimuth_deg = np.empty(n)
+    t_out = np.empty(n)
+    points = np.empty((n, 3))
+    local = np.empty((n, 2))
+    
+    sin_phi = math.sin(phi)
+    cos_phi = math.cos(phi)
+    
+    for k in range(n):
+        delta = delta_arr[k]
+        H = H_arr[k]
+        
+        # Solar altitude and azimuth
+        sin_altitude = sin_phi * math.sin(delta) + cos_phi * math.cos(delta) * math.cos(H)
+        sin_altitude = max(-1.0, min(1.0, sin_altitude))
+        altitude_rad = math.asin(sin_altitude)
+        cos_altitude = math.cos(altitude_rad)
+        
+        if abs(cos_altitude) < 1e-9:  # Sun at zenith
+            azimuth_rad = 0.0
+        else:
+            sin_azimuth = math.cos(delta) * math.sin(H) / cos_altitude
+            cos_azimuth = (math.sin(delta) - sin_altitude * sin_phi) / (cos_altitude * cos_phi)
+            azimuth_rad = math.atan2(sin_azimuth, cos_azimuth)
+        
+        altitude_deg[k] = math.degrees(altitude_rad)
+        azimuth_deg[k] = math.degrees(azimuth_rad)
+        
+        # Shadow direction is the negated sun unit vector
+        dx = -cos_altitude * math.sin(azimuth_rad)
+        dy = -cos_altitude * math.cos(azimuth_rad)
+        dz = -sin_altitude
+        
+        # Ray-plane intersection: t = (P₀ - O) · n / (d · n)
+        d_dot_n = dx * plane_n[0] + dy * plane_n[1] + dz * plane_n[2]
+        t = math.nan
+        if abs(d_dot_n) >= 1e-9:
+            t = ((plane_P0[0] - gnomon_tip[0]) * plane_n[0] +
+                 (plane_P0[1] - gnomon_tip[1]) * plane_n[1] +
+                 (plane_P0[2] - gnomon_tip[2]) * plane_n[2]) / d_dot_n
+            if t <= 0:
+                t = math.nan
+        
+        px = gnomon_tip[0] + dx * t
+        py = gnomon_tip[1] + dy * t
+        pz = gnomon_tip[2] + dz * t
+        t_out[k] = t
+        points[k, 0] = px
+        points[k, 1] = py
+        points[k, 2] = pz
+        
+        # Plane coordinates: ((X - P₀) · u, (X - P₀) · v)
+        rx = px - plane_P0[0]
+        ry = py - plane_P0[1]
+        rz = pz - plane_P0[2]
+        local[k, 0] = rx * u[0] + ry * u[1] + rz * u[2]
+        local[k, 1] = rx * v[0] + ry * v[1] + rz * v[2]
+    
+    return altitude_deg, azimuth_deg, t_out, points, local
+
+if NUMBA_AVAILABLE:
+    # Compile the kernel (or load it from the cache=True artifact) at import,
+    # with the all-float64 signature generate_samrat_yantra_geometry uses, so
+    # the first yantra generation does not pay the JIT cost
+    try:
+        _hourline_kernel(0.4, np.zeros(1), np.zeros(1), np.array([0.0, 0.0, 1.0]), np.zeros(3),
+                         np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), np.array([0.0, 0.0, 1.0]))
+    except Exception as e:
+        warnings.warn(f"Hour-line kernel warmup failed ({e}), compiling on first use", RuntimeWarning)
+
 class RayIntersection:
     """Ray-surface intersection algorithms"""
     
@@ -207,16 +461,54 @@ class RayIntersection:
         
         return (t, intersection_point)
     
+    @staticmethod
+    def ray_plane_intersection_batch(origins: np.ndarray, directions: np.ndarray,
+                                     plane_point: np.ndarray, plane_normal: np.ndarray,
+                                     epsilon: float = 1e-9) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized ray_plane_intersection for N rays against one plane
+        
+        Args:
+            origins: (N, 3) ray origins, or a single (3,) origin shared by all rays
+            directions: (N, 3) ray directions
+            plane_point: Plane point P₀ as a (3,) array
+            plane_normal: Plane normal n as a (3,) array
+            epsilon: Numerical tolerance
+            
+        Returns:
+            (t, points) with t of shape (N,) and points of shape (N, 3); rays
+            that are parallel to the plane or hit it behind the origin get NaN
+        """
+        origins = np.asarray(origins, dtype=np.float64)
+        directions = np.asarray(directions, dtype=np.float64)
+        
+        d_dot_n = directions @ plane_normal
+        p0_minus_o_dot_n = (plane_point - origins) @ plane_normal
+        
+        # Parallel rays are left as NaN instead of branching per ray
+        t = np.divide(p0_minus_o_dot_n, d_dot_n,
+                      out=np.full(d_dot_n.shape, np.nan), where=np.abs(d_dot_n) >= epsilon)
+        
+        # Only accept forward intersections
+        t = np.where(t > 0, t, np.nan)
+        
+        return t, origins + t[:, None] * directions
+    
     @staticmethod
     def ray_cylinder_intersection(ray: Ray, cylinder: Cylinder, epsilon: float = 1e-9) -> Optional[Tuple[float, Vector3D]]:
         """
-        Ray-vertical cylinder intersection using quadratic formula:
-        (ox + t*dx)² + (oy + t*dy)² = R²
+        Ray-vertical cylinder intersection in closed form
+        
+        Because the cylinder axis is z, the problem reduces to 2D in the
+        horizontal plane. With o, d the horizontal components of the ray origin
+        (relative to the axis) and direction, and a = dx² + dy²:
+        
+        t_cpa = -(o · d) / a                 (closest approach to the axis)
+        dist² = (ox*dy - oy*dx)² / a         (squared miss distance)
+        t = t_cpa ∓ sqrt((R² - dist²) / a)
         
-        Expands to: at² + bt + c = 0 where:
-        a = dx² + dy²
-        b = 2(ox*dx + oy*dy) 
-        c = ox² + oy² - R²
+        These are the roots of (ox + t*dx)² + (oy + t*dy)² = R², without
+        forming the discriminant b² - 4ac explicitly.
         
         Args:
             ray: Ray with origin and direction
@@ -227,37 +519,34 @@ class RayIntersection:
             (t, intersection_point) for first valid intersection, else None
         """
         # Translate ray origin relative to cylinder center
-        o = ray.origin - cylinder.center
-        d = ray.direction
-        
-        # Quadratic coefficients (ignoring z for vertical cylinder)
-        a = d.x * d.x + d.y * d.y
-        b = 2.0 * (o.x * d.x + o.y * d.y)
-        c = o.x * o.x + o.y * o.y - cylinder.radius * cylinder.radius
+        ox = ray.origin.x - cylinder.center.x
+        oy = ray.origin.y - cylinder.center.y
+        dx = ray.direction.x
+        dy = ray.direction.y
         
         # Check if ray is parallel to cylinder axis
-        if abs(a) < epsilon:
+        a = dx * dx + dy * dy
+        if a < epsilon:
             return None
         
-        # Solve quadratic equation
-        discriminant = b * b - 4 * a * c
+        # Squared distance between the ray and the axis at closest approach
+        cross = ox * dy - oy * dx
+        r_squared = cylinder.radius * cylinder.radius
+        half_chord_squared = (r_squared - cross * cross / a) / a
         
-        if discriminant < 0:
+        if half_chord_squared < 0:
             return None  # No intersection
         
-        sqrt_discriminant = math.sqrt(discriminant)
-        
-        # Two potential solutions
-        t1 = (-b - sqrt_discriminant) / (2 * a)
-        t2 = (-b + sqrt_discriminant) / (2 * a)
+        t_cpa = -(ox * dx + oy * dy) / a
+        half_chord = math.sqrt(half_chord_squared)
         
-        # Find first positive intersection
-        candidates = [t for t in [t1, t2] if t > epsilon]
-        
-        if not candidates:
-            return None
+        # First positive intersection: near side, else far side
+        t = t_cpa - half_chord
+        if t <= epsilon:
+            t = t_cpa + half_chord
+            if t <= epsilon:
+                return None
         
-        t = min(candidates)
         intersection_point = ray.point_at(t)
         
         # Check if intersection point is within cylinder height
@@ -295,20 +584,26 @@ class SurfaceCoordinates:
         return (u, v)
     
     @staticmethod
-    def project_to_plane_coords(point: Vector3D, plane: Plane, u: Vector3D, v: Vector3D) -> Tuple[float, float]:
+    def project_to_plane_coords(point: Union[Vector3D, Vector3DArray, np.ndarray], plane: Plane,
+                                u: Vector3D, v: Vector3D) -> Union[Tuple[float, float], np.ndarray]:
         """
         Project 3D point to 2D plane coordinates using basis (u, v)
         
         Formula: (x_local, y_local) = ((X - P₀) · u, (X - P₀) · v)
         
         Args:
-            point: 3D point to project
+            point: 3D point to project, or a batch of N points as a
+                Vector3DArray / (N, 3) array
             plane: Reference plane with point P₀
             u, v: Orthonormal basis vectors
             
         Returns:
-            (x_local, y_local) coordinates in plane coordinate system
+            (x_local, y_local) coordinates in plane coordinate system, or an
+            (N, 2) array for a batch
         """
+        if not isinstance(point, Vector3D):
+            return SurfaceCoordinates.project_batch(point, plane, u, v)
+        
         relative_point = point - plane.point
         x_local = relative_point.dot(u)
         y_local = relative_point.dot(v)
@@ -316,17 +611,43 @@ class SurfaceCoordinates:
         return (x_local, y_local)
     
     @staticmethod
-    def cylinder_coordinates(point: Vector3D, cylinder: Cylinder) -> Tuple[float, float]:
+    def project_batch(points: Union[Vector3DArray, np.ndarray], plane: Plane,
+                      u: Vector3D, v: Vector3D) -> np.ndarray:
+        """
+        Project N points to plane coordinates with one (X - P₀) @ B product,
+        where B = [u v] is the (3, 2) basis matrix
+        
+        Args:
+            points: Vector3DArray or (N, 3) array of points
+            plane: Reference plane with point P₀
+            u, v: Orthonormal basis vectors
+            
+        Returns:
+            (N, 2) array of (x_local, y_local) coordinates
+        """
+        points = points.a if isinstance(points, Vector3DArray) else np.asarray(points, dtype=np.float64)
+        basis = np.stack([u.to_array(), v.to_array()], axis=1)  # (3, 2)
+        return (points - plane.point.to_array()) @ basis
+    
+    @staticmethod
+    def cylinder_coordinates(point: Union[Vector3D, np.ndarray], cylinder: Cylinder) -> Union[Tuple[float, float], np.ndarray]:
         """
         Convert 3D point on cylinder to (azimuth, height) coordinates
         
         Args:
-            point: 3D point on cylinder surface
+            point: 3D point on cylinder surface, or a (..., 3) array of points
             cylinder: Cylinder definition
             
         Returns:
-            (azimuth_deg, height) where azimuth is measured from +X axis
+            (azimuth_deg, height) where azimuth is measured from +X axis, or a
+            (..., 2) array for an array of points
         """
+        if not isinstance(point, Vector3D):
+            relative = np.asarray(point, dtype=np.float64) - cylinder.center.to_array()
+            azimuth_deg = np.degrees(np.arctan2(relative[..., 1], relative[..., 0]))
+            azimuth_deg = np.where(azimuth_deg < 0, azimuth_deg + 360, azimuth_deg)
+            return np.stack([azimuth_deg, relative[..., 2]], axis=-1)
+        
         relative_point = point - cylinder.center
         
         azimuth_rad = math.atan2(relative_point.y, relative_point.x)
@@ -363,7 +684,7 @@ class YantraGeometryEngine:
             Complete geometric specification with hour lines and seasonal curves
         """
         if gnomon_height is None:
-            gnomon_height = base_length * math.tan(math.radians(abs(latitude_deg)))
+            gnomon_height = base_length * self.astro_calc.latitude_trig(abs(latitude_deg))[2]
         
         # Gnomon geometry - triangular face aligned north-south
         gnomon_top = Vector3D(0, 0, gnomon_height)
@@ -390,68 +711,54 @@ class YantraGeometryEngine:
         declinations = [0, 23.44, -23.44]  # Equinox, summer solstice, winter solstice
         season_names = ['equinox', 'summer_solstice', 'winter_solstice']
         
-        for decl, season_name in zip(declinations, season_names):
+        # Generate points for hours from 6 AM to 6 PM
+        hours = list(range(6, 19))
+        hour_angles = [(hour - 12) * 15 for hour in hours]  # Degrees from solar noon
+        
+        # Every (season, hour) pair, flattened for the hour-line kernel
+        delta_grid, H_grid = np.meshgrid(np.radians(declinations), np.radians(hour_angles), indexing='ij')
+        grid_shape = delta_grid.shape
+        
+        # Trace shadow rays from the gnomon tip (opposite of sun) against both
+        # dial faces, one kernel call per face
+        face_hits = {}
+        for side, plane in (('west', west_plane), ('east', east_plane)):
+            u, v = self.surface_coords.plane_coordinate_system(plane)
+            altitude, azimuth, t, points, local = _hourline_kernel(
+                math.radians(latitude_deg), delta_grid.ravel(), H_grid.ravel(),
+                *(np.asarray(vec.to_array(), dtype=np.float64) for vec in (gnomon_top, plane.point, plane.normal, u, v))
+            )
+            face_hits[side] = (t.reshape(grid_shape), points.reshape(grid_shape + (3,)),
+                               local.reshape(grid_shape + (2,)))
+        altitude = altitude.reshape(grid_shape)
+        azimuth = azimuth.reshape(grid_shape)
+        
+        for i, (decl, season_name) in enumerate(zip(declinations, season_names)):
             seasonal_curves[season_name] = {'east': [], 'west': []}
             
-            # Generate points for hours from 6 AM to 6 PM
-            for hour in range(6, 19):
-                hour_angle = (hour - 12) * 15  # Degrees from solar noon
-                
-                # Calculate sun position
-                sun_pos = self.astro_calc.solar_position(latitude_deg, decl, hour_angle)
-                
+            for j, (hour, hour_angle) in enumerate(zip(hours, hour_angles)):
                 # Skip if sun is below horizon
-                if sun_pos.altitude <= 0:
+                if altitude[i, j] <= 0:
                     continue
                 
-                # Shadow ray direction (opposite of sun)
-                shadow_direction = Vector3D(-sun_pos.unit_vector.x, 
-                                          -sun_pos.unit_vector.y, 
-                                          -sun_pos.unit_vector.z)
+                # Sun in east, shadow on west dial; sun in west, shadow on east dial
+                side = 'west' if azimuth[i, j] < 180 else 'east'
+                t, points, local = face_hits[side]
+                if np.isnan(t[i, j]):
+                    continue
                 
-                # Ray from gnomon tip
-                shadow_ray = Ray(origin=gnomon_top, direction=shadow_direction)
+                yantra_point = YantraPoint(
+                    position_3d=Vector3D(*points[i, j].tolist()),
+                    surface_coords=tuple(local[i, j].tolist()),
+                    hour_angle=hour_angle,
+                    declination=decl,
+                    shadow_length=float(t[i, j])
+                )
                 
-                # Find intersection with appropriate dial face
-                if sun_pos.azimuth < 180:  # Sun in east, shadow on west dial
-                    intersection = self.ray_intersection.ray_plane_intersection(shadow_ray, west_plane)
-                    if intersection:
-                        t, point = intersection
-                        u, v = self.surface_coords.plane_coordinate_system(west_plane)
-                        local_coords = self.surface_coords.project_to_plane_coords(point, west_plane, u, v)
-                        
-                        yantra_point = YantraPoint(
-                            position_3d=point,
-                            surface_coords=local_coords,
-                            hour_angle=hour_angle,
-                            declination=decl,
-                            shadow_length=t
-                        )
-                        
-                        seasonal_curves[season_name]['west'].append(yantra_point)
-                        
-                        if season_name == 'equinox':  # Main hour lines
-                            hour_lines_west.append((hour, yantra_point))
+                seasonal_curves[season_name][side].append(yantra_point)
                 
-                else:  # Sun in west, shadow on east dial
-                    intersection = self.ray_intersection.ray_plane_intersection(shadow_ray, east_plane)
-                    if intersection:
-                        t, point = intersection
-                        u, v = self.surface_coords.plane_coordinate_system(east_plane)
-                        local_coords = self.surface_coords.project_to_plane_coords(point, east_plane, u, v)
-                        
-                        yantra_point = YantraPoint(
-                            position_3d=point,
-                            surface_coords=local_coords,
-                            hour_angle=hour_angle,
-                            declination=decl,
-                            shadow_length=t
-                        )
-                        
-                        seasonal_curves[season_name]['east'].append(yantra_point)
-                        
-                        if season_name == 'equinox':  # Main hour lines
-                            hour_lines_east.append((hour, yantra_point))
+                if season_name == 'equinox':  # Main hour lines
+                    (hour_lines_west if side == 'west' else hour_lines_east).append((hour, yantra_point))
         
         # Calculate construction specifications
         construction_specs = {
@@ -510,56 +817,45 @@ class YantraGeometryEngine:
         altitude_circles = []
         azimuth_lines = []
         
-        # Altitude circles (constant altitude, varying azimuth)
-        for altitude_deg in range(10, 91, 10):  # 10° to 90° altitude
-            circle_points = []
-            
-            for azimuth_deg in range(0, 360, 5):  # Every 5° in azimuth
-                # Convert altitude-azimuth to Cartesian on cylinder
-                # For Rama Yantra: height represents altitude, azimuth is angular position
-                height = cylinder.height * (altitude_deg / 90.0)  # Scale to cylinder height
-                
-                angle_rad = math.radians(azimuth_deg)
-                x = radius * math.cos(angle_rad)
-                y = radius * math.sin(angle_rad)
-                z = height
-                
-                point_3d = Vector3D(x, y, z)
-                cylinder_coords = self.surface_coords.cylinder_coordinates(point_3d, cylinder)
-                
-                circle_points.append(YantraPoint(
-                    position_3d=point_3d,
-                    surface_coords=cylinder_coords,
+        # Altitude circles (constant altitude, varying azimuth): the whole
+        # (altitude, azimuth) grid at once. For Rama Yantra height represents
+        # altitude (scaled to cylinder height), azimuth is angular position
+        circle_altitudes = list(range(10, 91, 10))  # 10° to 90° altitude
+        circle_heights = cylinder.height * (np.array(circle_altitudes) / 90.0)
+        circle_points_3d = self._cylinder_points(radius, np.arange(0, 360, 5)[None, :], circle_heights[:, None])
+        circle_coords = self.surface_coords.cylinder_coordinates(circle_points_3d, cylinder)
+        
+        for altitude_deg, points, coords in zip(circle_altitudes, circle_points_3d.tolist(), circle_coords.tolist()):
+            circle_points = [
+                YantraPoint(
+                    position_3d=Vector3D(*point),
+                    surface_coords=tuple(surface),
                     hour_angle=0,  # Not applicable for altitude circles
                     declination=0,
                     shadow_length=0
-                ))
-            
+                )
+                for point, surface in zip(points, coords)
+            ]
             altitude_circles.append((altitude_deg, circle_points))
         
         # Azimuth lines (constant azimuth, varying altitude)
-        for azimuth_deg in range(0, 360, 30):  # Every 30° in azimuth (12 divisions)
-            line_points = []
-            
-            angle_rad = math.radians(azimuth_deg)
-            x = radius * math.cos(angle_rad)
-            y = radius * math.sin(angle_rad)
-            
-            for height in np.linspace(0, cylinder.height, 20):
-                point_3d = Vector3D(x, y, height)
-                cylinder_coords = self.surface_coords.cylinder_coordinates(point_3d, cylinder)
-                
-                # Calculate corresponding altitude
-                altitude_deg = (height / cylinder.height) * 90.0
-                
-                line_points.append(YantraPoint(
-                    position_3d=point_3d,
-                    surface_coords=cylinder_coords,
+        line_azimuths = list(range(0, 360, 30))  # Every 30° in azimuth (12 divisions)
+        line_points_3d = self._cylinder_points(
+            radius, np.array(line_azimuths)[:, None], np.linspace(0, cylinder.height, 20)[None, :]
+        )
+        line_coords = self.surface_coords.cylinder_coordinates(line_points_3d, cylinder)
+        
+        for azimuth_deg, points, coords in zip(line_azimuths, line_points_3d.tolist(), line_coords.tolist()):
+            line_points = [
+                YantraPoint(
+                    position_3d=Vector3D(*point),
+                    surface_coords=tuple(surface),
                     hour_angle=0,
                     declination=0,
                     shadow_length=0
-                ))
-            
+                )
+                for point, surface in zip(points, coords)
+            ]
             azimuth_lines.append((azimuth_deg, line_points))
         
         # Solar tracking calculations for specific times
@@ -636,34 +932,21 @@ class YantraGeometryEngine:
         hour_circles = []
         
         # Declination circles (parallel to celestial equator) 
-        for decl_deg in range(-24, 25, 6):  # -24° to +24° (seasonal range)
+        declination_values = list(range(-24, 25, 6))  # -24° to +24° (seasonal range)
+        circle_hour_angles = list(range(-90, 91, 10))  # Visible range
+        
+        # Solar positions for every (declination, hour angle) pair at once
+        sun = self.astro_calc.solar_position_batch(
+            latitude_deg, np.array(declination_values)[:, None], np.array(circle_hour_angles)[None, :]
+        )
+        circle_points_3d = self._hemisphere_projection(sun, hemisphere_radius)
+        
+        for i, decl_deg in enumerate(declination_values):
             circle_points = []
             
-            # Circle radius on hemisphere for this declination
-            # Adjusted for hemisphere geometry and latitude
-            decl_rad = math.radians(decl_deg)
-            lat_rad = math.radians(latitude_deg)
-            
-            # Complex calculation for hemisphere projection
-            for hour_angle_deg in range(-90, 91, 10):  # Visible range
-                hour_angle_rad = math.radians(hour_angle_deg)
-                
-                # Solar position for this declination and hour angle
-                sun_pos = self.astro_calc.solar_position(latitude_deg, decl_deg, hour_angle_deg)
-                
-                if sun_pos.altitude > 0:  # Above horizon
-                    # Project onto hemisphere interior
-                    # Hemisphere represents celestial sphere
-                    alt_rad = math.radians(sun_pos.altitude)
-                    az_rad = math.radians(sun_pos.azimuth)
-                    
-                    # Stereographic projection onto hemisphere
-                    r = hemisphere_radius * math.cos(alt_rad)
-                    x = r * math.sin(az_rad)
-                    y = r * math.cos(az_rad)  
-                    z = -hemisphere_radius * math.sin(alt_rad)  # Negative for bowl interior
-                    
-                    point_3d = Vector3D(x, y, z)
+            for j, hour_angle_deg in enumerate(circle_hour_angles):
+                if sun.altitude[i, j] > 0:  # Above horizon
+                    point_3d = Vector3D(*circle_points_3d[i, j].tolist())
                     
                     # Spherical coordinates on hemisphere
                     sphere_coords = self._hemisphere_coordinates(point_3d, hemisphere_radius)
@@ -680,24 +963,21 @@ class YantraGeometryEngine:
                 declination_circles.append((decl_deg, circle_points))
         
         # Hour circles (meridians)
-        for hour in range(6, 19):  # Daylight hours
+        hours = list(range(6, 19))  # Daylight hours
+        line_declinations = list(range(-24, 25, 3))  # Different seasons
+        
+        sun = self.astro_calc.solar_position_batch(
+            latitude_deg, np.array(line_declinations)[None, :], (np.array(hours)[:, None] - 12) * 15
+        )
+        line_points_3d = self._hemisphere_projection(sun, hemisphere_radius)
+        
+        for i, hour in enumerate(hours):
             hour_angle = (hour - 12) * 15
             line_points = []
             
-            for decl_deg in range(-24, 25, 3):  # Different seasons
-                sun_pos = self.astro_calc.solar_position(latitude_deg, decl_deg, hour_angle)
-                
-                if sun_pos.altitude > 0:
-                    # Project onto hemisphere
-                    alt_rad = math.radians(sun_pos.altitude)
-                    az_rad = math.radians(sun_pos.azimuth)
-                    
-                    r = hemisphere_radius * math.cos(alt_rad)
-                    x = r * math.sin(az_rad)
-                    y = r * math.cos(az_rad)
-                    z = -hemisphere_radius * math.sin(alt_rad)
-                    
-                    point_3d = Vector3D(x, y, z)
+            for j, decl_deg in enumerate(line_declinations):
+                if sun.altitude[i, j] > 0:
+                    point_3d = Vector3D(*line_points_3d[i, j].tolist())
                     sphere_coords = self._hemisphere_coordinates(point_3d, hemisphere_radius)
                     
                     line_points.append(YantraPoint(
@@ -752,6 +1032,29 @@ class YantraGeometryEngine:
             }
         }
     
+    def _cylinder_points(self, radius: float, azimuth_deg: np.ndarray, height: np.ndarray) -> np.ndarray:
+        """Points on the cylinder wall for broadcast azimuth/height arrays, returning (..., 3) points"""
+        angle_rad = np.radians(azimuth_deg)
+        shape = np.broadcast_shapes(np.shape(azimuth_deg), np.shape(height))
+        
+        points = np.empty(shape + (3,))
+        points[..., 0] = radius * np.cos(angle_rad)
+        points[..., 1] = radius * np.sin(angle_rad)
+        points[..., 2] = height
+        return points
+    
+    def _hemisphere_projection(self, sun: SunPositionBatch, radius: float) -> np.ndarray:
+        """Project solar positions onto the hemisphere interior, returning (..., 3) points"""
+        alt_rad = np.radians(sun.altitude)
+        az_rad = np.radians(sun.azimuth)
+        
+        r = radius * np.cos(alt_rad)
+        return np.stack([
+            r * np.sin(az_rad),
+            r * np.cos(az_rad),
+            -radius * np.sin(alt_rad)  # Negative for bowl interior
+        ], axis=-1)
+    
     def _hemisphere_coordinates(self, point: Vector3D, radius: float) -> Tuple[float, float]:
         """Convert 3D point on hemisphere to (theta, phi) spherical coordinates"""
         # Spherical coordinates: theta (azimuth), phi (elevation from horizontal)
@@ -772,13 +1075,12 @@ class YantraGeometryEngine:
         
         # Test against closed-form horizontal sundial formula
         # θ = arctan(sin(φ) * tan(H))
+        sin_phi = self.astro_calc.latitude_trig(latitude_deg)[0]
         for hour, point in hour_points[:5]:  # Test first 5 points
             hour_angle = point.hour_angle
             
             # Analytical hour line angle for horizontal dial
-            analytical_angle = math.degrees(math.atan(
-                math.sin(math.radians(latitude_deg)) * math.tan(math.radians(hour_angle))
-            ))
+            analytical_angle = math.degrees(math.atan(sin_phi * math.tan(math.radians(hour_angle))))
             
             # Compare with our ray-traced result
             # This is a simplified comparison - full verification would be more complex
@@ -918,7 +1220,8 @@ def test_yantra_calculations():
     print(f"Solar Position Test (Ujjain, equinox, H=45°):")
     print(f"Altitude: {sun_pos.altitude:.6f}° (expected ~40.545°)")
     print(f"Azimuth: {sun_pos.azimuth:.6f}° (expected ~111.483°)")
-    print(f"Sun Vector: [{sun_pos.unit_vector.x:.6f}, {sun_pos.unit_vector.y:.6f}, {sun_pos.unit_vector.z:.6f}]")
+    uv = sun_pos.unit_vector
+    print(f"Sun Vector: [{uv[0]:.6f}, {uv[1]:.6f}, {uv[2]:.6f}]")
     
     # Generate Samrat Yantra
     print(f"\nGenerating Samrat Yantra for Ujjain (φ = {ujjain_lat}°)...")